@@ -1,17 +1,14 @@
 # One-off helper: verify all LESSONS dicts have 15–20 rows per chapter.
 # Run: python _expand_urdu_s3.py
 
-import importlib.util
-import pathlib
+from bank_registry import BankRegistry
 
-BASE = pathlib.Path(__file__).parent
 MIN_R, MAX_R = 15, 20
+REGISTRY = BankRegistry()
+
 
 def load(name):
-    spec = importlib.util.spec_from_file_location(name, BASE / f"{name}.py")
-    m = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(m)
-    for k, v in vars(m).items():
+    for k, v in REGISTRY.load(name).items():
         if k.startswith("LESSONS") and isinstance(v, dict):
             return v
     return None
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Add Telugu vocabulary and conversation practice chapters to data_telugu.json"""
-import json
+
+from bb_io import load_lessons, save_lessons
 
 # New chapters 798-850 (some replace existing, most are new)
 NEW_CHAPTERS = [
@@ -227,8 +228,7 @@ CONV_CHAPTERS = [
 ]
 
 def main():
-    with open("data_telugu.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons("data_telugu.json")
     
     # Find index of first vocab chapter (798)
     idx_798 = next(i for i, ch in enumerate(data) if ch.get("id") == 798)
@@ -252,8 +252,7 @@ def main():
     for ch in reversed(new_chapters):
         data.insert(idx_insert, ch)
     
-    with open("data_telugu.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_lessons("data_telugu.json", data)
     
     print("Added", len(new_chapters), "chapters to data_telugu.json")
 
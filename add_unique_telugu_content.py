@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Add 15 unique topic-specific sentences per chapter 765-797 based on web search."""
-import json
+
+from bb_io import load_lessons, save_lessons
 
 PATH = "data_telugu.json"
 
@@ -570,8 +571,7 @@ CONTENT = {
 }
 
 # Apply updates to data_telugu.json
-with open(PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
+data = load_lessons(PATH)
 
 for ch in data:
     cid = ch.get("id")
@@ -580,8 +580,7 @@ for ch in data:
             ch["tables"][0]["rows"] = CONTENT[cid]
         ch["intro"] = "Practice topic-specific Telugu sentences with English and transliteration."
 
-with open(PATH, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+save_lessons(PATH, data)
 
 print(f"Updated {len(CONTENT)} chapters (765-797) with 15 unique sentences each.")
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Add at least 15 example sentences to each vocabulary sublesson (chapters 798-824)"""
-import json
+
+from bb_io import load_lessons, save_lessons
 
 # Example sentences for each chapter - [English, Telugu, Transliteration]
 SENTENCES = {
@@ -466,8 +467,7 @@ SENTENCES = {
 }
 
 def main():
-    with open("data_telugu.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons("data_telugu.json")
 
     for chapter in data:
         cid = chapter.get("id")
@@ -492,8 +492,7 @@ def main():
             tables.append(sent_table)
         chapter["tables"] = tables
 
-    with open("data_telugu.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_lessons("data_telugu.json", data)
 
     print(f"Added/updated example sentences for {len(SENTENCES)} chapters (798-824)")
 
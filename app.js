@@ -6616,8 +6616,15 @@ const OFFLINE_STORAGE_KEY = 'offlineModeEnabled';
 const OFFLINE_CACHE_PREFIX = 'offline_lessons_';
 /** Bump when any data_*.json content is meaningfully updated so browsers and offline cache pick up new rows. */
 const LESSONS_DATA_REVISION = '2026-04-15-lessons-data-v17-hindi-standard-phrasing';
+/**
+ * Set by build_assets.py in dist/ builds, where every data/script file has a content-hashed
+ * name: files are then fetched through the normal HTTP cache and the revision wipe above is
+ * skipped (a changed language gets a new file name; unchanged ones keep their cache).
+ */
+const ASSET_BUILD = '';
 
 function invalidateStaleLessonCaches() {
+  if (ASSET_BUILD) return;
   try {
     const key = 'lessons_data_revision';
     if (localStorage.getItem(key) === LESSONS_DATA_REVISION) return;
@@ -6642,6 +6649,7 @@ function toggleOffline() {
   const t = document.getElementById('offline-toggle');
   if (t) t.className = 'toggle' + (offlineEnabled ? '' : ' off');
   showToast(offlineEnabled ? 'Offline mode enabled' : 'Offline mode disabled');
+  if (offlineEnabled && chaptersLoaded) prefetchAllChaptersForOffline();
 }
 
 function getOfflineCacheKey() {
@@ -7230,17 +7238,36 @@ async function loadChapters() {
 
   try {
     invalidateStaleLessonCaches();
-    const fetchOpts = { cache: 'no-store' };
-    const [chaptersRes, structureRes] = await Promise.all([
-      fetch(dataFile, fetchOpts),
+    const fetchOpts = ASSET_BUILD ? {} : { cache: 'no-store' };
+    const manifestFile = lang.shardManifest || lessonShardBase(dataFile) + 'manifest.json';
+    const shardBase = manifestFile.slice(0, manifestFile.lastIndexOf('/') + 1);
+    const [manifestRes, structureRes] = await Promise.all([
+      fetch(manifestFile, fetchOpts).catch(() => null),
       fetch(structureFile, fetchOpts)
     ]);
-    if (!chaptersRes.ok) throw new Error(dataFile + ' not found');
     if (!structureRes.ok) throw new Error(structureFile + ' not found');
-    const data = await chaptersRes.json();
+    let data;
+    if (manifestRes && manifestRes.ok) {
+      // Sharded: titles now, chapter bodies on demand (see ensureChapterLoaded).
+      const manifest = await manifestRes.json();
+      data = chaptersFromManifest(manifest, shardBase, cached && cached.data);
+    } else {
+      // Binary lesson pack (lesson_pack.py / lesson_pack.js) when the build provides one.
+      const packRes = lang.packFile && typeof LessonPack !== 'undefined'
+        ? await fetch(lang.packFile, fetchOpts).catch(() => null)
+        : null;
+      if (packRes && packRes.ok) {
+        data = new LessonPack(await packRes.arrayBuffer()).chapters();
+      } else {
+        const chaptersRes = await fetch(dataFile, fetchOpts);
+        if (!chaptersRes.ok) throw new Error(dataFile + ' not found');
+        data = await chaptersRes.json();
+      }
+    }
     const structure = await structureRes.json();
     applyChaptersData(data, structure);
     saveLessonsToCache(data, structure);
+    prefetchAllChaptersForOffline();
   } catch (e) {
     if (cached && cached.data && cached.structure) {
       applyChaptersData(cached.data, cached.structure);
@@ -7297,9 +7324,121 @@ function getChapterTitle(ch) {
   return titleFromLessonUrl(ch.url);
 }
 
+// ===== LESSON SHARDS (shard_lessons.py: lessons/<data file>/manifest.json + one file per chapter;
+// dist/ builds point LANGUAGES[*].shardManifest at a hashed manifest name) =====
+const LESSON_SHARD_DIR = 'lessons/';
+const chapterShardRequests = {};
+const allChapterRequests = {};
+
+function lessonShardBase(dataFile) {
+  return LESSON_SHARD_DIR + String(dataFile).replace(/\.json$/, '') + '/';
+}
+
+/** Chapter stubs from a manifest; bodies already cached for the same shard file are kept. */
+function chaptersFromManifest(manifest, shardBase, cachedChapters) {
+  const cachedById = {};
+  (cachedChapters || []).forEach(ch => { if (ch && ch.shardLoaded) cachedById[ch.id] = ch; });
+  return (manifest.chapters || []).map(entry => {
+    const prev = cachedById[entry.id];
+    if (prev && prev.shardLoaded === entry.file) return prev;
+    const stub = { id: entry.id, title: entry.title, shard: shardBase + entry.file, shardFile: entry.file };
+    if (entry.url) stub.url = entry.url;
+    return stub;
+  });
+}
+
+/** Fetch a chapter's shard once (concurrent callers share the request). */
+function ensureChapterLoaded(chapterId) {
+  const ch = chaptersById[chapterId];
+  if (!ch || !ch.shard || ch.shardLoaded) return Promise.resolve(ch);
+  const lang = selectedLanguage;
+  if (!chapterShardRequests[ch.shard]) {
+    chapterShardRequests[ch.shard] = fetch(ch.shard)
+      .then(res => {
+        if (!res.ok) throw new Error('Lesson ' + chapterId + ' not found');
+        return res.json();
+      })
+      .then(body => {
+        Object.assign(ch, body, { shardLoaded: ch.shardFile });
+        if (lang === selectedLanguage) saveLessonsToCache(allChapters, lessonsStructure);
+        return ch;
+      })
+      .finally(() => { delete chapterShardRequests[ch.shard]; });
+  }
+  return chapterShardRequests[ch.shard];
+}
+
+/** Fill every chapter stub still without a body from the whole data file (one request):
+ *  offline mode caches every lesson, and the lesson-list search matches chapter text. */
+function ensureAllChaptersLoaded() {
+  const lang = selectedLanguage;
+  if (!allChapters.some(ch => ch && ch.shard && !ch.shardLoaded)) return Promise.resolve(allChapters);
+  if (!allChapterRequests[lang]) {
+    const dataFile = getLang().dataFile || 'data.json';
+    allChapterRequests[lang] = fetch(dataFile, ASSET_BUILD ? {} : { cache: 'no-store' })
+      .then(res => {
+        if (!res.ok) throw new Error(dataFile + ' not found');
+        return res.json();
+      })
+      .then(chapters => {
+        if (lang !== selectedLanguage) return allChapters;
+        chapters.forEach(body => {
+          const ch = chaptersById[body.id];
+          if (ch && ch.shard && !ch.shardLoaded) Object.assign(ch, body, { shardLoaded: ch.shardFile });
+        });
+        saveLessonsToCache(allChapters, lessonsStructure);
+        return allChapters;
+      })
+      .finally(() => { delete allChapterRequests[lang]; });
+  }
+  return allChapterRequests[lang];
+}
+
+/** With offline mode on, load every chapter in the background once the list is shown. */
+function prefetchAllChaptersForOffline() {
+  if (!offlineEnabled || !allChapters.some(ch => ch && ch.shard && !ch.shardLoaded)) return;
+  const run = () => ensureAllChaptersLoaded().catch(e => console.warn('Offline prefetch failed', e));
+  if (typeof requestIdleCallback === 'function') requestIdleCallback(run);
+  else setTimeout(run, 200);
+}
+
+/** Warm the next sublesson in lessons_structure order so "next" opens instantly. */
+function prefetchNextChapter(chapterId) {
+  if (!lessonsStructure || !lessonsStructure.majorLessons) return;
+  const ids = [];
+  lessonsStructure.majorLessons.forEach(m => (m.sublessons || []).forEach(s => {
+    if (s.chapterId != null) ids.push(s.chapterId);
+  }));
+  const i = ids.indexOf(chapterId);
+  const next = i >= 0 ? chaptersById[ids[i + 1]] : null;
+  if (!next || !next.shard || next.shardLoaded) return;
+  const run = () => ensureChapterLoaded(next.id).catch(() => { /* fetched again on open */ });
+  if (typeof requestIdleCallback === 'function') requestIdleCallback(run);
+  else setTimeout(run, 200);
+}
+
+function showChapterLoadError(message) {
+  const loading = document.getElementById('chapter-detail-loading');
+  loading.innerHTML = '<div style="font-weight:800;color:var(--text);margin-bottom:6px;">' + message + '</div>' +
+    '<div style="font-size:12px;">' + (navigator.onLine === false ? 'Open this lesson once while online to use it offline.' : 'Please try again.') + '</div>';
+}
+
 function openChapter(chapterId) {
   const ch = chaptersById[chapterId];
   if (!ch) return;
+  if (ch.shard && !ch.shardLoaded) {
+    const loading = document.getElementById('chapter-detail-loading');
+    loading.innerHTML = '<div class="loading-spinner" style="margin:0 auto 12px;"></div>Loading...';
+    loading.style.display = 'block';
+    document.getElementById('chapter-detail-content').style.display = 'none';
+    document.querySelectorAll('.screen').forEach(s => s.classList.remove('active'));
+    document.getElementById('screen-chapter-detail').classList.add('active');
+    currentChapterId = chapterId;
+    ensureChapterLoaded(chapterId)
+      .then(() => { if (currentChapterId === chapterId) openChapter(chapterId); })
+      .catch(e => { if (currentChapterId === chapterId) showChapterLoadError(e.message || 'Failed to load lesson'); });
+    return;
+  }
   currentChapterId = chapterId;
   const dataTablesHtml = (ch.tables || ch.blocks) ? formatChapterFromData(ch) : null;
   const busuuHtml = !dataTablesHtml && BUSUU_FORMATTED_LESSONS[chapterId] ? formatChapterContentBusuu(chapterId) : null;
@@ -7320,6 +7459,7 @@ function openChapter(chapterId) {
   document.getElementById('chapter-detail-loading').style.display = 'none';
   document.getElementById('chapter-detail-content').style.display = 'block';
   document.getElementById('screen-chapter-detail').classList.add('active');
+  prefetchNextChapter(chapterId);
 }
 
 function saveLesson() {
@@ -7422,6 +7562,15 @@ function renderLessonsList() {
 function handleChaptersSearch(val) {
   if (!chaptersLoaded) return;
   const q = (val || '').trim().toLowerCase();
+  if (q && allChapters.some(ch => ch && ch.shard && !ch.shardLoaded)) {
+    // Titles match right away; chapter text once every body is loaded.
+    ensureAllChaptersLoaded()
+      .then(() => {
+        const current = ((document.getElementById('chapters-search') || {}).value || '').trim().toLowerCase();
+        if (current === q) handleChaptersSearch(val);
+      })
+      .catch(() => { /* offline: only loaded chapters are searched */ });
+  }
   const majorsToShow = q ? lessonsStructure.majorLessons.filter(m => {
     return (m.sublessons || []).some(s => {
       const ch = chaptersById[s.chapterId];
@@ -9,12 +9,12 @@ Run: py -3 apply_kashmiri_full_enrichment.py
 """
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from kashmiri_lesson_overrides import LESSON_ROWS
 from kashmiri_long_english_util import long_english
 from kashmiri_maithili_s2_pairs import KS_RO
+from bb_io import load_lessons, save_lessons
 
 ROOT = Path(__file__).resolve().parent
 MAI = ROOT / "data_maithili.json"
@@ -43,8 +43,8 @@ def _ekt_blocks(lesson: dict) -> list[dict]:
 
 
 def main() -> None:
-    maithili = json.loads(MAI.read_text(encoding="utf-8"))
-    kashmiri = json.loads(KSH.read_text(encoding="utf-8"))
+    maithili = load_lessons(MAI)
+    kashmiri = load_lessons(KSH)
     m_by_id = {x["id"]: x for x in maithili}
     patched = 0
 
@@ -101,10 +101,7 @@ def main() -> None:
             kb["rows"] = new_rows
             patched += 1
 
-    KSH.write_text(
-        json.dumps(kashmiri, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    save_lessons(KSH, kashmiri)
     print("Patched EKT blocks in", patched, "lesson-block pairs; wrote", KSH.name)
 
 
@@ -13,9 +13,10 @@ Run: py -3 apply_maithili_english_all_kashmiri.py
 """
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+from bb_io import load_lessons, save_lessons
+
 ROOT = Path(__file__).resolve().parent
 MAI = ROOT / "data_maithili.json"
 KSH = ROOT / "data_kashmiri.json"
@@ -45,8 +46,8 @@ def _ekt_blocks(lesson: dict) -> list[dict]:
 def main() -> None:
     from kashmiri_maithili_s2_pairs import KS_RO
 
-    maithili = json.loads(MAI.read_text(encoding="utf-8"))
-    kashmiri = json.loads(KSH.read_text(encoding="utf-8"))
+    maithili = load_lessons(MAI)
+    kashmiri = load_lessons(KSH)
     m_by_id = {x["id"]: x for x in maithili}
     changed = 0
 
@@ -89,7 +90,7 @@ def main() -> None:
                 kb["rows"] = new_rows
                 changed += 1
 
-    KSH.write_text(json.dumps(kashmiri, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(KSH, kashmiri)
     print("Updated English from Maithili in", changed, "lessons (tables patched where rows differed)")
 
 
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Cached registry of the sentence-bank / lesson-row modules.
+
+The lesson content lives in large literal Python modules: <lang>_lessons_s*.py (and
+dogri_lessons_a/b.py) with LESSONS_* dicts keyed by chapter id, *_banks.py with named row
+lists and *_REGISTRY dicts, and *_rows.py with ROWS dicts. Tools that only need one
+language or one chapter used to exec/import all of them.
+
+BankRegistry compiles each module once into .bank_cache/<module>.pickle (its public
+list/tuple/dict globals) plus a small index recording, per module, its language, chapter
+ids, bank names and a source key: mtime + size + sha256 of the module and every local
+module it imports. A module is recompiled only when that key changes (a touched file
+with the same hash just has its mtime refreshed). Lookups then load only the pickles that
+hold what was asked for.
+
+Usage:
+  from bank_registry import BankRegistry
+  reg = BankRegistry()
+  reg.chapter("urdu", 545)             # rows of one chapter (loads urdu_lessons_s3a only)
+  reg.lessons("dogri", section=3)      # {chapter_id: rows} for section 3
+  reg.bank("kashmiri", "GREETINGS")    # a named bank or *_REGISTRY entry
+
+  python bank_registry.py build                 # compile every stale module
+  python bank_registry.py list [language]
+  python bank_registry.py show urdu 545
+  python bank_registry.py clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import os
+import pickle
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+CACHE_DIR = BASE / ".bank_cache"
+INDEX_VERSION = 1
+
+# Chapter id ranges of the five major lessons (lessons_structure_*.json).
+SECTIONS = {1: range(501, 510), 2: range(510, 543), 3: range(543, 597), 4: range(597, 620), 5: range(620, 663)}
+
+MODULE_PAT = re.compile(
+    r"^(?:section\d+_)?(?P<lang>[a-z]+)_(?:lessons_s(?P<section>\d)\w*|lessons_[a-z]|\w*banks|\w*rows)$"
+)
+
+
+def languages(base: Path = BASE) -> set[str]:
+    names = {p.stem[len("lessons_structure_"):] for p in base.glob("lessons_structure_*.json")}
+    return names | {"marathi"}
+
+
+def section_of(chapter_id: int) -> int | None:
+    for n, ids in SECTIONS.items():
+        if chapter_id in ids:
+            return n
+    return None
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _atomic_pickle(obj, path: Path):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _import(module: str, hasher):
+    """Import a bank module, importing its local dependencies first on a circular import
+    (kashmiri_lesson5_banks can only be loaded through kashmiri_sentence_banks)."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        for dep in hasher.local_imports(module):
+            importlib.import_module(dep)
+        return importlib.import_module(module)
+
+
+class BankRegistry:
+    def __init__(self, base: Path = BASE, cache_dir: Path | None = None):
+        self.base = Path(base)
+        self.cache_dir = Path(cache_dir or self.base / CACHE_DIR.name)
+        self.cache_dir.mkdir(exist_ok=True)
+        self._hasher = None
+        self._index_path = self.cache_dir / "index.pickle"
+        self._index = self._read_index()
+        self._dirty = False
+        self._checked: set[str] = set()
+        self._loaded: dict[str, dict] = {}
+        self.compiled = 0
+
+        langs = languages(self.base)
+        self._modules: dict[str, list[str]] = {}
+        for path in sorted(self.base.glob("*.py")):
+            m = MODULE_PAT.match(path.stem)
+            if m and m.group("lang") in langs:
+                self._modules.setdefault(m.group("lang"), []).append(path.stem)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self._index_path, "rb") as f:
+                index = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return {}
+        return index.get("modules", {}) if index.get("version") == INDEX_VERSION else {}
+
+    def _save_index(self):
+        if self._dirty:
+            _atomic_pickle({"version": INDEX_VERSION, "modules": self._index}, self._index_path)
+            self._dirty = False
+
+    @property
+    def hasher(self):
+        """Local-import resolver, only needed when (re)compiling."""
+        if self._hasher is None:
+            from build_runner import CodeHasher
+
+            self._hasher = CodeHasher(self.base)
+        return self._hasher
+
+    def _source_files(self, module: str) -> list[Path]:
+        return [self.base / f"{m}.py" for m in self.hasher.closure(f"{module}.py")]
+
+    def _is_fresh(self, entry: dict) -> bool:
+        for name, (mtime_ns, size, digest) in entry["sources"].items():
+            path = self.base / name
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                return False
+            if (st.st_mtime_ns, st.st_size) == (mtime_ns, size):
+                continue
+            if st.st_size != size or _sha256(path) != digest:
+                return False
+            entry["sources"][name] = (st.st_mtime_ns, size, digest)  # touched, not changed
+            self._dirty = True
+        return (self.cache_dir / f"{entry['module']}.pickle").exists()
+
+    def entry(self, module: str) -> dict:
+        """Index entry for `module`, recompiling it first if its sources changed."""
+        if module not in self._checked:
+            entry = self._index.get(module)
+            if entry is None or not self._is_fresh(entry):
+                self._compile(module)
+            self._checked.add(module)
+            self._save_index()
+        return self._index[module]
+
+    def _compile(self, module: str):
+        if str(self.base) not in sys.path:
+            sys.path.insert(0, str(self.base))
+        sources = self._source_files(module)
+        mod = _import(module, self.hasher)
+        data = {
+            k: v for k, v in vars(mod).items()
+            if not k.startswith("_") and isinstance(v, (list, tuple, dict))
+        }
+        chapters, registry_keys = {}, {}
+        for name, value in data.items():
+            if isinstance(value, dict) and value and all(isinstance(k, int) for k in value):
+                for cid in value:
+                    chapters.setdefault(cid, name)
+            elif isinstance(value, dict) and name.endswith("REGISTRY"):
+                for key in value:
+                    registry_keys.setdefault(key, name)
+        _atomic_pickle(data, self.cache_dir / f"{module}.pickle")
+        m = MODULE_PAT.match(module)
+        self._index[module] = {
+            "module": module,
+            "language": m.group("lang"),
+            "section": int(m.group("section")) if m.group("section") else None,
+            "names": sorted(data),
+            "chapters": chapters,
+            "registry_keys": registry_keys,
+            "sources": {p.name: (p.stat().st_mtime_ns, p.stat().st_size, _sha256(p)) for p in sources},
+        }
+        self._loaded.pop(module, None)
+        self._dirty = True
+        self.compiled += 1
+
+    def languages(self) -> list[str]:
+        return sorted(self._modules)
+
+    def modules(self, language: str) -> list[str]:
+        return list(self._modules.get(language, []))
+
+    def load(self, module: str) -> dict:
+        """All cached globals of one module ({name: value})."""
+        if module not in self._loaded:
+            self.entry(module)
+            with open(self.cache_dir / f"{module}.pickle", "rb") as f:
+                self._loaded[module] = pickle.load(f)
+        return self._loaded[module]
+
+    def chapter(self, language: str, chapter_id: int):
+        """Rows for one chapter id, or None when no module of `language` has it."""
+        section = section_of(chapter_id)
+        # Modules named for the chapter's section first; the rest only if needed.
+        ordered = sorted(self.modules(language), key=lambda m: self._name_section(m) != section)
+        for module in ordered:
+            name = self.entry(module)["chapters"].get(chapter_id)
+            if name is not None:
+                return self.load(module)[name][chapter_id]
+        return None
+
+    def lessons(self, language: str, section: int | None = None) -> dict:
+        """{chapter_id: rows} merged across the language's modules (first definition wins)."""
+        ids = SECTIONS[section] if section else None
+        out = {}
+        for module in self.modules(language):
+            entry = self.entry(module)
+            wanted = [c for c in entry["chapters"] if ids is None or c in ids]
+            if not wanted:
+                continue
+            data = self.load(module)
+            for cid in wanted:
+                out.setdefault(cid, data[entry["chapters"][cid]][cid])
+        return dict(sorted(out.items()))
+
+    def bank(self, language: str, name: str):
+        """A named bank: a module global (GREETINGS, ROWS, ...) or a *_REGISTRY key."""
+        for module in self.modules(language):
+            entry = self.entry(module)
+            if name in entry["names"]:
+                return self.load(module)[name]
+            if name in entry["registry_keys"]:
+                return self.load(module)[entry["registry_keys"][name]][name]
+        raise KeyError(f"{language}: no bank named {name!r}")
+
+    def build(self, language: str | None = None) -> int:
+        """Make sure every module (of `language`) is compiled; returns how many were rebuilt."""
+        before = self.compiled
+        for lang in [language] if language else self.languages():
+            for module in self.modules(lang):
+                self.entry(module)
+        return self.compiled - before
+
+    @staticmethod
+    def _name_section(module: str) -> int | None:
+        m = MODULE_PAT.match(module)
+        return int(m.group("section")) if m and m.group("section") else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile and query the cached sentence-bank registry")
+    parser.add_argument("command", choices=["build", "list", "show", "clear"])
+    parser.add_argument("language", nargs="?")
+    parser.add_argument("key", nargs="?", help="show: chapter id or bank name")
+    args = parser.parse_args()
+
+    if args.command == "clear":
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        print(f"Removed {CACHE_DIR}")
+        return
+
+    start = time.perf_counter()
+    reg = BankRegistry()
+    if args.command == "build":
+        n = reg.build(args.language)
+        print(f"{n} module(s) compiled, {sum(len(reg.modules(l)) for l in reg.languages())} cached "
+              f"in {CACHE_DIR.name}/ ({time.perf_counter() - start:.2f}s)")
+    elif args.command == "list":
+        for lang in [args.language] if args.language else reg.languages():
+            for module in reg.modules(lang):
+                entry = reg.entry(module)
+                chapters = sorted(entry["chapters"])
+                span = f"chapters {chapters[0]}–{chapters[-1]} ({len(chapters)})" if chapters else "no chapters"
+                print(f"{lang:<10} {module:<28} {span}, {len(entry['names'])} name(s), "
+                      f"{len(entry['registry_keys'])} registry key(s)")
+    else:
+        if not (args.language and args.key):
+            parser.error("show needs a language and a chapter id or bank name")
+        rows = reg.chapter(args.language, int(args.key)) if args.key.isdigit() else reg.bank(args.language, args.key)
+        if rows is None:
+            print(f"{args.language}: no rows for chapter {args.key}")
+            sys.exit(1)
+        for row in rows:
+            print(" | ".join(map(str, row)))
+        print(f"\n{len(rows)} row(s) in {1000 * (time.perf_counter() - start):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Generate data_assamese.json for BhaashaBuddy — mirrors Maithili lesson IDs 501–662
 with Bengali (Bangla) content. References: Bangla barnamala, যুক্তাক্ষর, standard grammar."""
-import json
 
 from assamese_lesson_helpers import H, S, r, ch, block_table, blk_para
+from bb_io import save_lessons
 
 
 def main():
@@ -410,8 +410,7 @@ def main():
 
     out.sort(key=lambda x: x["id"])
 
-    with open("data_assamese.json", "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_lessons("data_assamese.json", out)
 
     print("Wrote data_assamese.json with", len(out), "chapters")
 
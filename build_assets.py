@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Build a deployable dist/ with content-hashed, precompressed static assets.
+
+Source files keep their plain names for local development (index.html with ?v= query
+strings, app.js fetching data_*.json with cache: 'no-store'). This stage writes dist/ with:
+
+  - every script in index.html, css/styles.css, and each LANGUAGES dataFile /
+    structureFile renamed to <stem>.<hash>.<ext> (sha256 of the content, 10 hex chars);
+  - lesson shards from lessons/ (shard_lessons.py; already hash-named) and each shard
+    manifest renamed manifest.<hash>.json, wired into LANGUAGES as shardManifest;
+  - app.js with those references rewritten and ASSET_BUILD set, which switches the app to
+    normal HTTP caching and drops the hand-bumped LESSONS_DATA_REVISION wipe;
+  - index.html pointing at the hashed names (index.html itself keeps its name);
+  - with --packs, a binary lesson pack <stem>.<hash>.lpk (lesson_pack.py) for each data
+    file without shards, wired in as packFile: 7.7 MB instead of 11.8 MB uncompressed,
+    but about 15% more than the JSON once gzipped, so it is off by default;
+  - .gz next to every text file, and .br when the `brotli` package is installed
+    (pip install brotli);
+  - asset-manifest.json: source name -> hashed file, raw / gzip / brotli sizes.
+
+Serve the hashed files with `Cache-Control: public, max-age=31536000, immutable` and
+index.html with `no-cache`. A release then invalidates only files whose content changed;
+the summary lists them against the previous asset-manifest.json. Files in dist/ from
+older builds are removed. The lesson data is checked with validate_lessons.py first; a
+schema error stops the build.
+
+Usage:
+  python shard_lessons.py && python build_assets.py
+  python build_assets.py --output-dir /tmp/site
+  python build_assets.py --no-shards          # lessons from whole data files only
+  python build_assets.py --no-shards --packs  # ... as binary lesson packs
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+
+import lesson_pack
+import validate_lessons
+from bb_io import load_json, loads, save_json, write_atomic
+
+BASE = Path(__file__).parent.resolve()
+DIST = BASE / "dist"
+SHARD_DIR = BASE / "lessons"
+HASH_LEN = 10
+COMPRESS_MIN_BYTES = 1024  # smaller files aren't worth a .gz/.br
+COMPRESSIBLE = {".js", ".json", ".css", ".html", ".svg", ".txt", ".lpk"}
+
+try:
+    import brotli
+except ImportError:  # optional: .gz only
+    brotli = None
+
+SCRIPT_SRC_PAT = re.compile(r'(<script src=")([^"?]+)(?:\?v=[^"]*)?(">)')
+STYLESHEET_PAT = re.compile(r'(<link rel="stylesheet" href=")([^":]+)(">)')
+VERSION_COMMENT_PAT = re.compile(r"[ \t]*<!-- Bump \?v= .*?-->\n")
+LANG_FILE_PAT = re.compile(r'^(?P<indent>[ \t]*)(?P<key>dataFile|structureFile): "(?P<name>[^"]+)",$', re.M)
+ASSET_BUILD_PAT = re.compile(r"^const ASSET_BUILD = '';$", re.M)
+
+
+def hashed_name(rel: str, data: bytes) -> str:
+    path = Path(rel)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LEN]
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def source_files(base: Path = BASE) -> list[str]:
+    """Files the dist build reads (for build_runner.py): page, app, styles, data, shard manifests."""
+    html = (base / "index.html").read_text(encoding="utf-8")
+    app = (base / "app.js").read_text(encoding="utf-8")
+    files = ["index.html"] + [m[1] for m in STYLESHEET_PAT.findall(html)]
+    files += [m[1] for m in SCRIPT_SRC_PAT.findall(html)]
+    matches = list(LANG_FILE_PAT.finditer(app))
+    files += [m.group("name") for m in matches]
+    files += [f"lessons/{Path(m.group('name')).stem}/manifest.json" for m in matches if m.group("key") == "dataFile"]
+    return list(dict.fromkeys(files))
+
+
+class AssetWriter:
+    """Writes files into the output dir (only when changed) plus their compressed variants."""
+
+    def __init__(self, out_dir: Path, brotli_quality: int = 11):
+        self.out_dir = out_dir
+        self.brotli_quality = brotli_quality
+        self.assets: dict[str, dict] = {}
+        self.written: set[str] = set()
+        self.changed = 0
+
+    def _write(self, rel: str, data: bytes):
+        self.written.add(rel)
+        if write_atomic(self.out_dir / rel, data):
+            self.changed += 1
+
+    def emit(self, source: str, data: bytes, name: str | None = None) -> str:
+        """Write `data` as `name` (default: hashed from `source`); returns the output name."""
+        name = name or hashed_name(source, data)
+        entry = {"file": name, "bytes": len(data)}
+        existing = self.out_dir / name
+        compress = Path(name).suffix in COMPRESSIBLE and len(data) >= COMPRESS_MIN_BYTES
+        # A hashed name whose outputs all exist is already built (content is in the name).
+        fresh = existing.exists() and name != source and (
+            not compress or ((self.out_dir / f"{name}.gz").exists()
+                             and (brotli is None or (self.out_dir / f"{name}.br").exists())))
+        if not fresh:
+            self._write(name, data)
+        else:
+            self.written.add(name)
+        if compress:
+            for ext, pack in (("gz", lambda b: gzip.compress(b, compresslevel=9, mtime=0)),
+                              ("br", brotli and (lambda b: brotli.compress(b, quality=self.brotli_quality)))):
+                if not pack:
+                    continue
+                out = f"{name}.{ext}"
+                if fresh:
+                    self.written.add(out)
+                    size = (self.out_dir / out).stat().st_size
+                else:
+                    packed = pack(data)
+                    self._write(out, packed)
+                    size = len(packed)
+                entry["gzip" if ext == "gz" else "br"] = size
+        self.assets[source] = entry
+        return name
+
+    def remove_stale(self) -> int:
+        removed = 0
+        for path in sorted(self.out_dir.rglob("*")):
+            rel = path.relative_to(self.out_dir).as_posix()
+            if path.is_file() and rel not in self.written and rel != "asset-manifest.json":
+                path.unlink()
+                removed += 1
+        for path in sorted(self.out_dir.rglob("*"), reverse=True):
+            if path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+        return removed
+
+
+def emit_shards(writer: AssetWriter, stem: str, shard_root: Path) -> str | None:
+    """Copy one data file's shards (names already hashed) and emit a hashed manifest."""
+    src_dir = shard_root / stem
+    manifest_path = src_dir / "manifest.json"
+    if not manifest_path.exists():
+        return None
+    manifest = load_json(manifest_path)
+    for entry in manifest["chapters"]:
+        rel = f"lessons/{stem}/{entry['file']}"
+        writer.emit(rel, (src_dir / entry["file"]).read_bytes(), name=rel)
+    return writer.emit(f"lessons/{stem}/manifest.json", manifest_path.read_bytes())
+
+
+def rewrite_app(app: str, renamed: dict[str, str], manifests: dict[str, str], build_id: str,
+                packs: dict[str, str] | None = None) -> str:
+    packs = packs or {}
+
+    def _sub(m: re.Match) -> str:
+        name = m.group("name")
+        line = f'{m.group("indent")}{m.group("key")}: "{renamed.get(name, name)}",'
+        if m.group("key") == "dataFile" and name in manifests:
+            line += f'\n{m.group("indent")}shardManifest: "{manifests[name]}",'
+        if m.group("key") == "dataFile" and name in packs:
+            line += f'\n{m.group("indent")}packFile: "{packs[name]}",'
+        return line
+
+    app = LANG_FILE_PAT.sub(_sub, app)
+    app, n = ASSET_BUILD_PAT.subn(f"const ASSET_BUILD = '{build_id}';", app)
+    if not n:
+        raise SystemExit("app.js: `const ASSET_BUILD = '';` not found")
+    return app
+
+
+def check_lessons():
+    """Refuse to build from lesson data with schema errors (validate_lessons.py)."""
+    def on_file(data_file, diagnostics):
+        for d in diagnostics:
+            if d.level == "error":
+                print(validate_lessons.format_diagnostic(d))
+
+    counts = validate_lessons.validate(validate_lessons.app_lesson_files(), on_file=on_file)
+    if counts["error"]:
+        raise SystemExit(f"{counts['error']} lesson data error(s); fix them or pass --no-validate")
+
+
+def build(out_dir: Path = DIST, shard_root: Path | None = SHARD_DIR, packs: bool = False) -> AssetWriter:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    prev_path = out_dir / "asset-manifest.json"
+    if prev_path.exists():
+        previous = load_json(prev_path).get("assets", {})
+
+    writer = AssetWriter(out_dir)
+    html = (BASE / "index.html").read_text(encoding="utf-8")
+    app = (BASE / "app.js").read_text(encoding="utf-8")
+
+    # Lesson data + structure files, then shards / packs, then app.js rewritten to point at them.
+    renamed, manifests, lesson_packs = {}, {}, {}
+    for m in LANG_FILE_PAT.finditer(app):
+        name = m.group("name")
+        if name in renamed:
+            continue
+        data = (BASE / name).read_bytes()
+        renamed[name] = writer.emit(name, data)
+        if m.group("key") != "dataFile":
+            continue
+        hashed = emit_shards(writer, Path(name).stem, shard_root) if shard_root else None
+        if hashed:
+            manifests[name] = hashed
+        elif packs:
+            lesson_packs[name] = writer.emit(str(Path(name).with_suffix(".lpk")),
+                                             lesson_pack.pack(loads(data)))
+    build_id = hashlib.sha256(json.dumps(writer.assets, sort_keys=True).encode()).hexdigest()[:HASH_LEN]
+    app_bytes = rewrite_app(app, renamed, manifests, build_id, lesson_packs).encode("utf-8")
+
+    def _script(m: re.Match) -> str:
+        src = m.group(2)
+        data = app_bytes if src == "app.js" else (BASE / src).read_bytes()
+        return m.group(1) + writer.emit(src, data) + m.group(3)
+
+    def _stylesheet(m: re.Match) -> str:
+        return m.group(1) + writer.emit(m.group(2), (BASE / m.group(2)).read_bytes()) + m.group(3)
+
+    html = VERSION_COMMENT_PAT.sub("", html)
+    html = SCRIPT_SRC_PAT.sub(_script, html)
+    html = STYLESHEET_PAT.sub(_stylesheet, html)
+    writer.emit("index.html", html.encode("utf-8"), name="index.html")
+
+    changed = sorted(src for src, entry in writer.assets.items()
+                     if previous.get(src, {}).get("file") != entry["file"])
+    removed = writer.remove_stale()
+    manifest = {"build": build_id, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "assets": writer.assets}
+    save_json(prev_path, manifest, compact=False)
+
+    total = sum(a["bytes"] for a in writer.assets.values())
+    gz = sum(a.get("gzip", a["bytes"]) for a in writer.assets.values())
+    br = sum(a.get("br", a.get("gzip", a["bytes"])) for a in writer.assets.values())
+    print(f"{out_dir}: {len(writer.assets)} assets, {total / 1e6:.1f} MB raw, {gz / 1e6:.1f} MB gzip"
+          + (f", {br / 1e6:.1f} MB brotli" if brotli else " (pip install brotli for .br)")
+          + f" | build {build_id}")
+    shown = [c for c in changed if not c.startswith("lessons/") or c.endswith("manifest.json")]
+    shards = len(changed) - len(shown)
+    print(f"{len(changed)} asset(s) new or changed since the last build"
+          + (f" ({shards} lesson shards)" if shards else "")
+          + (": " + ", ".join(shown[:20]) + (" ..." if len(shown) > 20 else "") if shown else "")
+          + f"; {writer.changed} file(s) written, {removed} stale removed")
+    return writer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build dist/ with content-hashed, precompressed assets")
+    parser.add_argument("--output-dir", "-o", type=Path, default=DIST)
+    parser.add_argument("--no-shards", action="store_true", help="Don't include lessons/ shards")
+    parser.add_argument("--packs", action="store_true",
+                        help="Add binary lesson packs (lesson_pack.py) for data files without shards")
+    parser.add_argument("--no-validate", action="store_true", help="Skip the validate_lessons.py gate")
+    args = parser.parse_args()
+    if not args.no_validate:
+        check_lessons()
+    build(args.output_dir, None if args.no_shards else SHARD_DIR, args.packs)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,7 +34,6 @@ def build_rows():
     return rows
 
 if __name__ == "__main__":
-    import json
+    from bb_io import save_json
     rows = build_rows()
-    with open("barakhadi_rows.json", "w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
+    save_json("barakhadi_rows.json", rows)
@@ -13,6 +13,8 @@ import json
 import re
 from pathlib import Path
 
+from bb_io import load_json, save_json
+
 BASE = Path(__file__).parent
 
 # Section names (matches phrase categories)
@@ -114,8 +116,7 @@ def build_from_flat(entries: list) -> dict:
 
 def build_from_extracted(extracted_path: Path) -> dict:
     """Build sectioned dictionary from extracted_phrases.json (by_category has section info)."""
-    with open(extracted_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(extracted_path)
     by_category = data.get("by_category", {})
     sections = {}
     seen = set()  # (en, mr) for dedup
@@ -153,8 +154,7 @@ def main():
         sections = build_from_extracted(src_path)
 
     out_path = BASE / args.output
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(sections, f, ensure_ascii=False, indent=2)
+    save_json(out_path, sections)
     total = sum(len(s["words"]) for s in sections.values())
     print(f"Built {len(sections)} sections, {total} words -> {out_path}")
     for sec_id, sec_data in sections.items():
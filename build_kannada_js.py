@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Read extracted_kannada.json and write kannada_data.js for Phrases and Dictionary."""
 
-import json
 from pathlib import Path
 
+from bb_io import load_json
+
 BASE = Path(__file__).parent
 
 CATEGORY_META = {
@@ -58,8 +59,7 @@ def word_js(w):
     return f'{{ en: "{esc(w["en"])}", mr: "{esc(w["mr"])}", roman: "{esc(w["roman"])}" }}'
 
 def main():
-    with open(BASE / "extracted_kannada.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(BASE / "extracted_kannada.json")
 
     by_category = data.get("by_category", {})
     by_section = data.get("by_section", {})
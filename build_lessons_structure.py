@@ -4,10 +4,11 @@ Build lessons_structure.json from data.json using fuzzy matching.
 Matches user's sublesson titles to chapters in data.json.
 """
 
-import json
 import re
 from pathlib import Path
 
+from bb_io import load_lessons, save_structure
+
 # User's hierarchical list from the parent message
 USER_LESSONS = {
     "Introductory lessons": [
@@ -303,8 +304,7 @@ def main():
     data_path = base / "data.json"
     output_path = base / "lessons_structure.json"
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons(data_path)
 
     chapters_by_id = {ch["id"]: ch for ch in data}
     used_ids = set()
@@ -329,8 +329,7 @@ def main():
 
     result = {"majorLessons": major_lessons}
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    save_structure(output_path, result)
 
     print(f"Written {output_path}")
     unmatched = sum(1 for m in major_lessons for s in m["sublessons"] if s["chapterId"] is None)
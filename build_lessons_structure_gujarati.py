@@ -4,9 +4,10 @@ Build lessons_structure_gujarati.json from data_gujarati.json.
 Maps user's sublesson titles to chapter IDs (by order - same as scrape order).
 """
 
-import json
 from pathlib import Path
 
+from bb_io import load_lessons, save_structure
+
 USER_LESSONS = {
     "Introductory Lessons": [
         "Welcome to world of Gujarati",
@@ -139,8 +140,7 @@ def main():
         print(f"Run scrape_gujarati_lessons.py first to create {data_path}")
         return
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons(data_path)
 
     # Chapters indexed by id; map sublesson titles to chapter ids
     chapters_by_id = {ch["id"]: ch for ch in data}
@@ -175,8 +175,7 @@ def main():
         major_lessons.append({"name": major_name, "sublessons": sublesson_list})
 
     result = {"majorLessons": major_lessons}
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    save_structure(output_path, result)
     print(f"Written {output_path}")
 
 
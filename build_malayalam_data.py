@@ -1,14 +1,14 @@
 # -*- coding: utf-8 -*-
 """Build data_malayalam.json — mirrors lessons_structure_malayalam.json (501–662)."""
-import json
 from pathlib import Path
 
+from bb_io import load_structure, save_lessons
+
 BASE = Path(__file__).resolve().parent
 
 
 def load_titles():
-    with open(BASE / "lessons_structure_malayalam.json", encoding="utf-8") as f:
-        d = json.load(f)
+    d = load_structure(BASE / "lessons_structure_malayalam.json")
     titles = {}
     for m in d["majorLessons"]:
         for s in m["sublessons"]:
@@ -403,8 +403,7 @@ def main():
 
     out.sort(key=lambda x: x["id"])
     out_path = BASE / "data_malayalam.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_lessons(out_path, out)
     print("Wrote", out_path, "with", len(out), "chapters (501–662).")
 
 
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Build the <lang>_data.js phrasebooks from hindi_data.js in one pass.
+
+hindi_data.js is read and parsed once into a phrase model (the literal JS between
+entries + one PhraseEntry per `{ en, mr, roman, hint }` object). Every requested target
+then runs concurrently: one batched translation pass over the unique English keys
+(translate_client.py: shared translation memory, then the parallel corpus of existing
+lessons / phrasebooks, then MT with request pacing), romanization, and
+rendering of the model with the target's pairs. Romanization goes through one shared
+romanization.py service (batched per list, memoized in romanization.sqlite; urdu_romanizer.py
+for Urdu, offline) and per-language fix-ups handle entries such as the localized "Do you
+speak Maithili?". --mt-bridge romanizes Urdu the old way instead, through Urdu → Hindi MT
+and IAST.
+
+The per-language build_<lang>_from_hindi.py scripts are thin wrappers around this one.
+
+Usage:
+  python build_phrasebooks_from_hindi.py                    # all targets
+  python build_phrasebooks_from_hindi.py kannada tamil
+  python build_phrasebooks_from_hindi.py --parallel 4 --workers 4
+  python build_phrasebooks_from_hindi.py urdu --mt-bridge
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from parallel_corpus import ParallelCorpus, aligned_lookup
+from rate_limit import AdaptiveBackoff
+from romanization import RomanizationService
+from translate_client import WORKERS, TranslateClient
+from translation_memory import TranslationMemory
+
+BASE = Path(__file__).parent.resolve()
+HINDI_PATH = BASE / "hindi_data.js"
+
+ENTRY_PAT = re.compile(
+    r"\{ en: (\"(?:\\.|[^\"\\])*\"), mr: (\"(?:\\.|[^\"\\])*\"), roman: (\"(?:\\.|[^\"\\])*\")(, hint: \"\")? \}"
+)
+MAITHILI_QUESTION_PAT = re.compile(
+    r'\{ en: "Do you speak Maithili\?", mr: (\"(?:\\.|[^\"\\])*\"), '
+    r'roman: (\"(?:\\.|[^\"\\])*\")(, hint: \"\")? \}'
+)
+
+PhraseEntry = namedtuple("PhraseEntry", ["en", "hint"])
+
+# name: (MT code, "Do you speak <language>?", lesson JSON, MT bridge language for
+#        --mt-bridge romanization or None); `roman` comes from romanization.LANGUAGES[name].
+Target = namedtuple("Target", ["code", "question", "data_json", "bridge"])
+
+TARGETS = {
+    "bengali": Target("bn", "আপনি কি বাংলা বলতে পারেন?", "data_bengali.json", None),
+    "gujarati": Target("gu", "શું તમે ગુજરાતી બોલો છો?", "data_gujarati.json", None),
+    "kannada": Target("kn", "ನೀವು ಕನ್ನಡ ಮಾತನಾಡುತ್ತೀರಾ?", "data_kannada.json", None),
+    "malayalam": Target("ml", "നിങ്ങൾ മലയാളം സംസാരിക്കുമോ?", "data_malayalam.json", None),
+    "marathi": Target("mr", "तुम्हाला मराठी येते का?", "data.json", None),
+    "tamil": Target("ta", "நீங்கள் தமிழ் பேசுகிறீர்களா?", "data_tamil.json", None),
+    "telugu": Target("te", "మీరు తెలుగు మాట్లాడగలరా?", "data_telugu.json", None),
+    # Romanized offline by urdu_romanizer.py; the bridge (Urdu → Hindi MT → IAST) with --mt-bridge.
+    "urdu": Target("ur", "کیا آپ اردو بول سکتے ہیں؟", "data_urdu.json", "hi"),
+}
+
+
+class Phrasebook:
+    """hindi_data.js as literal chunks around its phrase entries (len(chunks) == len(entries) + 1)."""
+
+    def __init__(self, text: str):
+        self.chunks: list[str] = []
+        self.entries: list[PhraseEntry] = []
+        pos = 0
+        for m in ENTRY_PAT.finditer(text):
+            self.chunks.append(text[pos:m.start()])
+            self.entries.append(PhraseEntry(json.loads(m.group(1)), m.group(4) or ""))
+            pos = m.end()
+        self.chunks.append(text[pos:])
+
+    @classmethod
+    def load(cls, path=HINDI_PATH) -> Phrasebook:
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    def english(self) -> list[str]:
+        return list(dict.fromkeys(e.en for e in self.entries))
+
+    def render(self, pairs: dict[str, tuple[str, str]]) -> str:
+        parts = [self.chunks[0]]
+        for entry, chunk in zip(self.entries, self.chunks[1:]):
+            native, roman = pairs[entry.en]
+            parts.append(_entry_js(entry.en, native, roman, entry.hint))
+            parts.append(chunk)
+        return "".join(parts)
+
+
+def _entry_js(en: str, native: str, roman: str, hint: str) -> str:
+    return (
+        "{ en: "
+        + json.dumps(en, ensure_ascii=False)
+        + ", mr: "
+        + json.dumps(native, ensure_ascii=False)
+        + ", roman: "
+        + json.dumps(roman, ensure_ascii=False)
+        + hint
+        + " }"
+    )
+
+
+def romanizer(name: str, romans: RomanizationService, backoff: AdaptiveBackoff, mt_bridge: bool = False):
+    """romanize_many([native]) -> [roman] for a target: the shared service, or with
+    --mt-bridge bridged through MT into the bridge language first."""
+    target = TARGETS[name]
+    if target.bridge is None or not mt_bridge:
+        return romans.romanizer(name)
+    bridge = TranslateClient(target.code, target.bridge, backoff=backoff)
+    romanize_bridged = romans.romanizer(target.bridge)
+
+    def romanize_many(natives):
+        bridged = bridge.translate_many(natives)
+        return romanize_bridged([bridged.get(n, "") for n in natives])
+
+    return romanize_many
+
+
+def fix_maithili_question(text: str, name: str, target: Target, romanize_many) -> str:
+    """Keep the English key; localize the answer to the target language."""
+    roman = romanize_many([target.question])[0]
+
+    def _sub(m: re.Match) -> str:
+        return _entry_js("Do you speak Maithili?", target.question, roman, m.group(3) or "")
+
+    return MAITHILI_QUESTION_PAT.sub(_sub, text)
+
+
+def rename_hindi_labels(text: str, name: str, target: Target, romanize_many) -> str:
+    upper, title = name.upper(), name.title()
+    text = text.replace("const HINDI_PHRASES", f"const {upper}_PHRASES")
+    text = text.replace("const HINDI_DICTIONARY", f"const {upper}_DICTIONARY")
+    text = text.replace("Hindi phrases", f"{title} phrases")
+    return text.replace("data_hindi.json", target.data_json)
+
+
+# Applied in order to every rendered phrasebook.
+FIXUPS = [rename_hindi_labels, fix_maithili_question]
+
+
+def build_target(book: Phrasebook, name: str, tm: TranslationMemory, backoff: AdaptiveBackoff,
+                 out_dir: Path = BASE, workers: int = WORKERS, corpus: ParallelCorpus | None = None,
+                 mt_bridge: bool = False, romans: RomanizationService | None = None) -> Path:
+    target = TARGETS[name]
+    own_romans = romans is None
+    if own_romans:
+        romans = RomanizationService()
+    romanize_many = romanizer(name, romans, backoff, mt_bridge)
+    # The target's own phrasebook is the file being rebuilt; don't feed it back in.
+    aligned = aligned_lookup(corpus, name, exclude={f"{name}_data.js"}) if corpus is not None else None
+    client = TranslateClient("en", target.code, romanize_many=romanize_many, tm=tm, backoff=backoff,
+                             seed_cache=BASE / f"_{name}_translate_cache.json", workers=workers, aligned=aligned)
+    pruned = client.prune_identity()
+    if pruned:
+        print(f"[{name}] pruned identity (untranslated) cache entries:", pruned)
+    sent = client.prefetch(book.english())
+    text = book.render(client.pairs)
+    for fixup in FIXUPS:
+        text = fixup(text, name, target, romanize_many)
+    out_path = out_dir / f"{name}_data.js"
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    client.close()
+    if own_romans:
+        romans.close()
+    print(f"[{name}] wrote {out_path} | {len(client.pairs)} phrases, {sent} sent for translation")
+    return out_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build <lang>_data.js phrasebooks from hindi_data.js")
+    parser.add_argument("targets", nargs="*", help=f"Languages (default: all of {', '.join(TARGETS)})")
+    parser.add_argument("--input", "-i", type=Path, default=HINDI_PATH)
+    parser.add_argument("--output-dir", "-o", type=Path, default=BASE)
+    parser.add_argument("--parallel", "-P", type=int, default=4, help="Languages built at once (default: 4)")
+    parser.add_argument("--workers", "-w", type=int, default=WORKERS, help="MT requests in flight per language")
+    parser.add_argument("--no-corpus", action="store_true",
+                        help="Don't reuse existing lesson / phrasebook text (parallel_corpus.py)")
+    parser.add_argument("--mt-bridge", action="store_true",
+                        help="Romanize Urdu through Urdu → Hindi MT + IAST instead of urdu_romanizer.py")
+    args = parser.parse_args(argv)
+
+    names = [t.lower() for t in args.targets] or list(TARGETS)
+    unknown = [n for n in names if n not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+
+    book = Phrasebook.load(args.input)
+    print(f"{args.input.name}: {len(book.entries)} objects, {len(book.english())} unique English keys; "
+          f"building {len(names)} phrasebook(s)")
+    backoff = AdaptiveBackoff()
+    corpus = None if args.no_corpus else ParallelCorpus.open()
+    try:
+        with TranslationMemory() as tm, RomanizationService() as romans, \
+                ThreadPoolExecutor(max_workers=max(1, args.parallel)) as pool:
+            futures = {pool.submit(build_target, book, n, tm, backoff, args.output_dir, args.workers, corpus,
+                                   args.mt_bridge, romans): n
+                       for n in names}
+            for fut in as_completed(futures):
+                fut.result()
+    finally:
+        if corpus is not None:
+            corpus.close()
+
+
+if __name__ == "__main__":
+    main()
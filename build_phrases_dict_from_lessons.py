@@ -2,15 +2,20 @@
 """
 Build *_data.js PHRASES + DICTIONARY sections from data_*.json lesson tables.
 Used for languages without hand-curated phrasebooks or to backfill sparse sets.
+
+Optional: python build_phrases_dict_from_lessons.py nepali kashmiri  (only these). No args = all.
 """
 from __future__ import annotations
 
 import json
 import os
 import re
+import sys
 import textwrap
 from typing import Iterator
 
+from bb_io import load_json
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 
 # (output_js_basename, data_json, const_prefix)
@@ -72,7 +77,7 @@ def iter_rows_from_lesson(lesson: dict) -> Iterator[tuple[str, str, str]]:
 
 def collect_triplets(path: str) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
     """Preserve lesson order (by chapter id) for natural phrase progression."""
-    data = json.load(open(path, encoding="utf-8"))
+    data = load_json(path)
     try:
         data = sorted(data, key=lambda x: int(x.get("id") or 0))
     except (TypeError, ValueError):
@@ -176,7 +181,10 @@ def build_js(const: str, phrases: list[tuple], words: list[tuple]) -> str:
 
 
 def main() -> None:
+    only = [x.strip().lower() for x in sys.argv[1:] if x.strip()]
     for out_name, data_name, const in TARGETS:
+        if only and const.lower() not in only:
+            continue
         path = os.path.join(ROOT, data_name)
         if not os.path.isfile(path):
             print("skip missing", path)
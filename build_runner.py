@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Incremental build of the generated lesson and phrasebook files.
+
+Every regeneration step (setup scaffold -> populate_* -> in-place patch scripts ->
+lessons phrasebook, ...) is declared below as a Rule: the script and its arguments, the
+files it reads and the files it writes. Rules are listed in the order they have to run;
+a rule that writes a file a previous rule wrote (an in-place patch) runs after it, and
+a rule that reads a file runs after the last rule that wrote it.
+
+A rule is rebuilt only when something it depends on changed, by content hash:
+  - the script, or any local module it imports (transitively: *_lessons_s*.py, *_banks.py, ...);
+  - a file it reads (a source file, or the output of an upstream rule);
+  - its output went missing or was edited outside the build.
+A rebuilt rule whose outputs come out byte-identical does not trigger the rules after it.
+Rules whose dependencies are done run in parallel (one process each, --jobs at a time),
+so independent languages build side by side.
+
+Hashes are kept in .build_state.json. On a fresh checkout the state is empty and every
+rule looks stale; run --mark-clean once to adopt the committed files as up to date (some
+committed outputs were hand-/MT-edited after their generator ran, so a blind full rebuild
+is not what you want).
+
+Not in the graph: network steps of the translation pipeline (translate_pipeline.py,
+translate_all.py), one-shot migrations that are not idempotent (add_telugu_vocab_conv,
+expand_telugu_conversation, fix_telugu_placeholders, upgrade/enrich_meitei_*, the
+apply_*_kashmiri scripts), scripts that edit app.js or other .py files, and seed
+generators whose output was later edited (build_malayalam_data.py). The hindi_data.js
+phrasebooks (build_phrasebooks_from_hindi.py) need Google Translate and only run with
+--network.
+
+Usage:
+  python build_runner.py --mark-clean           # once: adopt the current tree
+  python build_runner.py --dry-run              # what would rebuild, and why
+  python build_runner.py                        # rebuild everything stale
+  python build_runner.py telugu kashmiri -j 4   # only these languages (+ their upstream)
+  python build_runner.py --network              # include the MT phrasebooks
+  python build_runner.py --list                 # print the graph
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from bb_io import load_json, save_json
+from build_assets import source_files as asset_sources
+from shard_lessons import app_data_files
+
+BASE = Path(__file__).parent.resolve()
+STATE_PATH = BASE / ".build_state.json"
+
+# build_phrasebooks_from_hindi.TARGETS (not imported: it pulls in the MT client).
+HINDI_PHRASEBOOK_TARGETS = ["bengali", "gujarati", "kannada", "malayalam", "marathi", "tamil", "telugu", "urdu"]
+
+# name: "<language>:<step>"; argv: script + args (run with cwd=BASE); reads/writes: paths
+# relative to BASE. A file in `writes` that an earlier rule also writes is patched in place.
+Rule = namedtuple("Rule", ["name", "argv", "reads", "writes", "network"], defaults=((), (), False))
+
+
+def _setup(lang):
+    return Rule(f"{lang}:setup", ["setup_new_langs.py", lang], ["lessons_structure_maithili.json"],
+                [f"lessons_structure_{lang}.json", f"data_{lang}.json"])
+
+
+def _patch_chain(lang, scripts, reads=()):
+    """In-place patch scripts that all rewrite data_<lang>.json, in order."""
+    return [Rule(f"{lang}:{s}", [f"{s}.py"], list(reads), [f"data_{lang}.json"]) for s in scripts]
+
+
+def _shard_language(data_file):
+    stem = Path(data_file).stem
+    return stem[len("data_"):] if stem.startswith("data_") else "marathi"
+
+
+def _lessons_phrasebook(lang):
+    return Rule(f"{lang}:phrasebook", ["build_phrases_dict_from_lessons.py", lang], [f"data_{lang}.json"],
+                [f"{lang}_data.js"])
+
+
+RULES = [
+    # Marathi / Gujarati navigation structure from the lesson data.
+    Rule("marathi:structure", ["build_lessons_structure.py"], ["data.json"], ["lessons_structure.json"]),
+    Rule("gujarati:structure", ["build_lessons_structure_gujarati.py"], ["data_gujarati.json"],
+         ["lessons_structure_gujarati.json"]),
+    Rule("kannada:extract", ["extract_phrases_kannada.py"], ["data_kannada.json", "lessons_structure_kannada.json"],
+         ["extracted_kannada.json"]),
+    # Lesson data generated wholesale from Python tables.
+    Rule("assamese:data", ["build_assamese_data.py"], [], ["data_assamese.json"]),
+    Rule("bengali:data", ["build_bengali_data.py"], [], ["data_bengali.json"]),
+    # Scaffold from the Maithili structure, then fill from <lang>_lessons_s*.py.
+    _setup("odia"),
+    *_patch_chain("odia", ["populate_odia_s1", "populate_odia_s2", "populate_odia_s3a", "populate_odia_s3b",
+                           "populate_odia_s3c", "populate_odia_s4", "populate_odia_s5a", "populate_odia_s5b"],
+                  reads=["lessons_structure_odia.json"]),
+    _setup("dogri"),
+    Rule("dogri:populate_all_lang", ["populate_all_lang.py", "dogri"], [], ["data_dogri.json"]),
+    *_patch_chain("dogri", ["populate_dogri_s2", "populate_dogri_s345"], reads=["lessons_structure_dogri.json"]),
+    *[r for lang in ("bodo", "sanskrit", "urdu", "konkani")
+      for r in (_setup(lang), *_patch_chain(lang, [f"populate_{lang}_lessons"],
+                                            reads=[f"lessons_structure_{lang}.json"]))],
+    # Hand-maintained data files with idempotent patch scripts on top.
+    *_patch_chain("hindi", ["populate_hindi_lessons"], reads=["lessons_structure_hindi.json"]),
+    *_patch_chain("santali", ["populate_santali_s1", "populate_santali_s2", "populate_santali_s3a",
+                              "populate_santali_s3b", "populate_santali_s3c", "populate_santali_s4",
+                              "populate_santali_s5a", "populate_santali_s5b"]),
+    *_patch_chain("sindhi", ["populate_sindhi_s1", "populate_sindhi_s2", "populate_sindhi_s3a", "populate_sindhi_s3b",
+                             "populate_sindhi_s3c", "populate_sindhi_s4", "populate_sindhi_s5a", "populate_sindhi_s5b",
+                             "populate_sindhi_s5c"]),
+    *_patch_chain("meitei", ["populate_script", "populate_vocab", "populate_grammar_lessons",
+                             "populate_patterns_part1", "populate_patterns_part2", "populate_convo1",
+                             "populate_convo2", "fix_script_grids"]),
+    *_patch_chain("telugu", ["add_unique_telugu_content", "add_vocab_sentences", "fix_conversation_sentences",
+                             "fix_telugu_cleanup_examples", "ensure_telugu_3_23_3_55_15_rows"]),
+    *_patch_chain("nepali", ["expand_section2_nepali", "expand_section3_nepali", "strip_nepali_meta"]),
+    # Kashmiri is derived from the finished Nepali data, then rebuilt lesson by lesson.
+    Rule("kashmiri:generate", ["generate_kashmiri_data.py"], ["data_nepali.json"], ["data_kashmiri.json"]),
+    *_patch_chain("kashmiri", ["populate_kashmiri_lessons", "patch_kashmiri_section1_lessons"],
+                  reads=["lessons_structure_kashmiri.json"]),
+    *_patch_chain("kashmiri", ["patch_kashmiri_section2_lessons"], reads=["_maithili_s2_english.json"]),
+    # Phrasebooks: from lesson tables, or translated from hindi_data.js (network), reusing the
+    # target's lesson text through parallel_corpus.py.
+    *[_lessons_phrasebook(lang) for lang in ("nepali", "kashmiri", "punjabi", "assamese")],
+    *[Rule(f"{lang}:phrasebook", ["build_phrasebooks_from_hindi.py", lang],
+           ["hindi_data.js", "data.json" if lang == "marathi" else f"data_{lang}.json",
+            *(["urdu_roman_lexicon.json"] if lang == "urdu" else [])], [f"{lang}_data.js"],
+           network=True) for lang in HINDI_PHRASEBOOK_TARGETS],
+    # Per-chapter lesson shards + manifest for the app (one rule per LANGUAGES dataFile).
+    *[Rule(f"{_shard_language(name)}:shards", ["shard_lessons.py", name], [name],
+           [f"lessons/{Path(name).stem}/manifest.json"]) for name in app_data_files()],
+    # Deployable dist/: content-hashed, precompressed copies of everything above.
+    Rule("site:assets", ["build_assets.py"], asset_sources(), ["dist/asset-manifest.json"]),
+]
+
+
+def file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class CodeHasher:
+    """Hash of a script plus every local module it imports, transitively."""
+
+    def __init__(self, base: Path = BASE):
+        self.base = base
+        self._imports: dict[str, list[str]] = {}
+
+    def local_imports(self, module: str) -> list[str]:
+        if module not in self._imports:
+            path = self.base / f"{module}.py"
+            names = set()
+            for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+                if isinstance(node, ast.Import):
+                    names.update(a.name.split(".")[0] for a in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                    names.add(node.module.split(".")[0])
+            self._imports[module] = sorted(n for n in names if (self.base / f"{n}.py").is_file())
+        return self._imports[module]
+
+    def closure(self, script: str) -> list[str]:
+        seen, todo = set(), [Path(script).stem]
+        while todo:
+            module = todo.pop()
+            if module not in seen:
+                seen.add(module)
+                todo.extend(self.local_imports(module))
+        return sorted(seen)
+
+    def modules(self, rule: Rule) -> dict[str, str | None]:
+        return {m: file_hash(self.base / f"{m}.py") for m in self.closure(rule.argv[0])}
+
+    def rule_hash(self, rule: Rule, modules=None) -> str:
+        h = hashlib.sha256(json.dumps(rule.argv).encode())
+        for module, digest in sorted((modules or self.modules(rule)).items()):
+            h.update(f"\0{module}\0{digest}".encode())
+        return h.hexdigest()
+
+
+class Graph:
+    """Rules plus the edges implied by declaration order and the files they share."""
+
+    def __init__(self, rules=RULES):
+        self.rules = {r.name: r for r in rules}
+        if len(self.rules) != len(rules):
+            raise ValueError("duplicate rule names")
+        self.order = [r.name for r in rules]
+        self.deps: dict[str, set[str]] = {n: set() for n in self.order}
+        # rule name -> {file: rule that last wrote it before this one}
+        self.prev_writer: dict[str, dict[str, str]] = {n: {} for n in self.order}
+        self.last_writer: dict[str, str] = {}
+        readers_since_write: dict[str, list[str]] = {}
+        for rule in rules:
+            for f in (*rule.reads, *rule.writes):
+                if f in self.last_writer:
+                    self.prev_writer[rule.name][f] = self.last_writer[f]
+                    self.deps[rule.name].add(self.last_writer[f])
+            for f in rule.writes:
+                # Don't overwrite a file before everyone who reads the old version is done.
+                self.deps[rule.name].update(r for r in readers_since_write.get(f, []) if r != rule.name)
+                readers_since_write[f] = []
+                self.last_writer[f] = rule.name
+            for f in rule.reads:
+                readers_since_write.setdefault(f, []).append(rule.name)
+
+    def select(self, patterns) -> list[str]:
+        """Rules matching `patterns` (language or full rule name) plus everything upstream."""
+        if not patterns:
+            return list(self.order)
+        wanted = {n for n in self.order for p in patterns if n == p or n.split(":")[0] == p}
+        todo = list(wanted)
+        while todo:
+            for dep in self.deps[todo.pop()]:
+                if dep not in wanted:
+                    wanted.add(dep)
+                    todo.append(dep)
+        return [n for n in self.order if n in wanted]
+
+
+def load_state(path=STATE_PATH) -> dict:
+    try:
+        return load_json(path)
+    except FileNotFoundError:
+        return {}
+
+
+def save_state(state: dict, path=STATE_PATH):
+    save_json(path, state, compact=False, sort_keys=True)
+
+
+class Runner:
+    def __init__(self, graph: Graph, state: dict, jobs: int, network: bool = False, force: bool = False,
+                 verbose: bool = False):
+        self.graph = graph
+        self.state = state
+        self.jobs = jobs
+        self.network = network
+        self.force = force
+        self.verbose = verbose
+        self.hasher = CodeHasher()
+        self._lock = threading.Lock()
+
+    def inputs(self, name: str) -> dict[str, str | None]:
+        """Hashes of the files this rule builds on (reads + files it patches in place)."""
+        rule = self.graph.rules[name]
+        files = list(rule.reads) + [f for f in rule.writes if f in self.graph.prev_writer[name]]
+        return {f: self.expected_input(name, f) for f in dict.fromkeys(files)}
+
+    def expected_input(self, name: str, f: str) -> str | None:
+        """Hash of `f` as this rule sees it: what the upstream writer last produced, or the
+        file on disk when nothing upstream writes it."""
+        writer = self.graph.prev_writer[name].get(f)
+        if writer and writer in self.state:
+            return self.state[writer]["writes"].get(f)
+        return file_hash(BASE / f)
+
+    def stale_reason(self, name: str) -> str | None:
+        rule = self.graph.rules[name]
+        if self.force:
+            return "forced"
+        rec = self.state.get(name)
+        if rec is None:
+            return "never built"
+        modules = self.hasher.modules(rule)
+        if rec["code"] != self.hasher.rule_hash(rule, modules):
+            changed = [f"{m}.py" for m, h in modules.items() if rec["modules"].get(m) != h]
+            return f"code changed ({', '.join(changed) or 'arguments'})"
+        for f in (*rule.reads, *(f for f in rule.writes if f in self.graph.prev_writer[name])):
+            if self.expected_input(name, f) != rec["reads"].get(f):
+                return f"{f} changed"
+        for f in rule.writes:
+            if self.graph.last_writer[f] != name:
+                continue
+            current = file_hash(BASE / f)
+            if current is None:
+                return f"{f} missing"
+            if current != rec["writes"].get(f):
+                return f"{f} edited outside the build"
+        return None
+
+    def record(self, name: str, reads: dict, save: bool = True):
+        rule = self.graph.rules[name]
+        modules = self.hasher.modules(rule)
+        with self._lock:
+            self.state[name] = {
+                "code": self.hasher.rule_hash(rule, modules),
+                "modules": modules,
+                "reads": reads,
+                "writes": {f: file_hash(BASE / f) for f in rule.writes},
+                "built": round(time.time()),
+            }
+            if save:
+                save_state(self.state)
+
+    def mark_clean(self, names):
+        for name in names:
+            self.record(name, self.inputs(name), save=False)
+        save_state(self.state)
+        print(f"Marked {len(names)} rule(s) clean in {STATE_PATH.name}")
+
+    def dry_run(self, names) -> int:
+        pending = set()
+        for name in names:
+            rule = self.graph.rules[name]
+            reason = self.stale_reason(name)
+            upstream = sorted(d for d in self.graph.deps[name] if d in pending)
+            if reason is None and upstream:
+                reason = f"upstream rebuilds ({', '.join(upstream)})"
+            if reason is None:
+                if self.verbose:
+                    print(f"  up to date  {name}")
+                continue
+            if rule.network and not self.network:
+                print(f"  skip        {name}: {reason} (needs --network)")
+                continue
+            pending.add(name)
+            print(f"  rebuild     {name}: {reason}")
+        print(f"{len(pending)} of {len(names)} rule(s) would rebuild")
+        return len(pending)
+
+    def run_rule(self, name: str):
+        rule = self.graph.rules[name]
+        reads = self.inputs(name)
+        start = time.monotonic()
+        proc = subprocess.run([sys.executable, *rule.argv], cwd=BASE, capture_output=True, text=True)
+        elapsed = time.monotonic() - start
+        if proc.returncode != 0:
+            return False, elapsed, proc.stdout + proc.stderr
+        self.record(name, reads)
+        return True, elapsed, proc.stdout
+
+    def build(self, names) -> int:
+        selected = set(names)
+        done, failed = set(), set()
+        running = {}
+        built = skipped = 0
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while len(done) + len(failed) < len(names):
+                for name in names:
+                    if name in done or name in failed or name in running.values():
+                        continue
+                    deps = self.graph.deps[name] & selected
+                    if deps & failed:
+                        print(f"  blocked     {name}: upstream failed")
+                        failed.add(name)
+                        continue
+                    if not deps <= done:
+                        continue
+                    reason = self.stale_reason(name)
+                    rule = self.graph.rules[name]
+                    if reason is None:
+                        done.add(name)
+                    elif rule.network and not self.network:
+                        print(f"  skip        {name}: {reason} (needs --network)")
+                        skipped += 1
+                        done.add(name)
+                    else:
+                        print(f"  rebuild     {name}: {reason}")
+                        running[pool.submit(self.run_rule, name)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    name = running.pop(fut)
+                    ok, elapsed, output = fut.result()
+                    if ok:
+                        built += 1
+                        done.add(name)
+                        print(f"  done        {name} ({elapsed:.1f}s)")
+                        if self.verbose and output.strip():
+                            print("    " + output.strip().replace("\n", "\n    "))
+                    else:
+                        failed.add(name)
+                        print(f"  FAILED      {name} ({elapsed:.1f}s)\n    " + output.strip().replace("\n", "\n    "))
+        summary = f"{built} rebuilt, {len(names) - built - skipped - len(failed)} up to date"
+        if skipped:
+            summary += f", {skipped} skipped (network)"
+        if failed:
+            summary += f", {len(failed)} failed/blocked"
+        print(summary)
+        return 1 if failed else 0
+
+
+def print_graph(graph: Graph, names):
+    for name in names:
+        rule = graph.rules[name]
+        deps = sorted(graph.deps[name])
+        print(f"{name}{'  [network]' if rule.network else ''}")
+        print(f"    run:    {' '.join(rule.argv)}")
+        if rule.reads:
+            print(f"    reads:  {', '.join(rule.reads)}")
+        print(f"    writes: {', '.join(rule.writes)}")
+        if deps:
+            print(f"    after:  {', '.join(deps)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild stale lesson/phrasebook files in dependency order")
+    parser.add_argument("targets", nargs="*", help="Languages or rule names (default: everything)")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="Show what would rebuild and why")
+    parser.add_argument("--mark-clean", action="store_true", help="Record the current tree as up to date")
+    parser.add_argument("--list", action="store_true", help="Print the rules and their dependencies")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Rules run at once")
+    parser.add_argument("--network", action="store_true", help="Include rules that call Google Translate")
+    parser.add_argument("--force", "-B", action="store_true", help="Rebuild the selected rules and their upstream unconditionally")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show script output and up-to-date rules")
+    args = parser.parse_args()
+
+    graph = Graph()
+    names = graph.select(args.targets)
+    if not names:
+        parser.error(f"no rule matches: {', '.join(args.targets)}")
+    if args.list:
+        print_graph(graph, names)
+        return
+
+    runner = Runner(graph, load_state(), max(1, args.jobs), network=args.network, force=args.force,
+                    verbose=args.verbose)
+    if args.mark_clean:
+        runner.mark_clean(names)
+    elif args.dry_run:
+        runner.dry_run(names)
+    else:
+        sys.exit(runner.build(names))
+
+
+if __name__ == "__main__":
+    main()
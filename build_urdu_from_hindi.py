@@ -2,159 +2,14 @@
 """
 Rebuild urdu_data.js to mirror the Hindi/Maithili phrase+word sets (same English keys).
 - `mr`: English→Urdu (Arabic script) via Google Translate.
-- `roman`: Urdu→Hindi (Devanagari) → IAST (Arabic→Latin romanizers are unreliable in-deps;
-          Hindi bridge matches pronunciation for a consistent Latin guide).
-"""
-import json
-import os
-import re
-import time
-
-from deep_translator import GoogleTranslator
-from indic_transliteration.sanscript import DEVANAGARI, IAST, transliterate
-
-ROOT = os.path.dirname(os.path.abspath(__file__))
-CACHE_PATH = os.path.join(ROOT, "_urdu_translate_cache.json")
-HINDI_PATH = os.path.join(ROOT, "hindi_data.js")
-OUT_PATH = os.path.join(ROOT, "urdu_data.js")
-
-translator_en_ur = GoogleTranslator(source="en", target="ur")
-translator_ur_hi = GoogleTranslator(source="ur", target="hi")
-
-if os.path.isfile(CACHE_PATH):
-    with open(CACHE_PATH, "r", encoding="utf-8") as f:
-        cache = json.load(f)
-else:
-    cache: dict[str, list[str]] = {}
-
-SAVE_EVERY = 75
-TRANSLATE_RETRIES = 6
-
-
-def save_cache():
-    with open(CACHE_PATH, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=0)
-
-
-def roman_from_ur(ur_text: str) -> str:
-    if not (ur_text and ur_text.strip()):
-        return ""
-    hi = ""
-    for attempt in range(TRANSLATE_RETRIES):
-        time.sleep(0.06 + attempt * 0.35)
-        try:
-            hi = translator_ur_hi.translate(ur_text)
-            break
-        except Exception as e:
-            print("ur->hi error:", repr(ur_text)[:50], "attempt", attempt + 1, e)
-    if not hi.strip():
-        return ""
-    try:
-        rom = transliterate(hi, DEVANAGARI, IAST)
-        if rom and rom[0].islower():
-            rom = rom[0].upper() + rom[1:]
-        return rom
-    except Exception as e:
-        print("roman translit error:", repr(ur_text)[:40], e)
-        return ""
-
-
-def prune_identity_cache_entries() -> int:
-    bad = [k for k, v in cache.items() if isinstance(v, list) and len(v) >= 1 and v[0] == k]
-    for k in bad:
-        del cache[k]
-    return len(bad)
-
-
-def translate_pair(en: str) -> tuple[str, str]:
-    if en in cache:
-        return cache[en][0], cache[en][1]
-    ur = en
-    for attempt in range(TRANSLATE_RETRIES):
-        time.sleep(0.08 + attempt * 0.45)
-        try:
-            ur = translator_en_ur.translate(en)
-            break
-        except Exception as e:
-            print("translate error:", repr(en)[:72], "attempt", attempt + 1, e)
-    rom = roman_from_ur(ur) if ur != en else ""
-    cache[en] = [ur, rom]
-    if len(cache) % SAVE_EVERY == 0:
-        save_cache()
-        print("…cached", len(cache), "strings")
-    return ur, rom
-
-
-pat = re.compile(
-    r"\{ en: (\"(?:\\.|[^\"\\])*\"), mr: (\"(?:\\.|[^\"\\])*\"), roman: (\"(?:\\.|[^\"\\])*\")(, hint: \"\")? \}"
-)
+- `roman`: urdu_romanizer.py (offline rules + exception lexicon, IAST style); pass
+          --mt-bridge for the old Urdu→Hindi (Devanagari) → IAST round-trip.
 
+Thin wrapper: the engine is build_phrasebooks_from_hindi.py (all languages in one pass).
+"""
+import sys
 
-def repl(m: re.Match) -> str:
-    en = json.loads(m.group(1))
-    ur_t, rom = translate_pair(en)
-    hint = m.group(4) or ""
-    return (
-        "{ en: "
-        + json.dumps(en, ensure_ascii=False)
-        + ", mr: "
-        + json.dumps(ur_t, ensure_ascii=False)
-        + ", roman: "
-        + json.dumps(rom, ensure_ascii=False)
-        + hint
-        + " }"
-    )
-
-
-fix_maithili_pat = re.compile(
-    r'\{ en: "Do you speak Maithili\?", mr: (\"(?:\\.|[^\"\\])*\"), '
-    r'roman: (\"(?:\\.|[^\"\\])*\")(, hint: \"\")? \}'
-)
-
-
-def fix_maithili_question_safe(text: str) -> str:
-    ur_q = "کیا آپ اردو بول سکتے ہیں؟"
-    rom_q = roman_from_ur(ur_q)
-
-    def _sub(_m: re.Match) -> str:
-        hint = _m.group(3) or ""
-        return (
-            '{ en: "Do you speak Maithili?", mr: '
-            + json.dumps(ur_q, ensure_ascii=False)
-            + ", roman: "
-            + json.dumps(rom_q, ensure_ascii=False)
-            + hint
-            + " }"
-        )
-
-    return fix_maithili_pat.sub(_sub, text)
-
-
-def main():
-    pruned = prune_identity_cache_entries()
-    if pruned:
-        save_cache()
-        print("pruned identity (untranslated) cache entries:", pruned)
-
-    with open(HINDI_PATH, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    matches = pat.findall(text)
-    print("objects to translate:", len(matches), "(+ ur→hi for each unique English string)")
-
-    updated = pat.sub(repl, text)
-    updated = updated.replace("const HINDI_PHRASES", "const URDU_PHRASES")
-    updated = updated.replace("const HINDI_DICTIONARY", "const URDU_DICTIONARY")
-    updated = updated.replace("Hindi phrases", "Urdu phrases")
-    updated = updated.replace("data_hindi.json", "data_urdu.json")
-    updated = fix_maithili_question_safe(updated)
-
-    with open(OUT_PATH, "w", encoding="utf-8") as f:
-        f.write(updated)
-
-    save_cache()
-    print("wrote", OUT_PATH, "| cache entries:", len(cache))
-
+from build_phrasebooks_from_hindi import main
 
 if __name__ == "__main__":
-    main()
+    main(["urdu", *sys.argv[1:]])
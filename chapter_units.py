@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Split lesson chapters into independently translatable units and put them back together.
+
+A unit is one of:
+  - "meta":  the chapter's own text fields (title, content, intro...) without id/url;
+  - "block": one paragraph, or one table with at most `max_rows` rows;
+  - "rows":  a slice of at most `max_rows` rows of a longer table (headers repeated
+             for context; the first slice also carries heading/headers for reassembly).
+
+check_unit / check_shape verify that a translation kept the structure of its source:
+same keys and block types, same headers count, same row and column counts, same
+speakCol, same id. translate_pipeline.py --mode units uses these to retry only the
+units that come back wrong, instead of the whole chapter.
+"""
+
+from __future__ import annotations
+
+import copy
+
+# Chapter keys that are never sent for translation.
+STRUCTURAL_KEYS = ("id", "url")
+BLOCK_LISTS = ("blocks", "tables")
+
+
+class Unit:
+    __slots__ = ("kind", "where", "payload")
+
+    def __init__(self, kind: str, where: tuple, payload):
+        self.kind = kind
+        self.where = where  # () for meta, (list_key, index) for blocks, (list_key, index, start) for rows
+        self.payload = payload
+
+    def label(self, chapter_id) -> str:
+        return f"chapter id={chapter_id} {self.kind}{'' if not self.where else list(self.where)}"
+
+
+def split_chapter(chapter: dict, max_rows: int = 20) -> list[Unit]:
+    meta = {k: v for k, v in chapter.items() if k not in STRUCTURAL_KEYS and k not in BLOCK_LISTS}
+    units = [Unit("meta", (), meta)] if meta else []
+    for list_key in BLOCK_LISTS:
+        for bi, block in enumerate(chapter.get(list_key) or []):
+            rows = block.get("rows") if isinstance(block, dict) else None
+            if not isinstance(rows, list) or len(rows) <= max_rows:
+                units.append(Unit("block", (list_key, bi), block))
+                continue
+            for start in range(0, len(rows), max_rows):
+                part = {k: v for k, v in block.items() if k != "rows"}
+                part["rows"] = rows[start:start + max_rows]
+                units.append(Unit("rows", (list_key, bi, start), part))
+    return units
+
+
+def reassemble(chapter: dict, units: list[Unit], translated: list) -> dict:
+    """Build the translated chapter from per-unit results (same order as `units`)."""
+    out = {k: copy.deepcopy(v) for k, v in chapter.items()}
+    for unit, tr in zip(units, translated):
+        if unit.kind == "meta":
+            out.update(tr)
+        elif unit.kind == "block":
+            list_key, bi = unit.where
+            out[list_key][bi] = tr
+        else:
+            list_key, bi, start = unit.where
+            block = out[list_key][bi]
+            if start == 0:
+                rows = block["rows"]
+                block.clear()
+                block.update({k: v for k, v in tr.items() if k != "rows"})
+                block["rows"] = rows
+            block["rows"][start:start + len(tr["rows"])] = tr["rows"]
+    for k in STRUCTURAL_KEYS:
+        if k in chapter:
+            out[k] = chapter[k]
+    return out
+
+
+def _table_problems(src: dict, out: dict, where: str) -> list[str]:
+    problems = []
+    if src.get("speakCol") != out.get("speakCol"):
+        problems.append(f"{where}: speakCol {out.get('speakCol')!r} != {src.get('speakCol')!r}")
+    if "headers" in src:
+        sh, oh = src["headers"], out.get("headers")
+        if not isinstance(oh, list) or len(oh) != len(sh):
+            problems.append(f"{where}: {len(oh) if isinstance(oh, list) else oh!r} headers, expected {len(sh)}")
+    srows, orows = src.get("rows") or [], out.get("rows")
+    if not isinstance(orows, list) or len(orows) != len(srows):
+        n = len(orows) if isinstance(orows, list) else orows
+        problems.append(f"{where}: {n!r} rows, expected {len(srows)}")
+        return problems
+    for ri, (sr, orow) in enumerate(zip(srows, orows)):
+        if not isinstance(orow, list) or len(orow) != len(sr):
+            n = len(orow) if isinstance(orow, list) else orow
+            problems.append(f"{where} row {ri}: {n!r} cells, expected {len(sr)}")
+    return problems
+
+
+def check_unit(src, out, where: str = "unit") -> list[str]:
+    """Structural differences between a source unit/block and its translation ([] = ok)."""
+    if not isinstance(out, dict):
+        return [f"{where}: expected an object, got {type(out).__name__}"]
+    problems = []
+    if set(src) != set(out):
+        problems.append(f"{where}: keys {sorted(out)} != {sorted(src)}")
+    if src.get("type") != out.get("type"):
+        problems.append(f"{where}: type {out.get('type')!r} != {src.get('type')!r}")
+    if "rows" in src or "headers" in src:
+        problems += _table_problems(src, out, where)
+    for k, v in src.items():
+        if isinstance(v, str) and k in out and not isinstance(out[k], str):
+            problems.append(f"{where}: {k!r} is not a string")
+    return problems
+
+
+def check_shape(src: dict, out: dict) -> list[str]:
+    """Whole-chapter check: id, block lists and every block's structure."""
+    if not isinstance(out, dict):
+        return [f"expected a chapter object, got {type(out).__name__}"]
+    problems = []
+    if out.get("id") != src.get("id"):
+        problems.append(f"id {out.get('id')!r} != {src.get('id')!r}")
+    for list_key in BLOCK_LISTS:
+        sb, ob = src.get(list_key), out.get(list_key)
+        if sb is None and ob is None:
+            continue
+        if not isinstance(ob, list) or len(ob) != len(sb or []):
+            n = len(ob) if isinstance(ob, list) else ob
+            problems.append(f"{list_key}: {n!r} blocks, expected {len(sb or [])}")
+            continue
+        for bi, (s, o) in enumerate(zip(sb, ob)):
+            problems += check_unit(s, o, f"{list_key}[{bi}]")
+    return problems
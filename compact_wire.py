@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Compact wire format for LLM chapter translation.
+
+Instead of the whole pretty-printed chapter (English cells, url, id, speakCol and
+whitespace that the model must copy back), only the strings that need translating are
+sent, as an indexed object:
+
+  {"0": ["माझा", "mAjhA"], "1": ["कसा-कशी-कसे"], ...}
+
+A two-element item is a native table cell plus the transliteration cell next to it; a
+one-element item is any other string containing Devanagari (titles, headings, notes).
+The model answers with the same keys, and expand_chapter() writes the answers back into
+a local copy of the chapter. Pure-English strings and structural fields never leave the
+machine; "Marathi" column labels are renamed locally.
+
+Usage (token savings report, no network):
+  python compact_wire.py
+  python compact_wire.py --input data.json --limit 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from rate_limit import estimate_tokens
+
+BASE = Path(__file__).parent.resolve()
+
+DEVA = re.compile(r"[\u0900-\u097F]")
+TRANSLIT_HEADER = re.compile(r"translit", re.I)
+STRUCTURAL_KEYS = ("id", "url", "type", "speakCol")
+
+
+def _is_native(s) -> bool:
+    return isinstance(s, str) and bool(DEVA.search(s)) and not s.startswith(("http://", "https://"))
+
+
+def compact_chapter(chapter: dict):
+    """Return (items, slots): items[i] is the list sent for index i, slots[i] the paths it fills."""
+    items: list[list[str]] = []
+    slots: list[tuple] = []
+
+    def visit(obj, path):
+        if isinstance(obj, str):
+            if _is_native(obj):
+                items.append([obj])
+                slots.append((path,))
+        elif isinstance(obj, list):
+            for i, v in enumerate(obj):
+                visit(v, path + (i,))
+        elif isinstance(obj, dict):
+            headers = obj.get("headers")
+            for k, v in obj.items():
+                if k in STRUCTURAL_KEYS:
+                    continue
+                if k == "rows" and isinstance(v, list) and isinstance(headers, list):
+                    visit_rows(v, headers, path + (k,))
+                else:
+                    visit(v, path + (k,))
+
+    def visit_rows(rows, headers, path):
+        for ri, row in enumerate(rows):
+            if not isinstance(row, list):
+                visit(row, path + (ri,))
+                continue
+            paired = set()
+            for c, cell in enumerate(row):
+                if c in paired or not _is_native(cell):
+                    continue
+                nxt = c + 1
+                if (nxt < len(row) and nxt < len(headers) and isinstance(headers[nxt], str)
+                        and TRANSLIT_HEADER.search(headers[nxt]) and isinstance(row[nxt], str)
+                        and not _is_native(row[nxt])):
+                    items.append([cell, row[nxt]])
+                    slots.append((path + (ri, c), path + (ri, nxt)))
+                    paired.add(nxt)
+                else:
+                    items.append([cell])
+                    slots.append((path + (ri, c),))
+
+    visit(chapter, ())
+    return items, slots
+
+
+def _get_path(obj, path):
+    for step in path:
+        obj = obj[step]
+    return obj
+
+
+def split_known(chapter: dict, items, slots, lookup, source: str = "Marathi"):
+    """Answer [native, translit] row items locally where `lookup(english) -> (native, roman)`
+    knows the row's English cell (parallel_corpus.py). Returns (items, slots) still to send
+    and (slots, answers) filled locally.
+
+    The lookup answers for the row as a whole, so it only fills a row's single pair, or in
+    a row with several pairs (gender / number forms, a second language) the pair under the
+    column headed just `source`. Every other pair goes to the model.
+    """
+    pairs_per_row = Counter(paths[0][:-1] for item, paths in zip(items, slots) if len(item) == 2)
+    send_items, send_slots, known_slots, known_answers = [], [], [], []
+    for item, paths in zip(items, slots):
+        found = None
+        if len(item) == 2:
+            row_path = paths[0][:-1]  # (..., block, "rows", row)
+            headers = _get_path(chapter, row_path[:-2]).get("headers") or []
+            native_col = paths[0][-1]
+            own_column = (native_col < len(headers) and isinstance(headers[native_col], str)
+                          and headers[native_col].strip().lower() == source.lower())
+            col = next((i for i, h in enumerate(headers) if isinstance(h, str) and h.lower().startswith("english")), -1)
+            row = _get_path(chapter, row_path)
+            if ((pairs_per_row[row_path] == 1 or own_column)
+                    and 0 <= col < len(row) and isinstance(row[col], str) and row[col].strip()):
+                found = lookup(row[col])
+        if found:
+            known_slots.append(paths)
+            known_answers.append(list(found))
+        else:
+            send_items.append(item)
+            send_slots.append(paths)
+    return send_items, send_slots, known_slots, known_answers
+
+
+def encode_items(items) -> str:
+    return json.dumps({str(i): it for i, it in enumerate(items)}, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_answers(text: str, items):
+    """Parse the model's reply; None unless every index comes back with the right arity."""
+    try:
+        obj = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(obj, dict) or set(obj) != {str(i) for i in range(len(items))}:
+        return None
+    out = []
+    for i, it in enumerate(items):
+        ans = obj[str(i)]
+        if isinstance(ans, str) and len(it) == 1:
+            ans = [ans]
+        if not (isinstance(ans, list) and len(ans) == len(it) and all(isinstance(a, str) for a in ans)):
+            return None
+        out.append(ans)
+    return out
+
+
+def _set_path(obj, path, value):
+    for step in path[:-1]:
+        obj = obj[step]
+    obj[path[-1]] = value
+
+
+def expand_chapter(chapter: dict, slots, answers, tgt_name: str) -> dict:
+    out = copy.deepcopy(chapter)
+    for paths, ans in zip(slots, answers):
+        for path, value in zip(paths, ans):
+            _set_path(out, path, value)
+    for list_key in ("blocks", "tables"):
+        for block in out.get(list_key) or []:
+            if isinstance(block, dict) and isinstance(block.get("headers"), list):
+                block["headers"] = [h.replace("Marathi", tgt_name) if isinstance(h, str) else h
+                                    for h in block["headers"]]
+    return out
+
+
+def token_savings(chapter: dict, full_prompt, compact_prompt):
+    """(tokens before, tokens after) for one chapter, prompt + expected reply, estimated."""
+    full = json.dumps(chapter, ensure_ascii=False, indent=2)
+    items, _ = compact_chapter(chapter)
+    wire = encode_items(items)
+    return (
+        estimate_tokens(full_prompt(full)) + estimate_tokens(full),
+        estimate_tokens(compact_prompt(wire)) + estimate_tokens(wire),
+    )
+
+
+def main():
+    from translate_pipeline import _groq_compact_prompt, _groq_full_chapter_prompt
+
+    parser = argparse.ArgumentParser(description="Report token savings of the compact wire format")
+    parser.add_argument("--input", "-i", default="data.json")
+    parser.add_argument("--limit", "-n", type=int)
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every chapter")
+    args = parser.parse_args()
+
+    with open(BASE / args.input, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if args.limit:
+        data = data[: args.limit]
+
+    total_before = total_after = 0
+    for ch in data:
+        before, after = token_savings(
+            ch, lambda s: _groq_full_chapter_prompt(s, "Kannada", "Kannada"),
+            lambda s: _groq_compact_prompt(s, "Kannada"),
+        )
+        total_before += before
+        total_after += after
+        if args.verbose:
+            print(f"  id={ch.get('id')}: ~{before} → ~{after} tokens ({100 * (before - after) / before:.0f}% saved)")
+    saved = total_before - total_after
+    print(f"{len(data)} chapters: ~{total_before} → ~{total_after} tokens "
+          f"({saved} saved, {100 * saved / max(total_before, 1):.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
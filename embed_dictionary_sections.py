@@ -10,6 +10,8 @@ import json
 import re
 from pathlib import Path
 
+from bb_io import load_json
+
 BASE = Path(__file__).parent
 APP_JS = BASE / "app.js"
 DICT_JSON = BASE / "dictionary_marathi.json"
@@ -44,8 +46,7 @@ def main():
         print(f"app.js not found: {APP_JS}")
         return
 
-    with open(DICT_JSON, "r", encoding="utf-8") as f:
-        sections = json.load(f)
+    sections = load_json(DICT_JSON)
 
     content = APP_JS.read_text(encoding="utf-8")
 
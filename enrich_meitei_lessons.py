@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-import json
 import re
 from pathlib import Path
 
+from translation_memory import load_meitei_cache
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
@@ -18,9 +19,9 @@ def table(heading, headers, rows, speak_col=None):
     return out
 
 
-structure = json.loads((BASE / "lessons_structure_meitei.json").read_text(encoding="utf-8"))
-data = json.loads((BASE / "data_meitei.json").read_text(encoding="utf-8"))
-cache = json.loads((BASE / "meitei_translate_cache.json").read_text(encoding="utf-8"))
+structure = load_structure(BASE / "lessons_structure_meitei.json")
+data = load_lessons(BASE / "data_meitei.json")
+cache = load_meitei_cache()
 
 section_by_id = {}
 for major in structure["majorLessons"]:
@@ -671,5 +672,5 @@ for chapter in data:
         }
     )
 
-(BASE / "data_meitei.json").write_text(json.dumps(new_data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+save_lessons(BASE / "data_meitei.json", new_data)
 print("Enriched Meitei lesson bodies for", len(new_data), "chapters")
@@ -1,4 +1,3 @@
-import json
 
 """
 Ensure Telugu phrase sublessons 3.23–3.55 (chapters 765–797)
@@ -6,12 +5,13 @@ have at least 15 example rows each by repeating existing
 topic‑specific rows (no generic 'Example for…' placeholders).
 """
 
+from bb_io import load_lessons, save_lessons
+
 PATH = "data_telugu.json"
 TARGET_IDS = set(range(765, 798))
 MIN_ROWS = 15
 
-with open(PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
+data = load_lessons(PATH)
 
 updated = {}
 
@@ -35,8 +35,7 @@ for ch in data:
     if len(rows) != orig_len:
         updated[cid] = (orig_len, len(rows))
 
-with open(PATH, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+save_lessons(PATH, data)
 
 print("Updated chapter row counts (before -> after):", updated)
 
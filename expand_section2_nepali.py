@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """Replace lesson tables 510–542 with longer natural English / Nepali / transliteration rows."""
-import json
-from copy import deepcopy
-from pathlib import Path
+import sys
 
-ROOT = Path(__file__).resolve().parent
-DATA = ROOT / "data_nepali.json"
+from patch_engine import ReplaceRows, run_module
+
+DATA_FILE = "data_nepali.json"
+HEADERS = ["English", "Nepali", "Transliteration"]
 
 # Lessons 513 (simple present) and 515 (present continuous) already use long sentences — leave unchanged.
 SKIP = {513, 515}
@@ -731,36 +731,10 @@ ROWS: dict[int, list[list[str]]] = {
 }
 
 
-def apply_rows(data: list) -> None:
-    for lesson in data:
-        lid = lesson.get("id")
-        if lid not in ROWS or lid in SKIP:
-            continue
-        new_rows = ROWS[lid]
-        for block in lesson.get("blocks") or []:
-            if block.get("type") != "table":
-                continue
-            if block.get("headers") != ["English", "Nepali", "Transliteration"]:
-                continue
-            if len(block.get("rows") or []) != len(new_rows):
-                raise ValueError(
-                    f"Lesson {lid}: row count mismatch "
-                    f"(file has {len(block.get('rows') or [])}, "
-                    f"script has {len(new_rows)})"
-                )
-            block["rows"] = [list(r) for r in new_rows]
-
-
-def main() -> None:
-    data = json.loads(DATA.read_text(encoding="utf-8"))
-    data = deepcopy(data)
-    apply_rows(data)
-    DATA.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-    print("Updated section 2.1–2.33 lessons in", DATA)
+def patches() -> list:
+    # Row counts must match the existing tables (ReplaceRows is strict).
+    return [ReplaceRows(lid, HEADERS, rows) for lid, rows in ROWS.items() if lid not in SKIP]
 
 
 if __name__ == "__main__":
-    main()
+    run_module(sys.modules[__name__])
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Expand Telugu conversation practice: add Diwali, 22 new sublessons like Marathi, expand all to 15+ sentences"""
-import json
 import copy
 
+from bb_io import load_lessons, load_structure, save_lessons, save_structure
+
 # New chapters to add (852-871) - 851 is Quarrel after shift
 NEW_CHAPTERS = [
     {"id": 852, "title": "Simple Telugu conversation – Linking AADHAR card to mobile number", "content": "Aadhaar-mobile linking in Telugu.", "intro": "Learn phrases for linking Aadhaar to mobile."},
@@ -432,8 +433,7 @@ def expand_sentences(chapter_id, existing_rows, min_sentences=15):
     return existing_rows  # Keep as is, will be expanded elsewhere
 
 def main():
-    with open("data_telugu.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons("data_telugu.json")
 
     # Find conversation chapters (825-850) and expand to 15+ sentences
     # Also add Diwali as 825, shift 825->826, 826->827, ... 850->851
@@ -517,12 +517,10 @@ def main():
 
     data.sort(key=lambda x: x.get("id", 0))
 
-    with open("data_telugu.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_lessons("data_telugu.json", data)
 
     # Update lessons_structure_telugu.json
-    with open("lessons_structure_telugu.json", "r", encoding="utf-8") as f:
-        structure = json.load(f)
+    structure = load_structure("lessons_structure_telugu.json")
 
     for major in structure.get("majorLessons", []):
         if major.get("name") == "Conversation practice":
@@ -562,8 +560,7 @@ def main():
             major["sublessons"] = new_subs
             break
 
-    with open("lessons_structure_telugu.json", "w", encoding="utf-8") as f:
-        json.dump(structure, f, ensure_ascii=False, indent=2)
+    save_structure("lessons_structure_telugu.json", structure)
 
     print("Expanded Telugu conversation: +Diwali, +22 new sublessons, 15+ sentences each")
 
@@ -9,6 +9,8 @@ import json
 import re
 from pathlib import Path
 
+from bb_io import save_json
+
 BASE = Path(__file__).parent
 APP_JS = BASE / "app.js"
 
@@ -85,8 +87,7 @@ def main():
                     "phrases": cat_data["phrases"],
                 }
         path = BASE / "phrases_marathi.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(out, f, ensure_ascii=False, indent=2)
+        save_json(path, out)
         total = sum(len(c["phrases"]) for c in out.values())
         print(f"Saved {total} phrases to {path}")
     else:
@@ -94,8 +95,7 @@ def main():
     dictionary = extract_js_object(content, "DICTIONARY")
     if dictionary:
         path = BASE / "dictionary_marathi.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(dictionary, f, ensure_ascii=False, indent=2)
+        save_json(path, dictionary)
         print(f"Saved {len(dictionary)} words to {path}")
     else:
         print("Could not extract DICTIONARY")
@@ -6,10 +6,11 @@ and add them to:
   2) Words/Dictionary section in app.js
 """
 
-import json
 import re
 from pathlib import Path
 
+from bb_io import load_lessons, load_structure, save_json
+
 BASE = Path(__file__).parent
 
 # Map major lesson names and sublesson title keywords to phrase category IDs
@@ -154,11 +155,9 @@ def extract_from_lesson(lesson: dict) -> list[dict]:
     return out
 
 def main():
-    with open(BASE / "lessons_structure.json", "r", encoding="utf-8") as f:
-        structure = json.load(f)
+    structure = load_structure(BASE / "lessons_structure.json")
 
-    with open(BASE / "data.json", "r", encoding="utf-8") as f:
-        lessons_data = json.load(f)
+    lessons_data = load_lessons(BASE / "data.json")
 
     # Build id -> lesson lookup
     lessons_by_id = {int(l["id"]): l for l in lessons_data if "id" in l}
@@ -235,8 +234,7 @@ def main():
         "dictionary_entries": all_entries,
         "stats": stats,
     }
-    with open(BASE / "extracted_phrases.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    save_json(BASE / "extracted_phrases.json", output)
 
     print(f"Processed {stats['lessons_processed']} lessons, {stats['lessons_with_blocks']} with blocks")
     print(f"Extracted {stats['phrases_extracted']} phrases, {stats['dictionary_extracted']} dictionary entries")
@@ -6,10 +6,11 @@ and by section for Dictionary (Words).
 Output: extracted_kannada.json and optionally generate JS for app.js.
 """
 
-import json
 import re
 from pathlib import Path
 
+from bb_io import load_lessons, load_structure, save_json
+
 BASE = Path(__file__).parent
 
 # Same category mapping as Marathi (extract_phrases_from_lessons.py)
@@ -158,10 +159,8 @@ def extract_from_lesson(lesson: dict) -> list[dict]:
     return out
 
 def main():
-    with open(BASE / "lessons_structure_kannada.json", "r", encoding="utf-8") as f:
-        structure = json.load(f)
-    with open(BASE / "data_kannada.json", "r", encoding="utf-8") as f:
-        lessons_data = json.load(f)
+    structure = load_structure(BASE / "lessons_structure_kannada.json")
+    lessons_data = load_lessons(BASE / "data_kannada.json")
 
     lessons_by_id = {int(l["id"]): l for l in lessons_data if "id" in l}
     by_category = {}
@@ -221,8 +220,7 @@ def main():
         "by_section": by_section,
         "stats": stats,
     }
-    with open(BASE / "extracted_kannada.json", "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_json(BASE / "extracted_kannada.json", out)
 
     print(f"Processed {stats['lessons_processed']} lessons, extracted {stats['phrases_extracted']} phrases")
     for cat in sorted(by_category.keys(), key=lambda c: -len(by_category[c])):
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Groq chat-completions endpoint, for offline testing of the
+translation scripts (no API key, no network, no quota).
+
+It answers POST /openai/v1/chat/completions by echoing back the JSON payload found
+under the prompt's "(JSON):" marker, so a "translation" is the input unchanged.
+Latency and failure rates are configurable to exercise concurrency, rate limiting
+and retries.
+
+Usage:
+  python fake_groq_server.py --port 8765
+  python fake_groq_server.py --port 8765 --latency 0.8 --jitter 0.4 --rate-limit-rate 0.1 --error-rate 0.05
+  GROQ_API_KEY=test python translate_pipeline.py -t kannada -n 10 -c 4 --base-url http://127.0.0.1:8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETIONS_PATH = "/openai/v1/chat/completions"
+PAYLOAD_RE = re.compile(r"\(JSON\):\n(.*?)\n\s*OUTPUT \(JSON only\):\s*$", re.S)
+
+
+def echo_payload(prompt: str) -> str:
+    m = PAYLOAD_RE.search(prompt)
+    return m.group(1).strip() if m else "{}"
+
+
+def make_handler(opts):
+    rng = random.Random(opts.seed)
+    rng_lock = threading.Lock()
+    stats = {"requests": 0, "rate_limited": 0, "errors": 0}
+
+    def roll() -> float:
+        with rng_lock:
+            return rng.random()
+
+    class Handler(BaseHTTPRequestHandler):
+        server_stats = stats
+
+        def log_message(self, fmt, *args):
+            if opts.verbose:
+                super().log_message(fmt, *args)
+
+        def _send(self, status: int, body: dict, headers: dict | None = None):
+            raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length) or b"{}")
+            stats["requests"] += 1
+            if self.path.rstrip("/") != COMPLETIONS_PATH:
+                self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            if roll() < opts.rate_limit_rate:
+                stats["rate_limited"] += 1
+                self._send(
+                    429,
+                    {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                    {"retry-after": str(opts.retry_after)},
+                )
+                return
+            if roll() < opts.error_rate:
+                stats["errors"] += 1
+                self._send(500, {"error": {"message": "Internal server error", "type": "internal_server_error"}})
+                return
+            delay = opts.latency + (roll() * opts.jitter if opts.jitter else 0)
+            if delay > 0:
+                time.sleep(delay)
+            prompt = "".join(m.get("content", "") for m in req.get("messages", []))
+            content = echo_payload(prompt)
+            if roll() < opts.invalid_json_rate:
+                content = content[: len(content) // 2]
+            prompt_tokens = len(prompt) // 3 + 1
+            completion_tokens = len(content) // 3 + 1
+            self._send(200, {
+                "id": f"chatcmpl-fake-{stats['requests']}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": req.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            })
+
+    return Handler
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Groq chat-completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base seconds per successful response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds (0..jitter) per response")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--invalid-json-rate", type=float, default=0.0, help="Fraction of responses truncated")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verbose", "-v", action="store_true")
+    return parser
+
+
+def serve_in_thread(**overrides):
+    """Start a server on a background thread (port 0 = pick a free port). Returns (server, base_url)."""
+    opts = build_parser().parse_args([])
+    opts.port = 0
+    for k, v in overrides.items():
+        setattr(opts, k, v)
+    server = ThreadingHTTPServer((opts.host, opts.port), make_handler(opts))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    opts = build_parser().parse_args()
+    server = ThreadingHTTPServer((opts.host, opts.port), make_handler(opts))
+    print(f"Fake Groq server on http://{opts.host}:{opts.port}{COMPLETIONS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Stats: {server.RequestHandlerClass.server_stats}")
+
+
+if __name__ == "__main__":
+    main()
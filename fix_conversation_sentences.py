@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Fix repeating sentences in Telugu conversation sublessons 5.2-5.27 (chapters 826-851).
 Replace with 15+ unique genuine sentences from web research."""
-import json
+
+from bb_io import load_lessons, save_lessons
 
 # [English, Telugu, Transliteration] - 15+ unique sentences per chapter
 SENTENCES = {
@@ -452,8 +453,7 @@ SENTENCES = {
 }
 
 def main():
-    with open("data_telugu.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_lessons("data_telugu.json")
 
     for ch in data:
         cid = ch.get("id")
@@ -465,8 +465,7 @@ def main():
                 table["rows"] = rows
                 break
 
-    with open("data_telugu.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_lessons("data_telugu.json", data)
 
     print(f"Fixed {len(SENTENCES)} conversation chapters (826-851) with 15+ unique sentences each")
 
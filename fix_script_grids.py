@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Put letter grids into blocks (before the word table) so the app actually renders them."""
-import json, sys
+import sys
 from pathlib import Path
 
+from bb_io import load_lessons, save_lessons
+
 BASE = Path(__file__).parent.resolve()
 
 GRIDS = {
@@ -183,7 +185,7 @@ GRIDS = {
 
 def main():
     path = BASE / "data_meitei.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for chapter in data:
         cid = chapter["id"]
@@ -192,7 +194,7 @@ def main():
             chapter["blocks"] = GRIDS[cid] + existing_blocks
             chapter.pop("tables", None)
             updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     sys.stdout.buffer.write(f"Moved grids into blocks for {updated} lessons\n".encode("utf-8"))
 
 if __name__ == "__main__":
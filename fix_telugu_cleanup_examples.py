@@ -1,10 +1,11 @@
-import json
 
 """
 Remove generic 'Example for ...' placeholder rows from Telugu phrase chapters
 765–797 so that only meaningful topic‑specific sentences remain.
 """
 
+from bb_io import load_lessons, save_lessons
+
 PATH = "data_telugu.json"
 
 TARGET_IDS = set(range(765, 798))
@@ -18,8 +19,7 @@ def is_placeholder_row(row):
     return eng.startswith("Example for") or eng.startswith("Example ") or "ఉదాహరణ" in tel
 
 
-with open(PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
+data = load_lessons(PATH)
 
 removed_counts = {}
 
@@ -37,8 +37,7 @@ for ch in data:
         tables[0]["rows"] = new_rows
         removed_counts[cid] = removed
 
-with open(PATH, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+save_lessons(PATH, data)
 
 print("Removed placeholder rows in chapters:", removed_counts)
 
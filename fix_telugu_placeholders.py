@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """Replace generic placeholder sentences with topic-specific content for Telugu phrase chapters 749-797."""
-import json
+
+from bb_io import load_lessons, save_lessons
 
 PATH = "data_telugu.json"
 
-with open(PATH, "r", encoding="utf-8") as f:
-    data = json.load(f)
+data = load_lessons(PATH)
 
 # Topic-specific content: chapter_id -> list of [English, Telugu, Transliteration]
 CONTENT = {
@@ -348,7 +348,6 @@ for ch in data:
         ch["content"] = ch.get("title", "").replace(" in Telugu", "")
         ch["intro"] = "Practice topic-specific Telugu sentences with English and transliteration."
 
-with open(PATH, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+save_lessons(PATH, data)
 
 print(f"Replaced placeholder content in {len(CONTENT)} chapters (749-797).")
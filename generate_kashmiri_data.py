@@ -16,10 +16,11 @@ Run: py -3 generate_kashmiri_data.py
 from __future__ import annotations
 
 import copy
-import json
 import re
 from pathlib import Path
 
+from bb_io import load_lessons, save_lessons
+
 ROOT = Path(__file__).resolve().parent
 SRC = ROOT / "data_nepali.json"
 OUT = ROOT / "data_kashmiri.json"
@@ -286,9 +287,9 @@ def transform_lesson(lesson: dict) -> dict:
 
 
 def main() -> None:
-    data = json.loads(SRC.read_text(encoding="utf-8"))
+    data = load_lessons(SRC)
     out = [transform_lesson(l) for l in data]
-    OUT.write_text(json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(OUT, out)
     print("Wrote", OUT, "lessons:", len(out))
 
 
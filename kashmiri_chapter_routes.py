@@ -174,11 +174,12 @@ CHAPTER_TO_BANKS: dict[int, tuple[str, ...]] = {
 
 
 def assert_all_chapters_covered(structure_path: str | None = None) -> None:
-    import json
     from pathlib import Path
 
+    from bb_io import load_structure
+
     p = Path(structure_path or Path(__file__).resolve().parent / "lessons_structure_kashmiri.json")
-    data = json.loads(p.read_text(encoding="utf-8-sig"))
+    data = load_structure(p)
     ids: list[int] = []
     for ml in data["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -10,10 +10,10 @@ Devanagari is a practical gloss for learners (Kashmiri in Devanagari orthography
 """
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from kashmiri_maithili_s2_pairs import KS_RO
+from bb_io import load_json
 
 # Helper: [English, Kashmiri Devanagari, Roman transliteration]
 
@@ -25,7 +25,7 @@ def R(e: str, ks: str, ro: str) -> list[str]:
 _ROOT = Path(__file__).resolve().parent
 _ENGLISH_BY_LESSON: dict[int, list[str]] = {
     x["id"]: x["english"]
-    for x in json.loads((_ROOT / "_maithili_s2_english.json").read_text(encoding="utf-8"))
+    for x in load_json(_ROOT / "_maithili_s2_english.json")
 }
 
 
@@ -1,7 +1,6 @@
 # Assembles per-chapter lesson rows from konkani_sentence_banks for populate_konkani_lessons.py
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from konkani_chapter_routes import CHAPTER_TO_BANKS
@@ -10,6 +9,7 @@ from konkani_sentence_banks import (
     ROWS_PER_LESSON,
     target_row_count,
 )
+from bb_io import load_structure
 
 
 def _merge_bank_names(names: list[str], n: int = ROWS_PER_LESSON) -> list[list[str]]:
@@ -319,7 +319,7 @@ def _route_banks_fallback(title: str, chapter_id: int) -> list[str]:
 
 def build_lessons_dict(structure_path: Path | None = None) -> dict[int, list[list[str]]]:
     base = structure_path or (Path(__file__).resolve().parent / "lessons_structure_konkani.json")
-    data = json.loads(base.read_text(encoding="utf-8"))
+    data = load_structure(base)
     out: dict[int, list[list[str]]] = {}
     for ml in data["majorLessons"]:
         for sub in ml["sublessons"]:
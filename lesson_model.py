@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Read-only, slot-based model of the lesson corpus (every LANGUAGES dataFile in app.js).
+
+Tooling used to walk the parsed JSON directly: nested dicts per chapter and block, a list
+per row, a separate str object for every occurrence of "English" or a gloss repeated in
+22 languages, and `str(cell).strip()` on each pass. Corpus.load() parses each data file
+once into:
+
+  Chapter   language, id, title, url, intro, content, blocks ("tables" first, then "blocks")
+  Block     kind ("table" / "grid" / "paragraph"), heading, headers, speak_col, content,
+            the column of each role (english / native / roman, -1 if none), rows
+  Row       view of one row: row.english / .native / .roman, or indexed like a tuple
+
+Cells are stripped and stored once per corpus: a StringTable keeps each distinct cell as
+a slice of a few large joined strings, and a block's rows are one flat array("I") of
+string ids. Other classes use __slots__. On the 22 data files this holds the corpus in
+~12 MB against ~28 MB for the parsed dicts, but loading is ~5-6x slower than the bare
+parse. Reading rows by role takes about as long as walking the dicts and resolving each
+table's role columns from its headers (walk_dicts()): the model resolves them once at load
+but slices each cell out on access. `python lesson_model.py bench` prints the current
+numbers.
+
+Chapters are indexed by (language, chapter id). Corpus.rows() yields (english, native,
+roman) -- or any subset of roles -- across languages without looking at headers again.
+The model is for reading; edit data files through patch_engine.py / bb_io.py. It pays
+off when one process keeps many languages in memory or queries rows by role
+(parallel_corpus.py); a single pass over one file, like build_phrases_dict_from_lessons.py,
+is faster on the plain dicts from bb_io.load_lessons().
+
+Roles: "english" is the column headed English, "roman" the transliteration /
+pronunciation column, "native" the speakCol or else the column headed with the language
+name (validate_lessons.COLUMN_NAMES for Meitei = "Manipuri").
+
+Usage:
+  from lesson_model import Corpus
+  corpus = Corpus.load()                       # or Corpus.load(["hindi", "urdu"])
+  ch = corpus[("hindi", 545)]
+  for en, native, roman in corpus.rows("hindi"):
+      ...
+
+  python lesson_model.py bench                 # load time + memory vs. plain dicts
+  python lesson_model.py show hindi 545
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+
+from bb_io import load_lessons
+from validate_lessons import COLUMN_NAMES, app_lesson_files, language_of
+
+BASE = Path(__file__).parent.resolve()
+ROLES = ("english", "native", "roman")
+
+_intern = sys.intern
+
+
+def _is_roman(header: str) -> bool:
+    h = header.lower()
+    return "translit" in h or h == "pronunciation"
+
+
+def column_roles(headers: tuple, speak_col: int | None, language: str) -> tuple[int, int, int]:
+    """(english, native, roman) column indexes for a table's headers; -1 when absent."""
+    lowered = [h.lower() for h in headers]
+    english = next((i for i, h in enumerate(lowered) if h.startswith("english")), -1)
+    roman = next((i for i, h in enumerate(lowered) if _is_roman(h)), -1)
+    native = -1
+    if speak_col is not None and 0 <= speak_col < len(headers) and speak_col not in (english, roman):
+        native = speak_col
+    else:
+        names = COLUMN_NAMES.get(language, (language,))
+        native = next((i for i, h in enumerate(lowered) if h.startswith(names)), -1)
+    return english, native, roman
+
+
+PAD = 0
+
+
+class StringTable:
+    """Distinct cell strings stored as a few joined str objects plus offset arrays.
+
+    A str object costs ~50-80 bytes on top of its characters; the corpus has ~135k
+    distinct cells, so keeping them as slices of one big string per character width
+    (ASCII / BMP / astral, so one emoji doesn't widen everything) roughly halves their
+    memory. ids are assigned while loading; freeze() builds the arrays. Id 0 (PAD) fills
+    the end of rows shorter than their table and reads as ""."""
+
+    __slots__ = ("_ids", "_pending", "_texts", "_where", "_start", "_end")
+
+    def __init__(self):
+        self._ids: dict[str, int] | None = {}
+        self._pending: list[str] | None = [""]
+        self._texts: list[str] = []
+        self._where = array("B")
+        self._start = array("I")
+        self._end = array("I")
+
+    def add(self, s: str) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = self._ids[s] = len(self._pending)
+            self._pending.append(s)
+        return i
+
+    def freeze(self):
+        if self._pending is None:
+            return
+        groups: list[list[str]] = [[], [], []]
+        where = array("B", bytes(len(self._pending)))
+        start = array("I", bytes(4 * len(self._pending)))
+        end = array("I", bytes(4 * len(self._pending)))
+        pos = [0, 0, 0]
+        for i, s in enumerate(self._pending):
+            g = 0 if s.isascii() else (1 if len(s.encode("utf-16-le")) == 2 * len(s) else 2)
+            groups[g].append(s)
+            where[i], start[i] = g, pos[g]
+            pos[g] += len(s)
+            end[i] = pos[g]
+        self._texts = ["".join(g) for g in groups]
+        self._where, self._start, self._end = where, start, end
+        self._ids = self._pending = None
+
+    def __getitem__(self, i: int) -> str:
+        return self._texts[self._where[i]][self._start[i]:self._end[i]]
+
+    def views(self) -> tuple:
+        """(texts, where, start, end) for inlined lookups in hot loops."""
+        return self._texts, self._where, self._start, self._end
+
+    def __len__(self) -> int:
+        return len(self._start) if self._pending is None else len(self._pending)
+
+
+class Block:
+    """One table / grid / paragraph. Cells are string-table ids in a flat row-major array."""
+
+    __slots__ = ("kind", "heading", "headers", "speak_col", "content", "roles", "width", "_cells", "_strings")
+
+    def __init__(self, strings: StringTable, kind: str, heading: str = "", headers: tuple = (),
+                 cells: array | None = None, width: int = 0, speak_col: int | None = None,
+                 content: str = "", roles: tuple = (-1, -1, -1)):
+        self._strings = strings
+        self.kind = kind
+        self.heading = heading
+        self.headers = headers
+        self._cells = cells if cells is not None else array("I")
+        self.width = width
+        self.speak_col = speak_col
+        self.content = content
+        self.roles = roles
+
+    @classmethod
+    def from_dict(cls, raw: dict, language: str, source: str, strings: StringTable) -> Block:
+        kind = raw.get("type") or ("table" if source == "tables" else "paragraph")
+        headers = tuple(_intern(str(h).strip()) for h in raw.get("headers") or raw.get("columns") or ())
+        rows = raw.get("rows") or ()
+        # Rows are padded / cut to the widest row so they can share one flat array.
+        width = max((len(r) for r in rows), default=0)
+        add = strings.add
+        cells = array("I")
+        for row in rows:
+            cells.extend([add(str(c).strip()) for c in row])
+            if len(row) < width:
+                cells.extend([PAD] * (width - len(row)))
+        speak_col = raw.get("speakCol")
+        roles = column_roles(headers, speak_col, language) if headers else (-1, -1, -1)
+        return cls(strings, kind, _intern(raw.get("heading") or ""), headers, cells, width, speak_col,
+                   raw.get("content") or "", roles)
+
+    def __len__(self) -> int:
+        return len(self._cells) // self.width if self.width else 0
+
+    def __iter__(self):
+        return (Row(self, r) for r in range(len(self)))
+
+    def row(self, r: int) -> tuple[str, ...]:
+        """Row r as in the data file (same length; cells stripped)."""
+        ids = self._cells[r * self.width:(r + 1) * self.width]
+        n = len(ids)
+        while n and ids[n - 1] == PAD:
+            n -= 1
+        s = self._strings
+        return tuple(s[i] for i in ids[:n])
+
+    @property
+    def rows(self) -> list[tuple[str, ...]]:
+        return [self.row(r) for r in range(len(self))]
+
+    def column(self, role: str) -> int:
+        return self.roles[ROLES.index(role)]
+
+    def cells(self, roles: tuple[str, ...] = ROLES):
+        """Rows as tuples of the given roles' cells ("" where the table lacks a role)."""
+        w, cells = self.width, self._cells
+        if not w:
+            return
+        idx = [self.roles[ROLES.index(r)] for r in roles]
+        idx = [i if i < w else -1 for i in idx]
+        texts, where, start, end = self._strings.views()
+        for r in range(0, len(cells), w):
+            out = []
+            for i in idx:
+                if i < 0:
+                    out.append("")
+                else:
+                    k = cells[r + i]
+                    out.append(texts[where[k]][start[k]:end[k]])
+            yield tuple(out)
+
+    def __repr__(self):
+        return f"Block({self.kind!r}, {self.heading!r}, {len(self)} rows)"
+
+
+class Row:
+    """View of one table row: row.english / row.native / row.roman, row[i], tuple(row)."""
+
+    __slots__ = ("block", "index")
+
+    def __init__(self, block: Block, index: int):
+        self.block = block
+        self.index = index
+
+    def _role(self, k: int) -> str:
+        col = self.block.roles[k]
+        if col < 0 or col >= self.block.width:
+            return ""
+        return self.block._strings[self.block._cells[self.index * self.block.width + col]]
+
+    english = property(lambda self: self._role(0))
+    native = property(lambda self: self._role(1))
+    roman = property(lambda self: self._role(2))
+
+    def __getitem__(self, i):
+        return self.block.row(self.index)[i]
+
+    def __len__(self) -> int:
+        return len(self.block.row(self.index))
+
+    def __iter__(self):
+        return iter(self.block.row(self.index))
+
+    def __repr__(self):
+        return f"Row{self.block.row(self.index)!r}"
+
+
+class Chapter:
+    __slots__ = ("language", "id", "title", "url", "intro", "content", "blocks")
+
+    def __init__(self, language: str, id: int, title: str = "", url: str = "", intro: str = "",
+                 content: str = "", blocks: tuple[Block, ...] = ()):
+        self.language = language
+        self.id = id
+        self.title = title
+        self.url = url
+        self.intro = intro
+        self.content = content
+        self.blocks = blocks
+
+    @classmethod
+    def from_dict(cls, raw: dict, language: str, strings: StringTable) -> Chapter:
+        blocks = []
+        for source in ("tables", "blocks"):
+            for b in raw.get(source) or ():
+                if isinstance(b, dict):
+                    blocks.append(Block.from_dict(b, language, source, strings))
+        return cls(language, raw["id"], _intern(raw.get("title") or ""), _intern(raw.get("url") or ""),
+                   raw.get("intro") or "", raw.get("content") or "", tuple(blocks))
+
+    def tables(self, kinds: tuple[str, ...] = ("table",)):
+        return (b for b in self.blocks if b.kind in kinds)
+
+    def __repr__(self):
+        return f"Chapter({self.language!r}, {self.id}, {self.title or self.url!r})"
+
+
+class Corpus:
+    """All chapters of the loaded languages, indexed by (language, chapter id)."""
+
+    def __init__(self):
+        self.languages: dict[str, list[Chapter]] = {}
+        self.files: dict[str, str] = {}
+        self.strings = StringTable()
+        self._index: dict[tuple[str, int], Chapter] = {}
+
+    @classmethod
+    def load(cls, targets: list[str] | None = None, base: Path = BASE) -> Corpus:
+        """Parse the data files once. targets: languages or data file names (default: all in app.js)."""
+        corpus = cls()
+        for name in _resolve(targets, base):
+            corpus.add(language_of(name), load_lessons(base / name), name)
+        corpus.strings.freeze()
+        return corpus
+
+    def add(self, language: str, chapters: list, file: str = ""):
+        """Add one language's parsed chapters (before the string table is frozen)."""
+        parsed = [Chapter.from_dict(ch, language, self.strings) for ch in chapters]
+        self.languages[language] = parsed
+        self.files[language] = file
+        for ch in parsed:
+            self._index[(language, ch.id)] = ch
+
+    def __getitem__(self, key: tuple[str, int]) -> Chapter:
+        return self._index[key]
+
+    def __contains__(self, key: tuple[str, int]) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, language: str, chapter_id: int) -> Chapter | None:
+        return self._index.get((language, chapter_id))
+
+    def chapters(self, language: str | None = None):
+        if language is not None:
+            return iter(self.languages[language])
+        return (ch for chapters in self.languages.values() for ch in chapters)
+
+    def rows(self, language: str | None = None, roles: tuple[str, ...] = ROLES,
+             kinds: tuple[str, ...] = ("table",)):
+        """Cells of the given roles for every table row, in chapter order."""
+        for ch in self.chapters(language):
+            for block in ch.tables(kinds):
+                yield from block.cells(roles)
+
+
+def _resolve(targets: list[str] | None, base: Path = BASE) -> list[str]:
+    files = [d for d, _ in app_lesson_files(base / "app.js")]
+    if not targets:
+        return files
+    by_lang = {language_of(f): f for f in files}
+    return [by_lang.get(t, t) for t in targets]
+
+
+def _measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, seconds, size
+
+
+def walk_dicts(data: dict[str, list], roles: tuple[str, ...] = ROLES):
+    """Corpus.rows() over parsed dicts ({language: chapters}): the same role columns,
+    resolved from the headers of each table, for the bench baseline."""
+    for language, chapters in data.items():
+        for ch in chapters:
+            for source in ("tables", "blocks"):
+                for blk in ch.get(source) or ():
+                    if not isinstance(blk, dict):
+                        continue
+                    if (blk.get("type") or ("table" if source == "tables" else "paragraph")) != "table":
+                        continue
+                    headers = tuple(str(h).strip() for h in blk.get("headers") or blk.get("columns") or ())
+                    cols = column_roles(headers, blk.get("speakCol"), language) if headers else (-1, -1, -1)
+                    idx = [cols[ROLES.index(r)] for r in roles]
+                    for row in blk.get("rows") or ():
+                        yield tuple(str(row[i]).strip() if 0 <= i < len(row) else "" for i in idx)
+
+
+def bench(targets: list[str] | None = None):
+    files = _resolve(targets)
+
+    dicts, t_dict, m_dict = _measure(lambda: {language_of(f): load_lessons(BASE / f) for f in files})
+    del dicts
+    corpus, t_model, m_model = _measure(lambda: Corpus.load(files))
+
+    # Timing without tracemalloc overhead
+    start = time.perf_counter()
+    data = {language_of(f): load_lessons(BASE / f) for f in files}
+    t_dict = time.perf_counter() - start
+    start = time.perf_counter()
+    corpus = Corpus.load(files)
+    t_model = time.perf_counter() - start
+
+    start = time.perf_counter()
+    n_dict = sum(1 for _ in walk_dicts(data))
+    w_dict = time.perf_counter() - start
+    start = time.perf_counter()
+    n_rows = sum(1 for _ in corpus.rows())
+    w_model = time.perf_counter() - start
+    if n_dict != n_rows:
+        print(f"warning: dict walk saw {n_dict} rows, the model {n_rows}")
+
+    print(f"{len(files)} file(s), {len(corpus)} chapters, {n_rows} table rows")
+    print(f"  {'':<14}{'load':>10}{'memory':>11}{'walk rows':>11}")
+    print(f"  {'dicts':<14}{t_dict * 1e3:>8.0f}ms{m_dict / 1e6:>9.1f}MB{w_dict * 1e3:>9.0f}ms")
+    print(f"  {'lesson_model':<14}{t_model * 1e3:>8.0f}ms{m_model / 1e6:>9.1f}MB{w_model * 1e3:>9.0f}ms")
+    print(f"  lesson_model: load {t_model / t_dict:.1f}x, memory {m_model / m_dict:.2f}x, "
+          f"walk {w_model / w_dict:.1f}x of dicts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Array-backed lesson corpus model")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_bench = sub.add_parser("bench", help="Load time and memory vs. plain dicts")
+    p_bench.add_argument("targets", nargs="*", help="Languages or data files (default: all)")
+    p_show = sub.add_parser("show", help="Print one chapter's tables by role")
+    p_show.add_argument("language")
+    p_show.add_argument("chapter", type=int)
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        bench(args.targets)
+        return
+    corpus = Corpus.load([args.language])
+    ch = corpus.get(args.language, args.chapter)
+    if ch is None:
+        raise SystemExit(f"{args.language}: no chapter {args.chapter}")
+    print(f"{ch.id} {ch.title or ch.url}")
+    for block in ch.blocks:
+        print(f"  [{block.kind}] {block.heading} roles={dict(zip(ROLES, block.roles))}")
+        for cells in block.cells():
+            print("    " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+/**
+ * Reader for binary lesson packs (.lpk) written by lesson_pack.py — see the format
+ * description there. Chapters come out identical to the data_*.json they were built from.
+ *
+ *   const pack = new LessonPack(await (await fetch(url)).arrayBuffer());
+ *   pack.chapters();      // every chapter, in file order
+ *   pack.chapter(545);    // one chapter, decoded on demand (null if absent)
+ *
+ * Loaded before app.js in index.html; also usable from Node (module.exports).
+ */
+(function (root) {
+  'use strict';
+
+  const MAGIC = 0x314b504c; // "LPK1"
+  const HEADER_SIZE = 24;
+  const TAG_NULL = 0, TAG_FALSE = 1, TAG_TRUE = 2, TAG_INT = 3, TAG_FLOAT = 4,
+    TAG_STR = 5, TAG_LIST = 6, TAG_OBJECT = 7, TAG_ROWS = 8;
+
+  function LessonPack(buffer) {
+    const view = new DataView(buffer);
+    if (buffer.byteLength < HEADER_SIZE || view.getUint32(0, true) !== MAGIC) {
+      throw new Error('not a lesson pack');
+    }
+    this.view = view;
+    this.bytes = new Uint8Array(buffer);
+    this.stringCount = view.getUint32(4, true);
+    this.chapterCount = view.getUint32(8, true);
+    this.blobStart = view.getUint32(12, true);
+    this.dataStart = view.getUint32(20, true);
+    this.strings = new Array(this.stringCount);
+    this.decoder = new TextDecoder('utf-8');
+    this.index = new Map();
+    const indexStart = view.getUint32(16, true);
+    for (let i = 0; i < this.chapterCount; i++) {
+      const at = indexStart + 12 * i;
+      this.index.set(view.getInt32(at, true), view.getUint32(at + 4, true));
+    }
+    this.pos = 0;
+  }
+
+  LessonPack.prototype.ids = function () {
+    return Array.from(this.index.keys());
+  };
+
+  LessonPack.prototype.chapter = function (id) {
+    const offset = this.index.get(id);
+    if (offset === undefined) return null;
+    this.pos = this.dataStart + offset;
+    return this.value();
+  };
+
+  LessonPack.prototype.chapters = function () {
+    const out = [];
+    for (const offset of this.index.values()) {
+      this.pos = this.dataStart + offset;
+      out.push(this.value());
+    }
+    return out;
+  };
+
+  LessonPack.prototype.string = function (i) {
+    let s = this.strings[i];
+    if (s === undefined) {
+      const at = HEADER_SIZE + 4 * i;
+      const start = this.blobStart + this.view.getUint32(at, true);
+      const end = this.blobStart + this.view.getUint32(at + 4, true);
+      s = this.strings[i] = this.decoder.decode(this.bytes.subarray(start, end));
+    }
+    return s;
+  };
+
+  LessonPack.prototype.varint = function () {
+    const bytes = this.bytes;
+    let b = bytes[this.pos++];
+    if (b < 0x80) return b;
+    let n = b & 0x7f, scale = 0x80;
+    do {
+      b = bytes[this.pos++];
+      n += (b & 0x7f) * scale; // not <<, which would overflow past 31 bits
+      scale *= 0x80;
+    } while (b >= 0x80);
+    return n;
+  };
+
+  LessonPack.prototype.value = function () {
+    const tag = this.bytes[this.pos++];
+    switch (tag) {
+      case TAG_STR:
+        return this.string(this.varint());
+      case TAG_ROWS: {
+        const width = this.varint(), count = this.varint();
+        const rows = new Array(count);
+        for (let r = 0; r < count; r++) rows[r] = new Array(width);
+        for (let c = 0; c < width; c++) {
+          for (let r = 0; r < count; r++) rows[r][c] = this.string(this.varint());
+        }
+        return rows;
+      }
+      case TAG_OBJECT: {
+        const n = this.varint(), obj = {};
+        for (let i = 0; i < n; i++) {
+          const key = this.string(this.varint());
+          obj[key] = this.value();
+        }
+        return obj;
+      }
+      case TAG_LIST: {
+        const n = this.varint(), items = new Array(n);
+        for (let i = 0; i < n; i++) items[i] = this.value();
+        return items;
+      }
+      case TAG_INT: {
+        const z = this.varint();
+        return z % 2 ? -(z + 1) / 2 : z / 2;
+      }
+      case TAG_FLOAT: {
+        const f = this.view.getFloat64(this.pos, true);
+        this.pos += 8;
+        return f;
+      }
+      case TAG_NULL: return null;
+      case TAG_FALSE: return false;
+      case TAG_TRUE: return true;
+      default:
+        throw new Error('lesson pack: bad tag ' + tag + ' at ' + (this.pos - 1));
+    }
+  };
+
+  root.LessonPack = LessonPack;
+  if (typeof module !== 'undefined' && module.exports) module.exports = LessonPack;
+})(typeof window !== 'undefined' ? window : globalThis);
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Compile lesson data files into a compact binary "lesson pack" (.lpk) and read them back.
+
+The data_*.json files repeat the same headers ("English", "Transliteration"), glosses,
+URLs and whole rows thousands of times, and a reader has to parse a whole file to reach
+one chapter. A pack stores every distinct string once and chapters as indexes into that
+table, with a chapter index up front for random access:
+
+  offset  size
+  0       4     magic "LPK1"
+  4       4     u32 string count S
+  8       4     u32 chapter count C
+  12      4     u32 start of the string blob
+  16      4     u32 start of the chapter index
+  20      4     u32 start of the chapter data
+  24      4*S+4 u32 string offsets into the blob (string i = blob[off[i]:off[i+1]], UTF-8)
+  ...           string blob
+  ...     12*C  chapter index: i32 id, u32 offset, u32 length (relative to chapter data)
+  ...           chapter data
+
+All integers are little-endian. Strings are ordered by frequency, so the common ones
+have one-byte indexes. A chapter is one value, encoded with a one-byte tag:
+
+  0 null  1 false  2 true  3 int (zigzag varint)  4 float (f64)  5 string (varint index)
+  6 list (varint n, n values)  7 object (varint n, n x (key index, value))
+  8 table rows: varint columns, varint rows, then columns x rows string indexes, column
+    by column (rows of equal width whose cells are all strings)
+
+LessonPack memory-maps a pack and decodes a chapter only when it is asked for;
+lesson_pack.js is the same reader for app.js. `bench` compares size and decode time with
+the JSON files (Node.js is used for the JS numbers when it is installed).
+
+Usage:
+  python lesson_pack.py build                    # every dataFile in app.js -> packs/<stem>.lpk
+  python lesson_pack.py build data_hindi.json -o /tmp/packs
+  python lesson_pack.py show packs/data_hindi.lpk 545
+  python lesson_pack.py bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import mmap
+import shutil
+import struct
+import subprocess
+import time
+from collections import Counter
+from pathlib import Path
+
+from bb_io import load_lessons, write_atomic
+from shard_lessons import app_data_files
+
+BASE = Path(__file__).parent.resolve()
+OUT_DIR = BASE / "packs"
+JS_READER = BASE / "lesson_pack.js"
+
+MAGIC = b"LPK1"
+HEADER = struct.Struct("<4s5I")
+INDEX_ENTRY = struct.Struct("<iII")
+NULL, FALSE, TRUE, INT, FLOAT, STR, LIST, OBJECT, ROWS = range(9)
+
+
+def _varint(n: int, out: bytearray):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _string_rows(value) -> int | None:
+    """Column count when `value` is a non-empty list of equal-width string rows."""
+    if not value or not isinstance(value[0], list) or not value[0]:
+        return None
+    width = len(value[0])
+    for row in value:
+        if not isinstance(row, list) or len(row) != width or not all(type(x) is str for x in row):
+            return None
+    return width
+
+
+def _count_strings(value, counts: Counter):
+    if type(value) is str:
+        counts[value] += 1
+    elif isinstance(value, list):
+        for item in value:
+            _count_strings(item, counts)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] += 1
+            _count_strings(item, counts)
+
+
+class _Encoder:
+    def __init__(self, strings: dict[str, int]):
+        self.strings = strings
+        self.out = bytearray()
+
+    def value(self, v):
+        out = self.out
+        if v is None:
+            out.append(NULL)
+        elif v is True or v is False:
+            out.append(TRUE if v else FALSE)
+        elif type(v) is int:
+            out.append(INT)
+            _varint((v << 1) ^ (v >> 63) if v < 0 else v << 1, out)
+        elif type(v) is float:
+            out.append(FLOAT)
+            out += struct.pack("<d", v)
+        elif type(v) is str:
+            out.append(STR)
+            _varint(self.strings[v], out)
+        elif isinstance(v, list):
+            width = _string_rows(v)
+            if width is not None:
+                out.append(ROWS)
+                _varint(width, out)
+                _varint(len(v), out)
+                for col in range(width):
+                    for row in v:
+                        _varint(self.strings[row[col]], out)
+            else:
+                out.append(LIST)
+                _varint(len(v), out)
+                for item in v:
+                    self.value(item)
+        elif isinstance(v, dict):
+            out.append(OBJECT)
+            _varint(len(v), out)
+            for key, item in v.items():
+                _varint(self.strings[key], out)
+                self.value(item)
+        else:
+            raise TypeError(f"can't pack {type(v).__name__}")
+
+
+def pack(chapters: list) -> bytes:
+    """Encode a lesson data file (list of chapters with integer ids) as a pack."""
+    counts = Counter()
+    for ch in chapters:
+        _count_strings(ch, counts)
+    ordered = [s for s, _ in counts.most_common()]
+    encoder = _Encoder({s: i for i, s in enumerate(ordered)})
+
+    index = []
+    for ch in chapters:
+        start = len(encoder.out)
+        encoder.value(ch)
+        index.append((ch["id"], start, len(encoder.out) - start))
+
+    blob = bytearray()
+    offsets = [0]
+    for s in ordered:
+        blob += s.encode("utf-8")
+        offsets.append(len(blob))
+
+    blob_start = HEADER.size + 4 * len(offsets)
+    index_start = blob_start + len(blob)
+    data_start = index_start + INDEX_ENTRY.size * len(index)
+    parts = [
+        HEADER.pack(MAGIC, len(ordered), len(index), blob_start, index_start, data_start),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        bytes(blob),
+        b"".join(INDEX_ENTRY.pack(*entry) for entry in index),
+        bytes(encoder.out),
+    ]
+    return b"".join(parts)
+
+
+class LessonPack:
+    """Read-only view of a .lpk file (or bytes); chapters are decoded on access."""
+
+    def __init__(self, source: Path | bytes):
+        if isinstance(source, (bytes, bytearray)):
+            self._file, self._mmap = None, None
+            self._buf = memoryview(source)
+        else:
+            self._file = open(source, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buf = memoryview(self._mmap)
+        magic, self.string_count, self.chapter_count, self._blob, index_start, self._data = \
+            HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            raise ValueError("not a lesson pack")
+        self._offsets = HEADER.size
+        self._strings: list[str | None] = [None] * self.string_count
+        self._index = {cid: (off, length) for cid, off, length in
+                       INDEX_ENTRY.iter_unpack(self._buf[index_start:self._data])}
+
+    def close(self):
+        self._buf.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.chapter_count
+
+    def __contains__(self, chapter_id: int) -> bool:
+        return chapter_id in self._index
+
+    def __iter__(self):
+        """Chapters in file order, one at a time."""
+        for cid in self._index:
+            yield self.chapter(cid)
+
+    def ids(self) -> list[int]:
+        return list(self._index)
+
+    def string(self, i: int) -> str:
+        s = self._strings[i]
+        if s is None:
+            a, b = struct.unpack_from("<II", self._buf, self._offsets + 4 * i)
+            s = self._strings[i] = str(self._buf[self._blob + a:self._blob + b], "utf-8")
+        return s
+
+    def chapter(self, chapter_id: int):
+        offset, length = self._index[chapter_id]
+        start = self._data + offset
+        value, end = self._value(self._buf, start)
+        if end != start + length:
+            raise ValueError(f"chapter {chapter_id}: decoded {end - start} of {length} bytes")
+        return value
+
+    def _value(self, buf, pos: int):
+        tag = buf[pos]
+        pos += 1
+        if tag == STR:
+            i, pos = _read_varint(buf, pos)
+            return self.string(i), pos
+        if tag == ROWS:
+            width, pos = _read_varint(buf, pos)
+            count, pos = _read_varint(buf, pos)
+            columns = []
+            for _ in range(width):
+                col = []
+                for _ in range(count):
+                    i, pos = _read_varint(buf, pos)
+                    col.append(self.string(i))
+                columns.append(col)
+            return [list(row) for row in zip(*columns)], pos
+        if tag == OBJECT:
+            n, pos = _read_varint(buf, pos)
+            obj = {}
+            for _ in range(n):
+                k, pos = _read_varint(buf, pos)
+                obj[self.string(k)], pos = self._value(buf, pos)
+            return obj, pos
+        if tag == LIST:
+            n, pos = _read_varint(buf, pos)
+            items = []
+            for _ in range(n):
+                item, pos = self._value(buf, pos)
+                items.append(item)
+            return items, pos
+        if tag == INT:
+            z, pos = _read_varint(buf, pos)
+            return (z >> 1) ^ -(z & 1), pos
+        if tag == FLOAT:
+            return struct.unpack_from("<d", buf, pos)[0], pos + 8
+        if tag in (NULL, FALSE, TRUE):
+            return (None, False, True)[tag], pos
+        raise ValueError(f"bad tag {tag} at {pos - 1}")
+
+
+def _read_varint(buf, pos: int):
+    b = buf[pos]
+    if b < 0x80:
+        return b, pos + 1
+    n, shift = 0, 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def build(names: list[str], out_dir: Path = OUT_DIR) -> list[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name in names:
+        src = BASE / name
+        data = pack(load_lessons(src))
+        dest = out_dir / f"{src.stem}.lpk"
+        write_atomic(dest, data)
+        written.append(dest)
+        print(f"{name}: {src.stat().st_size / 1024:.0f} KB -> {dest.name} {len(data) / 1024:.0f} KB")
+    return written
+
+
+def _best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+NODE_BENCH = r"""
+const fs = require('fs');
+const LessonPack = require(process.argv[1]);
+const [jsonPath, packPath, chapterId] = process.argv.slice(2);
+function best(fn) { let b = Infinity; for (let i = 0; i < 7; i++) { const t = process.hrtime.bigint(); fn(); b = Math.min(b, Number(process.hrtime.bigint() - t) / 1e6); } return b; }
+const text = fs.readFileSync(jsonPath, 'utf8');
+const buf = fs.readFileSync(packPath);
+const ab = buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.byteLength);
+const id = Number(chapterId);
+console.log(JSON.stringify({
+  json_all: best(() => JSON.parse(text)),
+  pack_all: best(() => new LessonPack(ab).chapters()),
+  json_one: best(() => JSON.parse(text).find(c => c.id === id)),
+  pack_one: best(() => new LessonPack(ab).chapter(id)),
+}));
+"""
+
+
+def bench(names: list[str]):
+    node = shutil.which("node") if JS_READER.exists() else None
+    tmp_dir = BASE / ".lesson_pack_bench"
+    tmp_dir.mkdir(exist_ok=True)
+    totals = Counter()
+    print(f"{'file':<22}{'json KB':>9}{'gz':>7}{'pack KB':>9}{'gz':>7}  "
+          f"{'py all json/pack ms':>20}{'py one json/pack ms':>21}"
+          + (f"{'js all json/pack ms':>21}{'js one json/pack ms':>21}" if node else ""))
+    try:
+        for name in names:
+            raw = (BASE / name).read_bytes()
+            chapters = json.loads(raw)
+            data = pack(chapters)
+            mid = chapters[len(chapters) // 2]["id"]
+            reader = LessonPack(data)
+            assert list(reader) == chapters, f"{name}: round trip differs"
+            reader.close()
+
+            py = (
+                _best_of(lambda: json.loads(raw)),
+                _best_of(lambda: list(LessonPack(data))),
+                _best_of(lambda: next(c for c in json.loads(raw) if c["id"] == mid)),
+                _best_of(lambda: LessonPack(data).chapter(mid)),
+            )
+            sizes = (len(raw), len(gzip.compress(raw, 9)), len(data), len(gzip.compress(data, 9)))
+            totals.update(dict(zip(("json", "json_gz", "pack", "pack_gz"), sizes)))
+            line = (f"{name:<22}{sizes[0] / 1024:>9.0f}{sizes[1] / 1024:>7.0f}{sizes[2] / 1024:>9.0f}"
+                    f"{sizes[3] / 1024:>7.0f}  {py[0] * 1e3:>9.1f} /{py[1] * 1e3:>8.1f}  "
+                    f"{py[2] * 1e3:>9.1f} /{py[3] * 1e3:>8.2f}")
+            if node:
+                pack_path = tmp_dir / f"{Path(name).stem}.lpk"
+                pack_path.write_bytes(data)
+                result = subprocess.run(
+                    [node, "-e", NODE_BENCH, str(JS_READER), str(BASE / name), str(pack_path), str(mid)],
+                    capture_output=True, text=True, check=True)
+                js = json.loads(result.stdout)
+                line += (f"  {js['json_all']:>9.1f} /{js['pack_all']:>8.1f}"
+                         f"  {js['json_one']:>9.1f} /{js['pack_one']:>8.2f}")
+            print(line)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"total: JSON {totals['json'] / 1e6:.1f} MB ({totals['json_gz'] / 1e6:.2f} MB gzip), "
+          f"packs {totals['pack'] / 1e6:.1f} MB ({totals['pack_gz'] / 1e6:.2f} MB gzip)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile / inspect / benchmark binary lesson packs")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Write packs for data files")
+    p_build.add_argument("files", nargs="*", help="Data files (default: every dataFile in app.js)")
+    p_build.add_argument("--output-dir", "-o", type=Path, default=OUT_DIR)
+    p_show = sub.add_parser("show", help="Print one chapter of a pack as JSON")
+    p_show.add_argument("pack", type=Path)
+    p_show.add_argument("chapter", type=int, nargs="?")
+    p_bench = sub.add_parser("bench", help="Size and decode time vs. the JSON files")
+    p_bench.add_argument("files", nargs="*")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build(args.files or app_data_files(), args.output_dir)
+    elif args.command == "show":
+        with LessonPack(args.pack) as reader:
+            if args.chapter is None:
+                print(f"{len(reader)} chapters, {reader.string_count} strings: {reader.ids()}")
+            else:
+                print(json.dumps(reader.chapter(args.chapter), ensure_ascii=False, indent=2))
+    else:
+        bench(args.files or app_data_files())
+
+
+if __name__ == "__main__":
+    main()
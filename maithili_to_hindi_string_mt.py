@@ -4,20 +4,29 @@ Build data_hindi.json from data_maithili.json by translating unique string value
 that contain Devanagari (Google Translate via deep-translator). English-only strings
 get Maithili→Hindi label fixes only. Preserves JSON structure.
 
+Unique strings are packed into index-tagged batches (string_batch.py), so one request
+carries up to --batch-size strings instead of one string per request.
+
 Usage:
   python maithili_to_hindi_string_mt.py
   python maithili_to_hindi_string_mt.py --limit-strings 80
+  python maithili_to_hindi_string_mt.py --batch-size 1     # old one-string-per-request behaviour
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import re
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 
+from response_cache import translate_cached
+from string_batch import (MAX_BATCH_CHARS, MAX_BATCH_ITEMS, BatchStats, tagged_accept, translate_unique, walk_collect,
+                          walk_replace)
+from bb_io import load_json, save_json
+
 BASE = Path(__file__).parent.resolve()
 SRC = BASE / "data_maithili.json"
 OUT = BASE / "data_hindi.json"
@@ -25,27 +34,6 @@ OUT = BASE / "data_hindi.json"
 DEVA = re.compile(r"[\u0900-\u097F]")
 
 
-def walk_collect(obj, acc: set[str]):
-    if isinstance(obj, str):
-        acc.add(obj)
-    elif isinstance(obj, dict):
-        for v in obj.values():
-            walk_collect(v, acc)
-    elif isinstance(obj, list):
-        for v in obj:
-            walk_collect(v, acc)
-
-
-def walk_replace(obj, mapping: dict[str, str]):
-    if isinstance(obj, str):
-        return mapping.get(obj, obj)
-    if isinstance(obj, dict):
-        return {k: walk_replace(v, mapping) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [walk_replace(v, mapping) for v in obj]
-    return obj
-
-
 def label_normalize(s: str) -> str:
     for old, new in [
         ("Maithili", "Hindi"),
@@ -79,7 +67,9 @@ def main():
     parser.add_argument("--input", type=Path, default=SRC)
     parser.add_argument("--output", type=Path, default=OUT)
     parser.add_argument("--limit-strings", type=int, default=0, help="Max Devanagari strings (0=all)")
-    parser.add_argument("--sleep", type=float, default=0.25)
+    parser.add_argument("--sleep", type=float, default=0.25, help="Seconds between requests")
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_ITEMS, help="Max strings per request")
+    parser.add_argument("--batch-chars", type=int, default=MAX_BATCH_CHARS, help="Max characters per request")
     args = parser.parse_args()
 
     try:
@@ -88,37 +78,45 @@ def main():
         print("pip install deep-translator", file=sys.stderr)
         sys.exit(1)
 
-    data = json.loads(args.input.read_text(encoding="utf-8"))
-    unique: set[str] = set()
+    data = load_json(args.input)
+    unique: Counter = Counter()
     for ch in data:
         walk_collect(ch, unique)
 
-    norm_set = {label_normalize(s) for s in unique}
-    to_translate = sorted(ns for ns in norm_set if should_translate(ns))
+    norm_counts: Counter = Counter()
+    for s, c in unique.items():
+        ns = label_normalize(s)
+        if should_translate(ns):
+            norm_counts[ns] += c
+    to_translate = sorted(norm_counts)
     if args.limit_strings:
         to_translate = to_translate[: args.limit_strings]
+        norm_counts = Counter({s: norm_counts[s] for s in to_translate})
 
     print(f"Translating {len(to_translate)} unique Devanagari strings to Hindi...")
 
     tr = GoogleTranslator(source="auto", target="hi")
-    mapping_tr: dict[str, str] = {}
-    for i, s in enumerate(to_translate):
-        if i % 100 == 0:
-            print(f"  {i}/{len(to_translate)}")
-        try:
-            hi = tr.translate(s)
-            mapping_tr[s] = hi if hi else s
-        except Exception as e:
-            print(f"  warn: {e!r}", file=sys.stderr)
-            mapping_tr[s] = s
+
+    def send(text: str) -> str:
+        out = translate_cached(tr, text, accept=tagged_accept(text))
         time.sleep(args.sleep)
+        return out
+
+    stats = BatchStats(norm_counts)
+    mapping_tr = translate_unique(
+        to_translate, send, stats,
+        max_chars=args.batch_chars, max_items=args.batch_size,
+        progress=lambda i, n: print(f"  batch {i + 1}/{n}") if i % 10 == 0 else None,
+    )
+    mapping_tr = {s: t for s, t in mapping_tr.items() if t}
+    print(f"  {stats.report()}")
 
     per_original: dict[str, str] = {}
     for s in unique:
         per_original[s] = map_string(s, mapping_tr)
 
     out_data = walk_replace(data, per_original)
-    args.output.write_text(json.dumps(out_data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_json(args.output, out_data)
     print(f"Wrote {args.output}")
 
 
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Meitei Mayek → Roman transliteration, shared by the Meitei populate / upgrade scripts.
+
+populate_script, populate_vocab, populate_grammar_lessons, populate_patterns_part1/2,
+populate_convo1/2 and upgrade_meitei_sentence_tables each carried their own copy of these
+tables and of a character loop (m2r / mayek_to_roman / transliterate_meitei) that
+looked every code point up in up to seven dicts and peeked at the next one. Here the
+rules are compiled once at import into a small state machine that runs in C:
+
+  - TABLE (str.translate) maps each code point to its Roman value plus a marker for the
+    context it still needs: a consonant's inherent "a", an independent vowel that a sign
+    may replace or extend, a vowel sign, apun (virama);
+  - RESOLVE, a fixed sequence of str.replace passes, settles each marker against the
+    one that follows it (consonant + sign / apun drops the "a", and so on);
+  - strings without any Mayek skip both, and whole strings are memoized (lru_cache):
+    lesson tables repeat the same words and sentences.
+
+Output is identical to the old loop: consonants carry an inherent "a" unless a sign or
+apun follows, ꯪ is "ang" (after ꯏ / ꯎ just "ng"), digits and ꯫ ꯬ become ASCII, and the
+same spacing clean-up runs at the end. `python meitei_translit.py bench` checks that on
+every string of data_meitei.json plus random Mayek sequences, and reports strings per
+second for both.
+
+Usage:
+  from meitei_translit import transliterate, transliterate_many
+  transliterate("ꯑꯩꯒꯤ ꯃꯤꯡ")                  # "eigi ming"
+  transliterate_many(mayek_cells)             # list in, list out; duplicates done once
+
+  python meitei_translit.py "ꯊꯥꯒꯠꯆꯔꯤ"
+  python meitei_translit.py bench [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+
+INDEPENDENT = {"ꯑ": "a", "ꯏ": "i", "ꯎ": "u"}
+CONSONANTS = {
+    "ꯀ": "k", "ꯁ": "s", "ꯂ": "l", "ꯃ": "m", "ꯄ": "p", "ꯅ": "n",
+    "ꯆ": "ch", "ꯇ": "t", "ꯈ": "kh", "ꯉ": "ng", "ꯊ": "th", "ꯋ": "w",
+    "ꯌ": "y", "ꯍ": "h", "ꯐ": "ph", "ꯒ": "g", "ꯓ": "jh", "ꯔ": "r",
+    "ꯕ": "b", "ꯖ": "j", "ꯗ": "d", "ꯘ": "gh", "ꯙ": "dh", "ꯚ": "bh",
+}
+LONSUM = {"ꯛ": "k", "ꯜ": "l", "ꯝ": "m", "ꯞ": "p", "ꯟ": "n", "ꯠ": "t", "ꯡ": "ng", "ꯢ": "i"}
+VOWEL_SIGNS = {"ꯥ": "aa", "ꯤ": "i", "ꯨ": "u", "ꯦ": "e", "ꯣ": "o", "ꯧ": "ou", "ꯩ": "ei", "ꯪ": "ng"}
+DIGITS = {"꯰": "0", "꯱": "1", "꯲": "2", "꯳": "3", "꯴": "4", "꯵": "5", "꯶": "6", "꯷": "7", "꯸": "8", "꯹": "9"}
+PUNCT = {"꯫": ".", "꯬": "!"}
+APUN = "꯭"
+ANUSVARA = "ꯪ"
+
+CLEANUP = [("  ", " "), (" .", "."), (" !", "!"), (" ?", "?")]
+
+CACHE_SIZE = 1 << 16
+
+# Markers (control characters, never in lesson text) and what each waits for.
+_CONS = "\x01"     # after a consonant: inherent "a", dropped before a sign or apun
+_SIGN = "\x02"     # before a vowel sign
+_APUN = "\x03"     # apun: nothing, but ends the consonant before it
+_A = "\x04"        # independent ꯑ: "a", or just the sign that follows
+_IU = "\x05"       # after independent ꯏ / ꯎ: before ꯪ the sign is "ng", not "ang"
+_ANG = "\x06"      # the "a" of ꯪ's "ang"
+
+MAYEK = re.compile("[\uabc0-\uabff]")
+_MARKERS = re.compile("[\x01-\x06]")
+
+
+def _sign(sign: str) -> str:
+    return "ang" if sign == ANUSVARA else VOWEL_SIGNS[sign]
+
+
+def _compile() -> tuple[dict[int, str], list[tuple[str, str]]]:
+    table = {**DIGITS, **PUNCT, **LONSUM}
+    table.update({c: base + _CONS for c, base in CONSONANTS.items()})
+    table.update({s: _SIGN + (_ANG + "ng" if s == ANUSVARA else out) for s, out in VOWEL_SIGNS.items()})
+    table[APUN] = _APUN
+    table["ꯑ"] = _A
+    table.update({v: base + _IU for v, base in INDEPENDENT.items() if v != "ꯑ"})
+    resolve = [
+        (_CONS + _APUN, ""), (_CONS + _SIGN, ""), (_CONS, "a"),
+        (_A + _SIGN, ""), (_A, "a"),
+        (_IU + _SIGN + _ANG, ""), (_IU + _SIGN, ""), (_IU, ""),
+        (_SIGN, ""), (_ANG, "a"), (_APUN, ""),
+    ]
+    return str.maketrans(table), resolve + CLEANUP
+
+
+TABLE, RESOLVE = _compile()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def transliterate(text: str) -> str:
+    """Roman transliteration of Meitei Mayek text; other characters pass through."""
+    if MAYEK.search(text) is None:
+        steps = CLEANUP
+    elif _MARKERS.search(text) is None:
+        text, steps = text.translate(TABLE), RESOLVE
+    else:  # text already holds a marker character: the slow loop can't be confused by it
+        return _reference(text)
+    for old, new in steps:
+        text = text.replace(old, new)
+    return text.strip()
+
+
+def transliterate_many(texts) -> list[str]:
+    """transliterate() over a list; each distinct string is done once."""
+    done = {t: transliterate(t) for t in dict.fromkeys(texts)}
+    return [done[t] for t in texts]
+
+
+def cache_info():
+    return transliterate.cache_info()
+
+
+def _reference(text: str) -> str:
+    """The per-character loop the populate scripts used to carry: the bench baseline, and
+    the fallback for text that already contains a marker character."""
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch in DIGITS:
+            out.append(DIGITS[ch])
+        elif ch in PUNCT:
+            out.append(PUNCT[ch])
+        elif ch.isspace():
+            out.append(ch)
+        elif ch in INDEPENDENT:
+            if i + 1 < len(text) and text[i + 1] in VOWEL_SIGNS:
+                sign = text[i + 1]
+                if ch == "ꯑ":
+                    out.append(_sign(sign))
+                else:
+                    out.append(INDEPENDENT[ch] + ("ng" if sign == ANUSVARA else VOWEL_SIGNS[sign]))
+                i += 1
+            else:
+                out.append(INDEPENDENT[ch])
+        elif ch in CONSONANTS:
+            base = CONSONANTS[ch]
+            if i + 1 < len(text) and text[i + 1] == APUN:
+                out.append(base)
+                i += 1
+            elif i + 1 < len(text) and text[i + 1] in VOWEL_SIGNS:
+                out.append(base + _sign(text[i + 1]))
+                i += 1
+            else:
+                out.append(base + "a")
+        elif ch in VOWEL_SIGNS:
+            out.append(_sign(ch))
+        elif ch in LONSUM:
+            out.append(LONSUM[ch])
+        elif ch == APUN:
+            pass
+        else:
+            out.append(ch)
+        i += 1
+    roman = "".join(out)
+    for old, new in CLEANUP:
+        roman = roman.replace(old, new)
+    return roman.strip()
+
+
+def corpus_strings(path: Path = BASE / "data_meitei.json") -> list[str]:
+    """Every string value in the file (cells, headings, titles, ...), in order."""
+    from bb_io import load_json
+
+    out = []
+
+    def walk(obj):
+        if isinstance(obj, str):
+            out.append(obj)
+        elif isinstance(obj, list):
+            for v in obj:
+                walk(v)
+        elif isinstance(obj, dict):
+            for v in obj.values():
+                walk(v)
+
+    walk(load_json(path))
+    return out
+
+
+def _fuzz(n: int, seed: int = 1) -> list[str]:
+    """Random Mayek sequences, including the odd orders lesson text never has."""
+    import random
+
+    alphabet = "".join([*INDEPENDENT, *CONSONANTS, *LONSUM, *VOWEL_SIGNS, *DIGITS, *PUNCT, APUN, " .?!a"])
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))) for _ in range(n)]
+
+
+def bench(repeat: int = 5, path: Path = BASE / "data_meitei.json"):
+    strings = corpus_strings(path)
+    mayek = [s for s in strings if MAYEK.search(s)]
+
+    def best(fn, clear: bool = True) -> float:
+        times = []
+        for _ in range(repeat):
+            if clear:
+                transliterate.cache_clear()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    print(f"{path.name}: {len(strings)} strings ({len(mayek)} with Mayek, {len(set(mayek))} distinct), "
+          f"{sum(map(len, strings)) / 1e3:.0f}k chars")
+    for label, subset in (("all strings", strings), ("Mayek strings", mayek)):
+        old = best(lambda: [_reference(s) for s in subset])
+        cold = best(lambda: [transliterate(s) for s in subset])
+        many = best(lambda: transliterate_many(subset))
+        warm = best(lambda: [transliterate(s) for s in subset], clear=False)
+        print(f"  {label}:")
+        for name, seconds in (("per-char loop (old)", old), ("transliterate, cold", cold),
+                              ("transliterate_many, cold", many), ("transliterate, memoized", warm)):
+            print(f"    {name:<26}{seconds * 1e3:>7.1f} ms {len(subset) / seconds:>12,.0f} strings/s "
+                  f"{old / seconds:>6.1f}x")
+
+    transliterate.cache_clear()
+    fuzz = _fuzz(100_000)
+    bad = [s for s in strings + fuzz if transliterate(s) != _reference(s)]
+    print(f"  identical to the old loop on the corpus + {len(fuzz)} random sequences: {not bad}"
+          + (f" ({len(bad)} differ, e.g. {bad[0]!r})" if bad else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Meitei Mayek → Roman transliteration")
+    parser.add_argument("text", nargs="*", help="Text to transliterate, or `bench`")
+    parser.add_argument("--repeat", "-n", type=int, default=5, help="bench: runs per case (best is shown)")
+    args = parser.parse_args()
+    if args.text == ["bench"]:
+        bench(args.repeat)
+        return
+    for text in args.text:
+        print(transliterate(text))
+
+
+if __name__ == "__main__":
+    main()
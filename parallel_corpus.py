@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Cross-language parallel corpus keyed by English gloss.
+
+Every lesson table and phrasebook pairs an English string with its native text and
+romanization, and the phrasebooks deliberately share English keys across languages.
+This store collects those alignments from all data*.json lessons (through
+lesson_model.py, by column role) and all *_data.js phrasebooks:
+
+  English → {language: [Alignment(english, native, roman, source, chapter), ...]}
+
+It lives in parallel_corpus.sqlite and is refreshed incrementally. A source file is only
+re-read when its size or mtime changed, and then only its own rows are replaced. On open
+the rows are indexed in memory: a dict on the normalized English key (casefolded,
+whitespace collapsed, outer punctuation stripped, so "Thank you!" finds "Thank you") and
+a sorted key list for prefix lookups. Per (key, language), alignments with a
+romanization come first, then phrasebook entries, then lesson rows in file order. Rows
+whose "translation" is just the English are skipped.
+
+Builders query it before translating: TranslateClient(aligned=...) (the phrasebook
+builders) and translate_pipeline.py --mode compact take native text for English keys
+the target language already has, and only send the rest.
+
+Usage:
+  from parallel_corpus import ParallelCorpus
+  corpus = ParallelCorpus.open()               # refreshes changed sources
+  corpus.lookup("Thank you", "kannada")        # best Alignment or None
+  corpus.lookup_all("Thank you")               # {language: Alignment}
+  corpus.prefix("good m", "tamil")
+
+  python parallel_corpus.py build              # refresh; --rebuild re-reads everything
+  python parallel_corpus.py coverage
+  python parallel_corpus.py lookup "Thank you" [--lang kannada]
+  python parallel_corpus.py prefix "good m" [--lang tamil]
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import re
+import sqlite3
+from collections import namedtuple
+from pathlib import Path
+
+from bb_io import load_lessons
+
+BASE = Path(__file__).parent.resolve()
+DEFAULT_DB = BASE / "parallel_corpus.sqlite"
+
+Alignment = namedtuple("Alignment", ["english", "native", "roman", "source", "chapter"])
+
+# { en: "...", mr: "...", roman: "..." } in both the one-line and the quoted-key layout.
+_JS_STR = r'("(?:\\.|[^"\\])*")'
+PHRASE_PAT = re.compile(
+    rf'"?en"?\s*:\s*{_JS_STR}\s*,\s*"?mr"?\s*:\s*{_JS_STR}\s*,\s*"?roman"?\s*:\s*{_JS_STR}'
+)
+_OUTER_PUNCT = " \t\n.!?,;:…\"'“”‘’()"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path     TEXT PRIMARY KEY,
+    stamp    TEXT NOT NULL,
+    language TEXT NOT NULL,
+    kind     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pairs (
+    key      TEXT NOT NULL,
+    english  TEXT NOT NULL,
+    language TEXT NOT NULL,
+    native   TEXT NOT NULL,
+    roman    TEXT NOT NULL,
+    source   TEXT NOT NULL,
+    chapter  INTEGER,
+    seq      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pairs_source ON pairs (source);
+"""
+
+
+def key_of(english: str) -> str:
+    """Lookup key: casefolded, single spaces, no surrounding punctuation."""
+    return " ".join(english.split()).strip(_OUTER_PUNCT).casefold()
+
+
+def _stamp(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def source_files(base: Path = BASE) -> list[tuple[Path, str, str]]:
+    """(path, language, kind) for every lesson file and phrasebook, kind "lessons" / "phrasebook"."""
+    out = []
+    for path in sorted(base.glob("data*.json")):
+        stem = path.stem
+        out.append((path, "marathi" if stem == "data" else stem[len("data_"):], "lessons"))
+    for path in sorted(base.glob("*_data.js")):
+        out.append((path, path.name[:-len("_data.js")], "phrasebook"))
+    return out
+
+
+def extract_lessons(path: Path, language: str):
+    """(english, native, roman, chapter) for every table row with English and native cells."""
+    from lesson_model import ROLES, Corpus
+
+    corpus = Corpus()
+    corpus.add(language, load_lessons(path), path.name)
+    corpus.strings.freeze()
+    for chapter in corpus.chapters():
+        for block in chapter.tables():
+            english, native, _ = block.roles
+            if english < 0 or native < 0:
+                continue
+            for en, nat, rom in block.cells(ROLES):
+                yield en, nat, rom, chapter.id
+
+
+def extract_phrasebook(path: Path):
+    """(english, native, roman, None) for every phrase / word entry of a <lang>_data.js."""
+    text = path.read_text(encoding="utf-8")
+    for m in PHRASE_PAT.finditer(text):
+        en, native, roman = (json.loads(g) for g in m.groups())
+        yield en.strip(), native.strip(), roman.strip(), None
+
+
+class ParallelCorpus:
+    """English-keyed alignments across languages, backed by SQLite, indexed in memory."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._by_key: dict[str, dict[str, list[Alignment]]] = {}
+        self._keys: list[str] = []
+        self.languages: list[str] = []
+
+    @classmethod
+    def open(cls, path=DEFAULT_DB, base: Path = BASE, refresh: bool = True) -> ParallelCorpus:
+        corpus = cls(path)
+        if refresh:
+            corpus.refresh(base)
+        corpus.load()
+        return corpus
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def refresh(self, base: Path = BASE, rebuild: bool = False) -> list[str]:
+        """Re-read sources that are new or changed (all with rebuild); drop vanished ones.
+        Returns the names of the files re-read."""
+        files = source_files(base)
+        known = dict(self._conn.execute("SELECT path, stamp FROM sources"))
+        present = {p.name for p, _, _ in files}
+        changed = []
+        with self._conn:
+            for name in set(known) - present:
+                self._conn.execute("DELETE FROM pairs WHERE source = ?", (name,))
+                self._conn.execute("DELETE FROM sources WHERE path = ?", (name,))
+            for path, language, kind in files:
+                stamp = _stamp(path)
+                if not rebuild and known.get(path.name) == stamp:
+                    continue
+                try:
+                    rows = list(extract_lessons(path, language) if kind == "lessons" else extract_phrasebook(path))
+                except ValueError as e:  # not a lesson list / unreadable JSON: skip, retry next time
+                    print(f"  {path.name}: skipped ({e})")
+                    continue
+                self._conn.execute("DELETE FROM pairs WHERE source = ?", (path.name,))
+                self._conn.executemany(
+                    "INSERT INTO pairs (key, english, language, native, roman, source, chapter, seq) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(key_of(en), en, language, nat, rom, path.name, ch, seq)
+                     for seq, (en, nat, rom, ch) in enumerate(rows)
+                     if en and nat and key_of(en) and key_of(nat) != key_of(en)],
+                )
+                self._conn.execute("INSERT OR REPLACE INTO sources (path, stamp, language, kind) VALUES (?, ?, ?, ?)",
+                                   (path.name, stamp, language, kind))
+                changed.append(path.name)
+        return changed
+
+    def load(self):
+        """Build the in-memory key and prefix indexes from the store."""
+        kinds = dict(self._conn.execute("SELECT path, kind FROM sources"))
+        rows = self._conn.execute(
+            "SELECT key, english, language, native, roman, source, chapter FROM pairs ORDER BY source, seq"
+        ).fetchall()
+
+        def rank(row):
+            return (row[4] == "", kinds.get(row[5]) != "phrasebook")
+
+        by_key: dict[str, dict[str, list[Alignment]]] = {}
+        for row in sorted(rows, key=rank):  # stable: file order within each rank
+            key, en, language, native, roman, source, chapter = row
+            by_key.setdefault(key, {}).setdefault(language, []).append(
+                Alignment(en, native, roman, source, chapter))
+        self._by_key = by_key
+        self._keys = sorted(by_key)
+        self.languages = sorted({lang for langs in by_key.values() for lang in langs})
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, english: str) -> bool:
+        return key_of(english) in self._by_key
+
+    def lookup(self, english: str, language: str, exclude=()) -> Alignment | None:
+        """Best alignment of `english` in `language`, ignoring sources named in `exclude`."""
+        for a in self._by_key.get(key_of(english), {}).get(language, ()):
+            if a.source not in exclude:
+                return a
+        return None
+
+    def lookup_all(self, english: str) -> dict[str, Alignment]:
+        """{language: best Alignment} for every language that has `english`."""
+        return {lang: found[0] for lang, found in self._by_key.get(key_of(english), {}).items()}
+
+    def candidates(self, english: str, language: str) -> list[Alignment]:
+        return list(self._by_key.get(key_of(english), {}).get(language, ()))
+
+    def prefix(self, text: str, language: str | None = None, limit: int = 20) -> list[tuple[str, dict]]:
+        """(key, {language: Alignment}) for keys starting with `text`, in key order."""
+        start = key_of(text) if text.strip(_OUTER_PUNCT) else ""
+        out = []
+        for i in range(bisect.bisect_left(self._keys, start), len(self._keys)):
+            key = self._keys[i]
+            if not key.startswith(start) or len(out) >= limit:
+                break
+            langs = self._by_key[key]
+            if language is None:
+                out.append((key, {lang: found[0] for lang, found in langs.items()}))
+            elif language in langs:
+                out.append((key, {language: langs[language][0]}))
+        return out
+
+    def pairs(self, language: str) -> dict[str, Alignment]:
+        """{key: best Alignment} for one language."""
+        return {key: langs[language][0] for key, langs in self._by_key.items() if language in langs}
+
+    def coverage(self, keys=None) -> list[tuple[str, int, int, int]]:
+        """(language, keys aligned, of which romanized, sources) per language. `keys` restricts
+        the count to those English strings (e.g. one phrasebook's keys)."""
+        wanted = None if keys is None else {key_of(k) for k in keys}
+        sources = dict(self._conn.execute("SELECT language, COUNT(*) FROM sources GROUP BY language"))
+        out = []
+        for language in self.languages:
+            aligned = romanized = 0
+            for key, langs in self._by_key.items():
+                if language in langs and (wanted is None or key in wanted):
+                    aligned += 1
+                    romanized += bool(langs[language][0].roman)
+            out.append((language, aligned, romanized, sources.get(language, 0)))
+        return out
+
+    def close(self):
+        self._conn.close()
+
+
+def aligned_lookup(corpus: ParallelCorpus, language: str, exclude=()):
+    """lookup(english) -> native or None: the hook TranslateClient(aligned=...) takes."""
+    def lookup(english: str) -> str | None:
+        found = corpus.lookup(english, language, exclude)
+        return found.native if found else None
+
+    return lookup
+
+
+def aligned_pair_lookup(corpus: ParallelCorpus, language: str, exclude=()):
+    """lookup(english) -> (native, roman) or None, only for romanized alignments
+    (the hook translate_pipeline.translate_chapter_compact(aligned=...) takes)."""
+    def lookup(english: str) -> tuple[str, str] | None:
+        found = corpus.lookup(english, language, exclude)
+        return (found.native, found.roman) if found and found.roman else None
+
+    return lookup
+
+
+def print_coverage(corpus: ParallelCorpus, keys_from: Path | None = None):
+    keys = None
+    if keys_from is not None:
+        keys = [en for en, _, _, _ in extract_phrasebook(keys_from)]
+        total = len({key_of(k) for k in keys})
+        print(f"{total} English keys from {keys_from.name}")
+    else:
+        total = len(corpus)
+        print(f"{total} English keys, {len(corpus.languages)} languages")
+    print(f"  {'language':<12}{'aligned':>9}{'%':>6}{'romanized':>11}{'sources':>9}")
+    for language, aligned, romanized, sources in corpus.coverage(keys):
+        pct = 100 * aligned / total if total else 0
+        print(f"  {language:<12}{aligned:>9}{pct:>5.0f}%{romanized:>11}{sources:>9}")
+
+
+def _print_alignments(found: dict[str, Alignment]):
+    for language, a in sorted(found.items()):
+        where = a.source + (f"#{a.chapter}" if a.chapter is not None else "")
+        print(f"  {language:<12}{a.native}" + (f"  ({a.roman})" if a.roman else "") + f"  [{where}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="English-keyed parallel corpus of lessons and phrasebooks")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Refresh from changed data*.json / *_data.js files")
+    p_build.add_argument("--rebuild", action="store_true", help="Re-read every source")
+    p_cov = sub.add_parser("coverage", help="Aligned English keys per language")
+    p_cov.add_argument("--keys-from", type=Path, help="Count only the keys of this phrasebook (e.g. hindi_data.js)")
+    p_lookup = sub.add_parser("lookup", help="Alignments of one English string")
+    p_lookup.add_argument("english")
+    p_lookup.add_argument("--lang")
+    p_prefix = sub.add_parser("prefix", help="English keys starting with a prefix")
+    p_prefix.add_argument("text")
+    p_prefix.add_argument("--lang")
+    p_prefix.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with ParallelCorpus(args.db) as corpus:
+        changed = corpus.refresh(rebuild=args.command == "build" and args.rebuild)
+        if args.command == "build" or changed:
+            print(f"{len(changed)} source(s) re-read" + (f": {', '.join(changed)}" if changed else ""))
+        corpus.load()
+        if args.command == "build":
+            print(f"{len(corpus)} English keys, {len(corpus.languages)} languages -> {corpus.path}")
+        elif args.command == "coverage":
+            keys_from = args.keys_from
+            if keys_from is not None and not keys_from.is_absolute():
+                keys_from = BASE / keys_from
+            print_coverage(corpus, keys_from)
+        elif args.command == "lookup":
+            found = corpus.lookup_all(args.english)
+            if args.lang:
+                found = {k: v for k, v in found.items() if k == args.lang}
+            if not found:
+                raise SystemExit(f"no alignment for {args.english!r}")
+            _print_alignments(found)
+        else:
+            for key, found in corpus.prefix(args.text, args.lang, args.limit):
+                print(key)
+                _print_alignments(found)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Apply the lesson populate / patch modules to a data_<lang>.json in one load and one write.
+
+The populate_odia_s*, populate_santali_s*, populate_sindhi_s*, expand_section*_nepali,
+strip_nepali_meta and patch_kashmiri_section2_lessons modules used to each parse the
+whole data file, search chapters linearly, mutate them and rewrite the file. They now
+only declare their changes:
+
+  DATA_FILE = "data_odia.json"
+  def patches() -> list:    # SetFields / ReplaceRows / Transform, applied in order
+
+PatchEngine loads the file once, indexes chapters by id, applies every module of the
+chain in order, validates the result (the shape checks of validate_lessons.py: unique int
+ids, rows are lists of strings as wide as the headers, ...) and writes it atomically
+once (bb_io.save_lessons), only if it changed. Chains for different languages run
+in separate processes. Each module still runs on its own (python populate_odia_s3a.py).
+
+Usage:
+  python patch_engine.py                    # every chain in CHAINS
+  python patch_engine.py odia sindhi
+  python patch_engine.py --check            # apply + validate, don't write
+  python patch_engine.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bb_io import dumps, load_lessons, save_lessons
+from validate_lessons import check_chapters, format_diagnostic
+
+BASE = Path(__file__).parent.resolve()
+
+# Modules applied to each data file, in order (same order as the build_runner.py rules).
+CHAINS = {
+    "data_odia.json": [
+        "populate_odia_s1", "populate_odia_s2", "populate_odia_s3a", "populate_odia_s3b",
+        "populate_odia_s3c", "populate_odia_s4", "populate_odia_s5a", "populate_odia_s5b",
+    ],
+    "data_santali.json": [
+        "populate_santali_s1", "populate_santali_s2", "populate_santali_s3a", "populate_santali_s3b",
+        "populate_santali_s3c", "populate_santali_s4", "populate_santali_s5a", "populate_santali_s5b",
+    ],
+    "data_sindhi.json": [
+        "populate_sindhi_s1", "populate_sindhi_s2", "populate_sindhi_s3a", "populate_sindhi_s3b",
+        "populate_sindhi_s3c", "populate_sindhi_s4", "populate_sindhi_s5a", "populate_sindhi_s5b",
+        "populate_sindhi_s5c",
+    ],
+    "data_nepali.json": ["expand_section2_nepali", "expand_section3_nepali", "strip_nepali_meta"],
+    "data_kashmiri.json": ["patch_kashmiri_section2_lessons"],
+}
+
+_MISSING = object()
+
+PatchStats = namedtuple("PatchStats", ["module", "patches", "changed", "created", "missing"])
+
+
+def _tables(chapter: dict):
+    for key in ("blocks", "tables"):
+        for block in chapter.get(key) or []:
+            if isinstance(block, dict):
+                yield block
+
+
+def validate(chapters, file: str = "") -> list[str]:
+    """Structural errors in lesson data (validate_lessons.py shape checks; empty when fine)."""
+    return [format_diagnostic(d) for d in check_chapters(chapters, file) if d.level == "error"]
+
+
+class SetFields(namedtuple("SetFields", ["chapter_id", "fields", "create"], defaults=(False,))):
+    """Set top-level chapter fields (blocks, url, title, ...). create: append the chapter
+    when the id isn't in the file yet (otherwise it is reported as missing)."""
+
+    __slots__ = ()
+
+    def apply(self, engine: PatchEngine) -> set[int]:
+        ch = engine.index.get(self.chapter_id)
+        if ch is None:
+            if not self.create:
+                engine.missing.append(self.chapter_id)
+                return set()
+            ch = engine.add_chapter(self.chapter_id)
+        changed = set()
+        for key, value in self.fields.items():
+            if ch.get(key, _MISSING) != value:
+                ch[key] = value
+                changed.add(self.chapter_id)
+        return changed
+
+
+class ReplaceRows(namedtuple("ReplaceRows", ["chapter_id", "headers", "rows", "heading", "strict"],
+                             defaults=(None, True))):
+    """Replace the rows of the chapter's tables whose headers (and heading, if given) match.
+    strict: the new rows must have as many rows as the table they replace."""
+
+    __slots__ = ()
+
+    def apply(self, engine: PatchEngine) -> set[int]:
+        ch = engine.index.get(self.chapter_id)
+        if ch is None:
+            engine.missing.append(self.chapter_id)
+            return set()
+        changed = set()
+        for block in _tables(ch):
+            if block.get("headers") != self.headers:
+                continue
+            if self.heading is not None and block.get("heading") != self.heading:
+                continue
+            old = block.get("rows") or []
+            if self.strict and len(old) != len(self.rows):
+                raise ValueError(f"lesson {self.chapter_id}: expected {len(self.rows)} rows, file has {len(old)}")
+            rows = [list(r) for r in self.rows]
+            if old != rows:
+                block["rows"] = rows
+                changed.add(self.chapter_id)
+        return changed
+
+
+class Transform(namedtuple("Transform", ["fn", "chapter_ids"], defaults=(None,))):
+    """Call fn(chapter) on the given chapters (None = every chapter) to edit them in place."""
+
+    __slots__ = ()
+
+    def apply(self, engine: PatchEngine) -> set[int]:
+        changed = set()
+        for cid in list(engine.index) if self.chapter_ids is None else self.chapter_ids:
+            ch = engine.index.get(cid)
+            if ch is None:
+                engine.missing.append(cid)
+                continue
+            before = dumps(ch, compact=True)
+            self.fn(ch)
+            if dumps(ch, compact=True) != before:
+                changed.add(cid)
+        return changed
+
+
+class PatchEngine:
+    """One data_<lang>.json held in memory with an id -> chapter index."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.chapters = load_lessons(self.path)
+        self.index = {ch["id"]: ch for ch in self.chapters}
+        self.changed: set[int] = set()
+        self.created: list[int] = []
+        self.missing: list[int] = []
+
+    def add_chapter(self, chapter_id: int) -> dict:
+        ch = {"id": chapter_id}
+        self.chapters.append(ch)
+        self.index[chapter_id] = ch
+        self.created.append(chapter_id)
+        return ch
+
+    def apply(self, patches, module: str = "") -> PatchStats:
+        """Apply one module's patches in order."""
+        self.created, self.missing = [], []
+        changed = set()
+        for patch in patches:
+            try:
+                changed |= patch.apply(self)
+            except ValueError as e:
+                raise ValueError(f"{module or self.path.name}: {e}") from None
+        self.changed |= changed
+        return PatchStats(module, len(patches), len(changed), self.created, self.missing)
+
+    def save(self) -> bool:
+        """Validate and write the file (atomically) if any patch changed it."""
+        problems = validate(self.chapters, self.path.name)
+        if problems:
+            raise ValueError(f"{self.path.name}: {len(problems)} problem(s), not written:\n  "
+                             + "\n  ".join(problems[:20]))
+        if not self.changed:
+            return False
+        return save_lessons(self.path, self.chapters)
+
+
+def format_stats(stats: PatchStats) -> str:
+    line = f"{stats.module}: {stats.patches} patch(es), {stats.changed} chapter(s) changed"
+    if stats.created:
+        line += f", added {', '.join(map(str, stats.created))}"
+    if stats.missing:
+        line += f", not in file: {', '.join(map(str, stats.missing))}"
+    return line
+
+
+def run_module(module):
+    """Entry point for a patch module run as a script: apply just its patches."""
+    name = Path(module.__file__).stem
+    engine = PatchEngine(BASE / module.DATA_FILE)
+    stats = engine.apply(module.patches(), name)
+    written = engine.save()
+    print(format_stats(stats) + ("" if written else f" ({module.DATA_FILE} unchanged)"))
+    return stats
+
+
+def run_chain(data_file: str, modules: list[str], write: bool = True):
+    """Apply a whole chain to one data file (runs in a worker process)."""
+    if str(BASE) not in sys.path:
+        sys.path.insert(0, str(BASE))
+    start = time.perf_counter()
+    engine = PatchEngine(BASE / data_file)
+    stats = []
+    for name in modules:
+        module = importlib.import_module(name)
+        if module.DATA_FILE != data_file:
+            raise ValueError(f"{name} patches {module.DATA_FILE}, not {data_file}")
+        stats.append(engine.apply(module.patches(), name))
+    if write:
+        written = engine.save()
+    else:
+        problems = validate(engine.chapters, data_file)
+        if problems:
+            raise ValueError(f"{data_file}: " + "; ".join(problems[:5]))
+        written = False
+    return data_file, stats, len(engine.changed), written, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply lesson patch modules, one load/write per data file")
+    parser.add_argument("languages", nargs="*", help="e.g. odia sindhi (default: every chain)")
+    parser.add_argument("--check", action="store_true", help="Apply and validate without writing")
+    parser.add_argument("--list", action="store_true", help="Show the chains and exit")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: one per chain)")
+    args = parser.parse_args()
+
+    chains = CHAINS
+    if args.languages:
+        wanted = {f"data_{lang.lower()}.json" for lang in args.languages}
+        unknown = sorted(f[5:-5] for f in wanted - set(CHAINS))
+        if unknown:
+            parser.error(f"no patch chain for {', '.join(unknown)} (have: {', '.join(f[5:-5] for f in CHAINS)})")
+        chains = {f: m for f, m in CHAINS.items() if f in wanted}
+    if args.list:
+        for data_file, modules in chains.items():
+            print(f"{data_file}: {' -> '.join(modules)}")
+        return
+
+    start = time.perf_counter()
+    failed = False
+    with ProcessPoolExecutor(max_workers=args.jobs or len(chains)) as pool:
+        futures = {f: pool.submit(run_chain, f, m, not args.check) for f, m in chains.items()}
+        for data_file, future in futures.items():
+            try:
+                _, stats, changed, written, seconds = future.result()
+            except Exception as e:
+                print(f"{data_file}: FAILED: {e}")
+                failed = True
+                continue
+            for s in stats:
+                print("  " + format_stats(s))
+            status = "written" if written else ("checked" if args.check else "unchanged")
+            print(f"{data_file}: {changed} chapter(s) changed, {status} ({seconds:.2f}s)")
+    print(f"{len(chains)} file(s) in {time.perf_counter() - start:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
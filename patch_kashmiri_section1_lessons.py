@@ -9,10 +9,11 @@ as in Spoken Kashmiri / O. N. Koul materials).
 
 Run: py -3 patch_kashmiri_section1_lessons.py
 """
-import json
 from copy import deepcopy
 from pathlib import Path
 
+from bb_io import load_lessons, save_lessons
+
 ROOT = Path(__file__).resolve().parent
 DATA = ROOT / "data_kashmiri.json"
 
@@ -340,11 +341,11 @@ def patch_lesson(lesson: dict) -> None:
 
 
 def main() -> None:
-    data = json.loads(DATA.read_text(encoding="utf-8"))
+    data = load_lessons(DATA)
     data = deepcopy(data)
     for lesson in data:
         patch_lesson(lesson)
-    DATA.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(DATA, data)
     print("Patched section 1 lessons 501–509 in", DATA)
 
 
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Perso-Arabic → Roman transliteration (Sindhi, Urdu, Kashmiri) with longest-match lookup.
+
+The mapping tables mix single letters with multi-character keys (Sindhi 'جهه', Urdu
+aspirates such as 'بھ' and endings such as 'وں'). populate_sindhi_s1 looked each character
+up on its own, so a multi-character key could never match; probing every key length at
+every position fixes that but costs a dict lookup per length per character. Here each
+table is compiled once into:
+
+  - a trie of its multi-character keys, emitted as a regex whose branches follow the trie
+    (greedy optional groups, so the longest key wins and the engine never backs up further
+    than the trie depth), which swaps each match for a private-use placeholder;
+  - one str.translate table for the single letters, the placeholders and the table's
+    policy for characters it does not know ("keep", or "drop" non-ASCII as
+    populate_sindhi_s1 did).
+
+Both passes scan the text once, in C. transliterate() memoizes whole strings (lesson
+tables repeat words); transliterate_many() joins the distinct strings and runs both
+passes over all of them at once.
+
+Tables: SINDHI is the populate_sindhi_s1 alphabet-chart table plus the letters that chart
+leaves out but the lessons use (ڏ ڃ ڱ ڦ ۽ ۾); URDU and KASHMIRI read letters the way the
+Urdu lesson rows romanize them. data_kashmiri.json is in Devanagari, so the Kashmiri
+table (Urdu plus the Kashmiri vowel letters) has no lesson rows to check against.
+
+`python perso_arabic_translit.py bench` checks FIXTURES (chart / fully vowelled lesson
+rows), checks that every cell of data_sindhi.json / data_urdu.json plus random sequences
+come out the same as the naive longest-match loop, and reports strings per second against
+that loop and the old per-character one.
+
+Usage:
+  from perso_arabic_translit import transliterate, transliterate_many
+  transliterate("گهر", "sindhi")                # "ghr"
+  transliterate("بھائی", "urdu")                # "bhai" (بھ is one key, not ب + ھ)
+  transliterate_many(urdu_cells, "urdu")        # list in, list out; one pass for the batch
+
+  python perso_arabic_translit.py --lang urdu "میں ٹھیک ہوں"
+  python perso_arabic_translit.py bench [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+
+SINDHI = {
+    'ا': 'a/aa', 'آ': 'aa', 'ب': 'b', 'ٻ': 'bb', 'ڀ': 'bh',
+    'پ': 'p', 'ت': 't', 'ٿ': 'th', 'ٽ': 'tt', 'ٺ': 'tth',
+    'ث': 's', 'ج': 'j', 'جهه': 'jh', 'ڄ': 'jj', 'چ': 'ch',
+    'ڇ': 'chh', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ڊ': 'dd',
+    'ڌ': 'dh', 'ڍ': 'ddh', 'ذ': 'z', 'ر': 'r', 'ڙ': 'rr',
+    'ز': 'z', 'ژ': 'zh', 'س': 's', 'ش': 'sh', 'ص': 's',
+    'ض': 'z', 'ط': 't', 'ظ': 'z', 'ع': 'a', 'غ': 'gh',
+    'ف': 'f', 'ق': 'q', 'ڪ': 'k', 'ک': 'k', 'گ': 'g',
+    'ڳ': 'gg', 'ل': 'l', 'م': 'm', 'ن': 'n', 'ڻ': 'nn',
+    'ں': 'n', 'و': 'w/o', 'ه': 'h', 'ھ': 'h', 'ء': "'",
+    'ي': 'y/ee', 'ی': 'y', 'ئ': 'y/ai', 'ة': 'ah',
+    'َ': 'a', 'ِ': 'i', 'ُ': 'u', 'ّ': '(double)',
+    # not in the chart, but in the lessons
+    'ڏ': 'dd', 'ڃ': 'ny', 'ڱ': 'ng', 'ڦ': 'ph', '۽': 'ain', '۾': 'me',
+}
+
+URDU = {
+    'ا': 'a', 'آ': 'aa', 'ب': 'b', 'پ': 'p', 'ت': 't', 'ٹ': 't', 'ث': 's', 'ج': 'j',
+    'چ': 'ch', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ڈ': 'd', 'ذ': 'z', 'ر': 'r', 'ڑ': 'r',
+    'ز': 'z', 'ژ': 'zh', 'س': 's', 'ش': 'sh', 'ص': 's', 'ض': 'z', 'ط': 't', 'ظ': 'z',
+    'ع': "'", 'غ': 'gh', 'ف': 'f', 'ق': 'q', 'ک': 'k', 'گ': 'g', 'ل': 'l', 'م': 'm',
+    'ن': 'n', 'ں': 'n', 'و': 'o', 'ہ': 'h', 'ھ': 'h', 'ء': "'", 'ی': 'i', 'ے': 'e',
+    'ئ': 'y', 'ؤ': 'o', 'ۃ': 't', 'ة': 't', 'ي': 'i', 'ك': 'k', 'ه': 'h', 'ﻻ': 'la',
+    'َ': 'a', 'ِ': 'i', 'ُ': 'u', 'ّ': '', 'ْ': '', 'ً': 'an', 'ٰ': 'a', '٘': '', 'ـ': '',
+    '،': ',', '؛': ';', '؟': '?', '۔': '.',
+    '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4', '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9',
+    # aspirates: one sound, not consonant + h
+    'بھ': 'bh', 'پھ': 'ph', 'تھ': 'th', 'ٹھ': 'th', 'جھ': 'jh', 'چھ': 'chh', 'دھ': 'dh',
+    'ڈھ': 'dh', 'ڑھ': 'rh', 'کھ': 'kh', 'گھ': 'gh', 'لھ': 'lh', 'مھ': 'mh', 'نھ': 'nh',
+    # vowel letters read together
+    'ئی': 'i', 'ئے': 'e', 'ئو': 'o', 'وں': 'on', 'یں': 'ein', 'اں': 'aan', 'ای': 'ai',
+}
+
+KASHMIRI = {
+    **URDU,
+    'ٲ': 'eu', 'ٳ': 'ee', 'ۄ': 'o', 'ۆ': 'o', 'ێ': 'e', 'ؠ': "'", 'ٕ': 'eu', 'ٚ': 'a', 'ٟ': 'i',
+}
+
+# table, what happens to characters it has no entry for
+LANGUAGES = {
+    "sindhi": (SINDHI, "drop"),
+    "urdu": (URDU, "keep"),
+    "kashmiri": (KASHMIRI, "keep"),
+}
+
+# Lesson rows whose romanization is a letter-by-letter reading: chart letters (value in
+# the brackets), syllables and fully vowelled words.
+FIXTURES = {
+    "sindhi": [
+        # data_sindhi.json 501 alphabet chart
+        ("ا", "a/aa"), ("آ", "aa"), ("ب", "b"), ("ٻ", "bb"), ("ڀ", "bh"), ("پ", "p"),
+        ("ت", "t"), ("ٿ", "th"), ("ٽ", "tt"), ("ٺ", "tth"), ("ث", "s"), ("ج", "j"),
+        ("ڄ", "jj"), ("چ", "ch"), ("ڇ", "chh"), ("ح", "h"), ("خ", "kh"), ("د", "d"),
+        ("ڊ", "dd"), ("ڌ", "dh"), ("ڍ", "ddh"), ("ذ", "z"), ("ر", "r"), ("ڙ", "rr"),
+        ("ز", "z"), ("ژ", "zh"), ("س", "s"), ("ش", "sh"), ("ص", "s"), ("ض", "z"),
+        ("ط", "t"), ("ظ", "z"), ("ع", "a"), ("غ", "gh"), ("ف", "f"), ("ق", "q"),
+        ("ڪ", "k"), ("ک", "k"), ("گ", "g"), ("ڳ", "gg"), ("ل", "l"), ("م", "m"),
+        ("ن", "n"), ("ڻ", "nn"), ("ں", "n"), ("و", "w/o"), ("ه", "h"), ("ھ", "h"),
+        ("ء", "'"), ("ي", "y/ee"), ("ی", "y"), ("ئ", "y/ai"),
+        # 503 vowel signs, 505 nasals
+        ("بَ", "ba"), ("بِ", "bi"), ("بُ", "bu"), ("پَ", "pa"), ("پِ", "pi"), ("پُ", "pu"),
+        ("تَ", "ta"), ("تِ", "ti"), ("تُ", "tu"), ("جَ", "ja"), ("جِ", "ji"), ("جُ", "ju"),
+        ("دَ", "da"), ("دِ", "di"), ("دُ", "du"), ("سَ", "sa"), ("سِ", "si"), ("سُ", "su"),
+        ("ڪَ", "ka"), ("ڪِ", "ki"), ("ڪُ", "ku"), ("مَ", "ma"), ("مِ", "mi"), ("مُ", "mu"),
+        ("نَ", "na"), ("نِ", "ni"), ("نُ", "nu"), ("ڻَ", "nna"), ("ڻِ", "nni"), ("ڻُ", "nnu"),
+        # the multi-character key
+        ("جهه", "jh"),
+    ],
+    "urdu": [
+        # data_urdu.json: words whose romanization spells out every letter
+        ("کَ", "ka"), ("مِن", "min"), ("لُن", "lun"), ("دُم", "dum"), ("بَنْد", "band"),
+        ("سے", "se"), ("میں", "mein"), ("کوئی", "koi"), ("ادائیگی", "adaigi"), ("گاؤں", "gaon"),
+        ("لوگوں", "logon"), ("آنکھیں", "aankhein"), ("بھائی", "bhai"), ("کھانا", "khana"),
+        ("تھا", "tha"), ("چھوٹا", "chhota"), ("دھونا", "dhona"), ("گھونسلا", "ghonsla"),
+        ("بوجھ", "bojh"), ("۲۰۱۰", "2010"),
+    ],
+}
+FIXTURES["kashmiri"] = FIXTURES["urdu"]
+
+CACHE_SIZE = 1 << 16
+
+PLACEHOLDER = 0xE000          # multi-character keys become U+E000, U+E001, ... in pass one
+_PRIVATE = re.compile("[\ue000-\uf8ff]")
+SEP = "\x00"                  # joins a batch; in no table, kept by both policies
+
+
+class _DropUnmapped(dict):
+    """translate() table that deletes non-ASCII characters it has no entry for."""
+
+    def __missing__(self, code: int):
+        if code < 128:
+            raise LookupError(code)
+        self[code] = None
+        return None
+
+
+def _trie(keys) -> dict:
+    root: dict = {}
+    for key in keys:
+        node = root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return root
+
+
+def _trie_regex(node: dict, depth: int = 0) -> str:
+    """Regex for the keys under `node`: one branch per child, so alternatives never share a
+    prefix, and a greedy (...)? wherever a key may stop, so the longest key matches."""
+    branches = []
+    for ch, child in sorted(node.items()):
+        if ch == "":
+            continue
+        rest = _trie_regex(child, depth + 1)
+        if rest and "" in child and depth > 0:
+            rest = f"(?:{rest})?"
+        branches.append(re.escape(ch) + rest)
+    if not branches:
+        return ""
+    return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+
+class Transliterator:
+    """One mapping table compiled for longest-match lookup."""
+
+    def __init__(self, table: dict[str, str], unmapped: str = "keep"):
+        if unmapped not in ("keep", "drop"):
+            raise ValueError(f"unmapped must be 'keep' or 'drop', not {unmapped!r}")
+        if any(SEP in key for key in table):
+            raise ValueError("mapping keys may not contain NUL")
+        self.mapping = dict(table)
+        self.unmapped = unmapped
+        self.longest = max(map(len, table), default=1)
+        multi = sorted(k for k in table if len(k) > 1)
+        self.placeholders = {key: chr(PLACEHOLDER + i) for i, key in enumerate(multi)}
+        self.pattern = re.compile(_trie_regex(_trie(multi))) if multi else None
+        chars = _DropUnmapped({c: c for c in range(128)}) if unmapped == "drop" else {}
+        chars.update({ord(k): v for k, v in table.items() if len(k) == 1})
+        chars.update({ord(p): table[k] for k, p in self.placeholders.items()})
+        self.chars = chars
+
+    def _placeholder(self, match: re.Match) -> str:
+        return self.placeholders[match.group()]
+
+    def __call__(self, text: str) -> str:
+        if self.pattern is not None:
+            if _PRIVATE.search(text) is not None:  # would be mistaken for a placeholder
+                return self.reference(text)
+            text = self.pattern.sub(self._placeholder, text)
+        return text.translate(self.chars)
+
+    def many(self, texts) -> list[str]:
+        """__call__ over a list in a single pass; each distinct string is done once."""
+        distinct = list(dict.fromkeys(texts))
+        joined = SEP.join(distinct)
+        if joined.count(SEP) == len(distinct) - 1 and (self.pattern is None or _PRIVATE.search(joined) is None):
+            done = dict(zip(distinct, self(joined).split(SEP)))
+        else:  # some string holds SEP or a placeholder character: one at a time
+            done = {t: self(t) for t in distinct}
+        return [done[t] for t in texts]
+
+    def reference(self, text: str) -> str:
+        """Longest match by probing every key length at every position: the bench baseline
+        for correctness, and the fallback for text that holds a placeholder character."""
+        out = []
+        i = 0
+        while i < len(text):
+            for size in range(min(self.longest, len(text) - i), 0, -1):
+                value = self.mapping.get(text[i:i + size])
+                if value is not None:
+                    out.append(value)
+                    i += size
+                    break
+            else:
+                if self.unmapped == "keep" or text[i].isascii():
+                    out.append(text[i])
+                i += 1
+        return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def get(language: str) -> Transliterator:
+    try:
+        table, unmapped = LANGUAGES[language]
+    except KeyError:
+        raise ValueError(f"no Perso-Arabic table for {language!r} (have {', '.join(LANGUAGES)})") from None
+    return Transliterator(table, unmapped)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def transliterate(text: str, language: str = "sindhi") -> str:
+    """Roman transliteration of Sindhi / Urdu / Kashmiri text, longest key first."""
+    return get(language)(text)
+
+
+def transliterate_many(texts, language: str = "sindhi") -> list[str]:
+    """transliterate() over a list, the whole batch in one pass."""
+    return get(language).many(texts)
+
+
+def cache_info():
+    return transliterate.cache_info()
+
+
+def _legacy(text: str, table: dict[str, str]) -> str:
+    """populate_sindhi_s1's per-character loop (never matches a multi-character key)."""
+    out = []
+    for ch in text:
+        if ch in table:
+            out.append(table[ch])
+        elif ch == ' ':
+            out.append(' ')
+        elif ch.isascii():
+            out.append(ch)
+    return ''.join(out)
+
+
+def corpus_cells(language: str) -> list[str]:
+    """Every string in data_<language>.json that holds Arabic-script text."""
+    from meitei_translit import corpus_strings
+
+    path = BASE / f"data_{language}.json"
+    if not path.exists():
+        return []
+    return [s for s in corpus_strings(path) if re.search("[\u0600-\u06ff]", s)]
+
+
+def _fuzz(table: dict[str, str], n: int, seed: int = 1) -> list[str]:
+    """Random sequences over the table's keys, their characters, ASCII and a placeholder character."""
+    import random
+
+    pieces = sorted({*table, *"".join(table)}) + [" ", "a", "?", "\ue000"]
+    rng = random.Random(seed)
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 12))) for _ in range(n)]
+
+
+def check_fixtures() -> list[tuple[str, str, str, str]]:
+    """(language, text, expected, got) for every fixture that comes out wrong."""
+    return [(lang, text, want, transliterate(text, lang))
+            for lang, cases in FIXTURES.items() for text, want in cases
+            if transliterate(text, lang) != want]
+
+
+def bench(repeat: int = 5):
+    bad = check_fixtures()
+    print(f"fixtures: {sum(map(len, FIXTURES.values())) - len(bad)}/{sum(map(len, FIXTURES.values()))} pass"
+          + "".join(f"\n  {lang}: {text!r} -> {got!r}, expected {want!r}" for lang, text, want, got in bad))
+
+    def best(fn) -> float:
+        times = []
+        for _ in range(repeat):
+            transliterate.cache_clear()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    for language in LANGUAGES:
+        tr = get(language)
+        cells = corpus_cells(language) or _fuzz(tr.mapping, 5000, seed=2)
+        source = f"data_{language}.json" if corpus_cells(language) else "random sequences (no lesson text)"
+        print(f"{language}: {len(cells)} strings from {source}, {len(set(cells))} distinct, "
+              f"{sum(map(len, cells)) / 1e3:.0f}k chars, {len(tr.placeholders)} multi-character keys")
+        probe = best(lambda: [tr.reference(s) for s in cells])
+        cases = [("per-char loop (old, wrong)", best(lambda: [_legacy(s, tr.mapping) for s in cells])),
+                 ("probe every length", probe),
+                 ("automaton, per string", best(lambda: [tr(s) for s in cells])),
+                 ("automaton, batch", best(lambda: tr.many(cells))),
+                 ("transliterate, memoized", best(lambda: [transliterate(s, language) for s in cells * 2]) / 2)]
+        for name, seconds in cases:
+            print(f"    {name:<28}{seconds * 1e3:>7.1f} ms {len(cells) / seconds:>12,.0f} strings/s "
+                  f"{probe / seconds:>6.1f}x")
+        fuzz = _fuzz(tr.mapping, 50_000)
+        sample = cells + fuzz
+        wrong = [s for s in sample if tr(s) != tr.reference(s)]
+        batch = tr.many(sample) == [tr.reference(s) for s in sample]
+        print(f"    same as probing on the lessons + {len(fuzz)} random sequences: {not wrong}, batch: {batch}"
+              + (f" ({len(wrong)} differ, e.g. {wrong[0]!r})" if wrong else ""))
+        if language == "sindhi":
+            changed = sum(tr(s) != _legacy(s, SINDHI) for s in cells)
+            print(f"    lesson strings that now come out differently (longest match, added letters): {changed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perso-Arabic → Roman transliteration (longest match)")
+    parser.add_argument("text", nargs="*", help="Text to transliterate, or `bench`")
+    parser.add_argument("--lang", "-l", default="sindhi", choices=sorted(LANGUAGES))
+    parser.add_argument("--repeat", "-n", type=int, default=5, help="bench: runs per case (best is shown)")
+    args = parser.parse_args()
+    if args.text == ["bench"]:
+        bench(args.repeat)
+        return
+    for text in args.text:
+        print(transliterate(text, args.lang))
+
+
+if __name__ == "__main__":
+    main()
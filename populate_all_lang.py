@@ -3,7 +3,9 @@ Universal lesson populator for BhaashaBuddy languages.
 Usage: python populate_all_lang.py <lang_key>
 Supported: dogri, sanskrit, bodo, urdu, konkani
 """
-import json, sys
+import sys
+
+from bb_io import load_lessons, save_lessons
 
 LANG = sys.argv[1] if len(sys.argv) > 1 else 'dogri'
 
@@ -896,7 +898,7 @@ for lid, topic in conv_topics:
 
 # Apply to data file
 data_file = f'data_{LANG}.json'
-d = json.load(open(data_file, 'r', encoding='utf-8'))
+d = load_lessons(data_file)
 count = 0
 for ch in d:
     lid = ch['id']
@@ -904,5 +906,5 @@ for ch in d:
         ch['blocks'] = ALL_LESSONS[lid]['blocks']
         count += 1
 
-open(data_file, 'w', encoding='utf-8').write(json.dumps(d, ensure_ascii=False, indent=2) + '\n')
+save_lessons(data_file, d)
 print(f'{n}: Populated {count}/162 lessons in {data_file}')
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Populate Bodo lessons (chapter IDs 501–662) in data_bodo.json."""
-import json
 from pathlib import Path
 
 from bodo_lessons_s1 import LESSONS_S1
@@ -11,6 +10,7 @@ from bodo_lessons_s3b import LESSONS_S3B
 from bodo_lessons_s4 import LESSONS_S4
 from bodo_lessons_s5a import LESSONS_S5A
 from bodo_lessons_s5b import LESSONS_S5B
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
@@ -27,7 +27,7 @@ LESSONS = {
 
 
 def load_titles():
-    s = json.loads((BASE / "lessons_structure_bodo.json").read_text(encoding="utf-8"))
+    s = load_structure(BASE / "lessons_structure_bodo.json")
     out = {}
     for ml in s["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -38,7 +38,7 @@ def load_titles():
 def main():
     titles = load_titles()
     path = BASE / "data_bodo.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch["id"]
@@ -53,7 +53,7 @@ def main():
             "rows": LESSONS[cid],
         }]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} lessons (501-662) in data_bodo.json")
 
 
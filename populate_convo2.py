@@ -1,43 +1,13 @@
 #!/usr/bin/env python3
 """Populate conversation lessons 642-662 (5.23-5.43) with topic-relevant sentences."""
-import json, sys
+import sys
 from pathlib import Path
 
-BASE = Path(__file__).parent.resolve()
+from bb_io import load_lessons, save_lessons
+from meitei_translit import transliterate
 
-INDEPENDENT={"ꯑ":"a","ꯏ":"i","ꯎ":"u"}
-CONSONANTS_M={"ꯀ":"k","ꯁ":"s","ꯂ":"l","ꯃ":"m","ꯄ":"p","ꯅ":"n","ꯆ":"ch","ꯇ":"t","ꯈ":"kh","ꯉ":"ng","ꯊ":"th","ꯋ":"w","ꯌ":"y","ꯍ":"h","ꯐ":"ph","ꯒ":"g","ꯓ":"jh","ꯔ":"r","ꯕ":"b","ꯖ":"j","ꯗ":"d","ꯘ":"gh","ꯙ":"dh","ꯚ":"bh"}
-LONSUM_M={"ꯛ":"k","ꯜ":"l","ꯝ":"m","ꯞ":"p","ꯟ":"n","ꯠ":"t","ꯡ":"ng","ꯢ":"i"}
-VOWEL_SIGNS_M={"ꯥ":"aa","ꯤ":"i","ꯨ":"u","ꯦ":"e","ꯣ":"o","ꯧ":"ou","ꯩ":"ei","ꯪ":"ng"}
-DIGITS_M={"꯰":"0","꯱":"1","꯲":"2","꯳":"3","꯴":"4","꯵":"5","꯶":"6","꯷":"7","꯸":"8","꯹":"9"}
-PUNCT_M={"꯫":".","꯬":"!"}
-APUN="꯭"
+BASE = Path(__file__).parent.resolve()
 
-def m2r(text):
-    out=[];i=0
-    while i<len(text):
-        ch=text[i]
-        if ch in DIGITS_M:out.append(DIGITS_M[ch])
-        elif ch in PUNCT_M:out.append(PUNCT_M[ch])
-        elif ch.isspace():out.append(ch)
-        elif ch in INDEPENDENT:
-            if i+1<len(text) and text[i+1] in VOWEL_SIGNS_M:
-                s=text[i+1];out.append(("ang" if s=="ꯪ" else VOWEL_SIGNS_M[s]) if ch=="ꯑ" else (INDEPENDENT[ch]+("ng" if s=="ꯪ" else VOWEL_SIGNS_M[s])));i+=1
-            else:out.append(INDEPENDENT[ch])
-        elif ch in CONSONANTS_M:
-            base=CONSONANTS_M[ch]
-            if i+1<len(text) and text[i+1]==APUN:out.append(base);i+=1
-            elif i+1<len(text) and text[i+1] in VOWEL_SIGNS_M:
-                s=text[i+1];out.append(base+("ang" if s=="ꯪ" else VOWEL_SIGNS_M[s]));i+=1
-            else:out.append(base+"a")
-        elif ch in VOWEL_SIGNS_M:out.append("ang" if ch=="ꯪ" else VOWEL_SIGNS_M[ch])
-        elif ch in LONSUM_M:out.append(LONSUM_M[ch])
-        elif ch==APUN:pass
-        else:out.append(ch)
-        i+=1
-    r="".join(out)
-    for o,n in [("  "," "),(" .","."),(" !","!"),(" ?","?")]:r=r.replace(o,n)
-    return r.strip()
 
 LESSONS = {
 
@@ -549,7 +519,7 @@ LESSONS = {
 
 def main():
     path = BASE / "data_meitei.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for chapter in data:
         cid = chapter["id"]
@@ -558,7 +528,7 @@ def main():
         lesson = LESSONS[cid]
         rows_with_translit = []
         for eng, mayek in lesson["rows"]:
-            translit = m2r(mayek)
+            translit = transliterate(mayek)
             rows_with_translit.append([eng, mayek, translit])
         new_table = {
             "type": "table",
@@ -571,7 +541,7 @@ def main():
         chapter.pop("intro", None)
         chapter.pop("content", None)
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     sys.stdout.buffer.write(f"Updated {updated} conversation lessons (642-662) in data_meitei.json\n".encode("utf-8"))
 
 if __name__ == "__main__":
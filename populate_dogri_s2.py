@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Populate Section 2 (IDs 510-542) of data_dogri.json — aligned with lessons_structure_dogri.json."""
-import json
 from pathlib import Path
 
 from dogri_lessons_a import LESSONS_A
 from dogri_lessons_b import LESSONS_B
+from bb_io import load_lessons, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
@@ -49,7 +49,7 @@ LESSONS = {**LESSONS_A, **LESSONS_B}
 
 def main():
     path = BASE / "data_dogri.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch["id"]
@@ -64,7 +64,7 @@ def main():
             "rows": LESSONS[cid],
         }]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} grammar lessons (510-542) in data_dogri.json")
 
 
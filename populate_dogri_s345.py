@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Populate Dogri Lessons 3–5 (chapter IDs 543–662) in data_dogri.json."""
-import json
 from pathlib import Path
 
 from dogri_lessons_s3a import LESSONS_S3A
@@ -8,6 +7,7 @@ from dogri_lessons_s3b import LESSONS_S3B
 from dogri_lessons_s4 import LESSONS_S4
 from dogri_lessons_s5a import LESSONS_S5A
 from dogri_lessons_s5b import LESSONS_S5B
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
@@ -15,7 +15,7 @@ LESSONS = {**LESSONS_S3A, **LESSONS_S3B, **LESSONS_S4, **LESSONS_S5A, **LESSONS_
 
 
 def load_titles():
-    s = json.loads((BASE / "lessons_structure_dogri.json").read_text(encoding="utf-8"))
+    s = load_structure(BASE / "lessons_structure_dogri.json")
     out = {}
     for ml in s["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -26,7 +26,7 @@ def load_titles():
 def main():
     titles = load_titles()
     path = BASE / "data_dogri.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch["id"]
@@ -41,7 +41,7 @@ def main():
             "rows": LESSONS[cid],
         }]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} lessons (543-662) in data_dogri.json")
 
 
@@ -6,58 +6,17 @@ topic-relevant sentences: English | Manipuri (Meitei Mayek) | Transliteration.
 Sources: manipurian.blogspot.com, languageshome.com, manipuri.fandom.com,
          en.wikipedia.org/wiki/Meitei_grammar, omniglot.com
 """
-import json, sys
+import sys
 from pathlib import Path
 
-BASE = Path(__file__).parent.resolve()
+from bb_io import load_lessons, save_lessons
+from meitei_translit import transliterate
 
-# ── Mayek → Roman transliterator (from upgrade_meitei_sentence_tables.py) ──
-INDEPENDENT = {"ꯑ": "a", "ꯏ": "i", "ꯎ": "u"}
-CONSONANTS_M = {
-    "ꯀ": "k", "ꯁ": "s", "ꯂ": "l", "ꯃ": "m", "ꯄ": "p", "ꯅ": "n",
-    "ꯆ": "ch", "ꯇ": "t", "ꯈ": "kh", "ꯉ": "ng", "ꯊ": "th", "ꯋ": "w",
-    "ꯌ": "y", "ꯍ": "h", "ꯐ": "ph", "ꯒ": "g", "ꯓ": "jh", "ꯔ": "r",
-    "ꯕ": "b", "ꯖ": "j", "ꯗ": "d", "ꯘ": "gh", "ꯙ": "dh", "ꯚ": "bh",
-}
-LONSUM_M = {"ꯛ": "k", "ꯜ": "l", "ꯝ": "m", "ꯞ": "p", "ꯟ": "n", "ꯠ": "t", "ꯡ": "ng", "ꯢ": "i"}
-VOWEL_SIGNS_M = {"ꯥ": "aa", "ꯤ": "i", "ꯨ": "u", "ꯦ": "e", "ꯣ": "o", "ꯧ": "ou", "ꯩ": "ei", "ꯪ": "ng"}
-DIGITS_M = {"꯰": "0", "꯱": "1", "꯲": "2", "꯳": "3", "꯴": "4", "꯵": "5", "꯶": "6", "꯷": "7", "꯸": "8", "꯹": "9"}
-PUNCT_M = {"꯫": ".", "꯬": "!"}
-APUN = "꯭"
-
-def mayek_to_roman(text):
-    out = []; i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch in DIGITS_M: out.append(DIGITS_M[ch])
-        elif ch in PUNCT_M: out.append(PUNCT_M[ch])
-        elif ch.isspace(): out.append(ch)
-        elif ch in INDEPENDENT:
-            if i+1 < len(text) and text[i+1] in VOWEL_SIGNS_M:
-                s = text[i+1]
-                out.append(("ang" if s == "ꯪ" else VOWEL_SIGNS_M[s]) if ch == "ꯑ" else (INDEPENDENT[ch] + ("ng" if s == "ꯪ" else VOWEL_SIGNS_M[s])))
-                i += 1
-            else:
-                out.append(INDEPENDENT[ch])
-        elif ch in CONSONANTS_M:
-            base = CONSONANTS_M[ch]
-            if i+1 < len(text) and text[i+1] == APUN: out.append(base); i += 1
-            elif i+1 < len(text) and text[i+1] in VOWEL_SIGNS_M:
-                s = text[i+1]; out.append(base + ("ang" if s == "ꯪ" else VOWEL_SIGNS_M[s])); i += 1
-            else: out.append(base + "a")
-        elif ch in VOWEL_SIGNS_M: out.append("ang" if ch == "ꯪ" else VOWEL_SIGNS_M[ch])
-        elif ch in LONSUM_M: out.append(LONSUM_M[ch])
-        elif ch == APUN: pass
-        else: out.append(ch)
-        i += 1
-    r = "".join(out)
-    for old, new in [("  ", " "), (" .", "."), (" !", "!"), (" ?", "?")]:
-        r = r.replace(old, new)
-    return r.strip()
+BASE = Path(__file__).parent.resolve()
 
 
 # ── All 33 lessons: each has (English, Meitei Mayek) pairs ──
-# The transliteration column is auto-generated via mayek_to_roman()
+# The transliteration column is auto-generated via transliterate()
 
 LESSONS = {
 
@@ -858,7 +817,7 @@ LESSONS = {
 
 def main():
     path = BASE / "data_meitei.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
 
     updated = 0
     for chapter in data:
@@ -869,7 +828,7 @@ def main():
         lesson = LESSONS[cid]
         rows_with_translit = []
         for eng, mayek in lesson["rows"]:
-            translit = mayek_to_roman(mayek)
+            translit = transliterate(mayek)
             rows_with_translit.append([eng, mayek, translit])
 
         new_table = {
@@ -890,7 +849,7 @@ def main():
         chapter["blocks"] = blocks
         updated += 1
 
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     sys.stdout.buffer.write(f"Updated {updated} grammar lessons (510-542) in data_meitei.json\n".encode("utf-8"))
 
 
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Fill data_hindi.json lessons (501–662) with curated Hindi + transliteration rows from hindi_lesson_banks."""
-import json
 from pathlib import Path
 
 from hindi_lesson_banks import get_lesson_rows
@@ -9,12 +8,13 @@ from hindi_phrases_chapters import get_phrases_chapter
 from hindi_script_chapters import get_script_chapter
 from hindi_vocabulary_chapters import get_vocabulary_chapter
 from hindi_conversation_chapters import get_conversation_chapter
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
 
 def load_titles():
-    s = json.loads((BASE / "lessons_structure_hindi.json").read_text(encoding="utf-8"))
+    s = load_structure(BASE / "lessons_structure_hindi.json")
     out = {}
     for ml in s["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -25,7 +25,7 @@ def load_titles():
 def main():
     titles = load_titles()
     path = BASE / "data_hindi.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch.get("id")
@@ -121,7 +121,7 @@ def main():
         if "tables" in ch:
             del ch["tables"]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} Hindi lessons in data_hindi.json")
 
 
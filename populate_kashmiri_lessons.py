@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 """Populate Kashmiri lessons (chapter IDs 501–662) in data_kashmiri.json from curated banks."""
-import json
 from pathlib import Path
 
 from kashmiri_lesson_assembler import build_lessons_dict
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
 
 def load_titles():
-    s = json.loads((BASE / "lessons_structure_kashmiri.json").read_text(encoding="utf-8-sig"))
+    s = load_structure(BASE / "lessons_structure_kashmiri.json")
     out = {}
     for ml in s["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -21,7 +21,7 @@ def main():
     titles = load_titles()
     lessons = build_lessons_dict()
     path = BASE / "data_kashmiri.json"
-    data = json.loads(path.read_text(encoding="utf-8-sig"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch["id"]
@@ -45,7 +45,7 @@ def main():
         if "tables" in ch:
             del ch["tables"]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} lessons (501-662) in data_kashmiri.json")
 
 
@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 """Populate Konkani lessons (chapter IDs 501–662) in data_konkani.json from curated banks."""
-import json
 from pathlib import Path
 
 from konkani_lesson_assembler import build_lessons_dict
+from bb_io import load_lessons, load_structure, save_lessons
 
 BASE = Path(__file__).parent.resolve()
 
 
 def load_titles():
-    s = json.loads((BASE / "lessons_structure_konkani.json").read_text(encoding="utf-8"))
+    s = load_structure(BASE / "lessons_structure_konkani.json")
     out = {}
     for ml in s["majorLessons"]:
         for sub in ml["sublessons"]:
@@ -21,7 +21,7 @@ def main():
     titles = load_titles()
     lessons = build_lessons_dict()
     path = BASE / "data_konkani.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
     updated = 0
     for ch in data:
         cid = ch["id"]
@@ -36,7 +36,7 @@ def main():
             "rows": lessons[cid],
         }]
         updated += 1
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print(f"Updated {updated} lessons (501-662) in data_konkani.json")
 
 
@@ -3,10 +3,11 @@
 Populate Section 2 (IDs 510-542) of data_odia.json with 33 Grammar lessons.
 Each lesson has 18 rows of [English, Odia, Transliteration].
 """
-import json
-from pathlib import Path
+import sys
 
-BASE = Path(__file__).parent.resolve()
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_odia.json"
 
 # Must match lessons_structure_odia.json (chapterIds 510–542).
 TITLE_BY_ID = {
@@ -841,29 +842,17 @@ LESSONS = {
 }  # end LESSONS
 
 
-def main():
-    path = BASE / "data_odia.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
-
-    updated = 0
-    for ch in data:
-        cid = ch["id"]
-        if cid not in LESSONS:
-            continue
-
-        title = TITLE_BY_ID.get(cid, ch.get("url", ""))
-        ch["url"] = title
-        ch["title"] = title
-        ch["blocks"] = [{
-            "type": "table",
-            "columns": ["English", "Odia", "Transliteration"],
-            "rows": LESSONS[cid],
-        }]
-        updated += 1
-
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-    print(f"Updated {updated} grammar lessons (510-542) in data_odia.json")
+def patches():
+    # Every id here has a TITLE_BY_ID entry; url and title both carry it.
+    return [
+        SetFields(cid, {
+            "url": TITLE_BY_ID[cid],
+            "title": TITLE_BY_ID[cid],
+            "blocks": [{"type": "table", "columns": ["English", "Odia", "Transliteration"], "rows": rows}],
+        })
+        for cid, rows in LESSONS.items()
+    ]
 
 
 if __name__ == "__main__":
-    main()
+    run_module(sys.modules[__name__])
@@ -1,6 +1,8 @@
-import json
+import sys
 
-d = json.load(open('data_odia.json', 'r', encoding='utf-8'))
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_odia.json"
 
 LESSONS = {}
 
@@ -563,24 +565,13 @@ LESSONS[560] = {
 }
 
 # Apply lessons to the data
-id_map = {item['id']: item for item in d}
-updated = 0
 
-for lid, content in LESSONS.items():
-    if lid in id_map:
-        id_map[lid]['url'] = content['url']
-        id_map[lid]['blocks'] = content['blocks']
-        updated += 1
-        row_count = len(content['blocks'][0]['rows'])
-        print(f"  Updated ID {lid}: {content['url']} ({row_count} rows)")
-    else:
-        d.append({"id": lid, "url": content['url'], "blocks": content['blocks']})
-        updated += 1
-        row_count = len(content['blocks'][0]['rows'])
-        print(f"  Added ID {lid}: {content['url']} ({row_count} rows)")
 
-with open('data_odia.json', 'w', encoding='utf-8') as f:
-    json.dump(d, f, ensure_ascii=False, indent=2)
+def patches():
+    # 543-560 may be missing from an older data_odia.json: append them.
+    return [SetFields(cid, {"url": lesson["url"], "blocks": lesson["blocks"]}, create=True)
+            for cid, lesson in LESSONS.items()]
+
 
-print(f"\nDone! Updated {updated} lessons (IDs 543-560) in data_odia.json")
-print(f"Total entries in data_odia.json: {len(d)}")
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
@@ -1,4 +1,6 @@
-import json
+import sys
+
+from patch_engine import SetFields, run_module
 
 DATA_FILE = "data_odia.json"
 
@@ -419,26 +421,16 @@ lessons = {
     },
 }
 
-with open(DATA_FILE, "r", encoding="utf-8") as f:
-    data = json.load(f)
 
-updated_count = 0
-for entry in data:
-    eid = entry["id"]
-    if eid in lessons:
-        lesson = lessons[eid]
-        entry["url"] = lesson["url"]
-        entry["blocks"] = [
-            {
-                "type": "table",
-                "columns": ["English", "Odia", "Transliteration"],
-                "rows": lesson["rows"]
-            }
-        ]
-        updated_count += 1
-        print(f"  [OK] ID {eid}: {lesson['url']} — {len(lesson['rows'])} rows")
+def patches():
+    return [
+        SetFields(cid, {
+            "url": lesson["url"],
+            "blocks": [{"type": "table", "columns": ["English", "Odia", "Transliteration"], "rows": lesson["rows"]}],
+        })
+        for cid, lesson in lessons.items()
+    ]
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
 
-print(f"\nDone! Updated {updated_count}/18 lessons (IDs 561-578) in {DATA_FILE}.")
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
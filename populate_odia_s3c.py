@@ -1,4 +1,6 @@
-import json
+import sys
+
+from patch_engine import SetFields, run_module
 
 DATA_FILE = "data_odia.json"
 
@@ -419,28 +421,16 @@ lessons = {
     },
 }
 
-with open(DATA_FILE, "r", encoding="utf-8") as f:
-    data = json.load(f)
 
-updated = 0
-for item in data:
-    if item["id"] in lessons:
-        lesson = lessons[item["id"]]
-        item["url"] = lesson["url"]
-        item["blocks"] = [
-            {
-                "type": "table",
-                "columns": ["English", "Odia", "Transliteration"],
-                "rows": lesson["rows"],
-            }
-        ]
-        updated += 1
+def patches():
+    return [
+        SetFields(cid, {
+            "url": lesson["url"],
+            "blocks": [{"type": "table", "columns": ["English", "Odia", "Transliteration"], "rows": lesson["rows"]}],
+        })
+        for cid, lesson in lessons.items()
+    ]
 
-with open(DATA_FILE, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
 
-print(f"Updated {updated} lessons (IDs 579-596) in {DATA_FILE}")
-for lid in sorted(lessons.keys()):
-    row_count = len(lessons[lid]["rows"])
-    print(f"  ID {lid}: {lessons[lid]['url']} — {row_count} rows")
-print("Done!")
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
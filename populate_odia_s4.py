@@ -1,6 +1,8 @@
-import json
+import sys
 
-d = json.load(open('data_odia.json', 'r', encoding='utf-8'))
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_odia.json"
 
 LESSONS = {}
 
@@ -694,12 +696,10 @@ LESSONS[619] = {
     ]
 }
 
-for ch in d:
-    if ch['id'] in LESSONS:
-        ch['blocks'] = LESSONS[ch['id']]['blocks']
 
-open('data_odia.json', 'w', encoding='utf-8').write(json.dumps(d, ensure_ascii=False, indent=2) + '\n')
-print(f'Section 4 (IDs 597-619, {len(LESSONS)} lessons) populated successfully.')
-for lid in sorted(LESSONS.keys()):
-    rows = LESSONS[lid]['blocks'][0]['rows']
-    print(f'  ID {lid}: {len(rows)} rows')
+def patches():
+    return [SetFields(cid, {"blocks": lesson["blocks"]}) for cid, lesson in LESSONS.items()]
+
+
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
@@ -1,5 +1,8 @@
-import json
-d = json.load(open('data_odia.json','r',encoding='utf-8'))
+import sys
+
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_odia.json"
 L = {}
 
 L[620] = [
@@ -443,8 +446,11 @@ L[641] = [
     ["May our country always prosper","ଆମ ଦେଶ ସବୁବେଳେ ଉନ୍ନତି କରୁ","Ama desha sabubele unnati karu"]
 ]
 
-for ch in d:
-    if ch['id'] in L:
-        ch['blocks'] = [{"type":"table","columns":["English","Odia","Transliteration"],"rows":L[ch['id']]}]
-open('data_odia.json','w',encoding='utf-8').write(json.dumps(d,ensure_ascii=False,indent=2)+'\n')
-print('Odia S5a (620-641) populated - 22 lessons')
+
+def patches():
+    return [SetFields(cid, {"blocks": [{"type": "table", "columns": ["English", "Odia", "Transliteration"], "rows": rows}]})
+            for cid, rows in L.items()]
+
+
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
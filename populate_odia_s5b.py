@@ -1,5 +1,8 @@
-import json
-d = json.load(open('data_odia.json','r',encoding='utf-8'))
+import sys
+
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_odia.json"
 L = {}
 
 L[642] = [
@@ -423,8 +426,11 @@ L[662] = [
     ["Let's hug and make up","ଆସ ଆଲିଙ୍ଗନ କରି ଭଲ ହେବା","Asa alingana kari bhala heba"]
 ]
 
-for ch in d:
-    if ch['id'] in L:
-        ch['blocks'] = [{"type":"table","columns":["English","Odia","Transliteration"],"rows":L[ch['id']]}]
-open('data_odia.json','w',encoding='utf-8').write(json.dumps(d,ensure_ascii=False,indent=2)+'\n')
-print('Odia S5b (642-662) populated - 21 lessons')
+
+def patches():
+    return [SetFields(cid, {"blocks": [{"type": "table", "columns": ["English", "Odia", "Transliteration"], "rows": rows}]})
+            for cid, rows in L.items()]
+
+
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
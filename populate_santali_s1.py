@@ -1,6 +1,8 @@
-import json
+import sys
 
-d = json.load(open('data_santali.json', 'r', encoding='utf-8'))
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_santali.json"
 
 LESSONS = {}
 
@@ -299,9 +301,10 @@ LESSONS[509] = {
     ]
 }
 
-for ch in d:
-    if ch['id'] in LESSONS:
-        ch['blocks'] = LESSONS[ch['id']]['blocks']
 
-open('data_santali.json', 'w', encoding='utf-8').write(json.dumps(d, ensure_ascii=False, indent=2) + '\n')
-print('Section 1 (501-509) populated')
+def patches():
+    return [SetFields(cid, {"blocks": lesson["blocks"]}) for cid, lesson in LESSONS.items()]
+
+
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
@@ -1,6 +1,10 @@
-import json
+import sys
 
-d = json.load(open('data_santali.json', 'r', encoding='utf-8'))
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_santali.json"
+
+COLUMNS = ["English", "Santali (Ol Chiki)", "Transliteration"]
 
 LESSONS = {}
 
@@ -383,9 +387,11 @@ LESSONS[596] = [
     ["If I were rich, I would help the poor", "ᱤᱧ ᱫᱷᱚᱱᱤ ᱨᱮᱫᱚ ᱤᱧ ᱜᱟᱨᱤᱵ ᱠᱮ ᱥᱟᱹᱜᱟᱹᱭ ᱟ", "inj dhoni redo inj garib ke sagay a"]
 ]
 
-for ch in d:
-    if ch['id'] in LESSONS:
-        ch['blocks'] = [{"type": "table", "columns": ["English", "Santali (Ol Chiki)", "Transliteration"], "rows": LESSONS[ch['id']]}]
 
-open('data_santali.json', 'w', encoding='utf-8').write(json.dumps(d, ensure_ascii=False, indent=2) + '\n')
-print('Section 3c (579-596) populated')
+def patches():
+    return [SetFields(cid, {"blocks": [{"type": "table", "columns": COLUMNS, "rows": rows}]})
+            for cid, rows in LESSONS.items()]
+
+
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
@@ -1,6 +1,10 @@
-import json
+import sys
 
-d = json.load(open('data_santali.json', 'r', encoding='utf-8'))
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_santali.json"
+
+COLUMNS = ["English", "Santali (Ol Chiki)", "Transliteration"]
 
 LESSONS = {}
 
@@ -510,21 +514,11 @@ LESSONS[619] = [
     ["money", "ᱴᱟᱠᱟ", "taka"],
 ]
 
-updated = 0
-for ch in d:
-    lid = ch['id']
-    if lid in LESSONS:
-        ch['blocks'] = [{
-            "type": "table",
-            "columns": ["English", "Santali (Ol Chiki)", "Transliteration"],
-            "rows": LESSONS[lid]
-        }]
-        updated += 1
 
-with open('data_santali.json', 'w', encoding='utf-8') as f:
-    f.write(json.dumps(d, ensure_ascii=False, indent=2) + '\n')
+def patches():
+    return [SetFields(cid, {"blocks": [{"type": "table", "columns": COLUMNS, "rows": rows}]})
+            for cid, rows in LESSONS.items()]
+
 
-print(f'Section 4 (597-619) populated: {updated} lessons updated')
-for lid in sorted(LESSONS.keys()):
-    count = len(LESSONS[lid])
-    print(f'  Lesson {lid}: {count} rows')
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
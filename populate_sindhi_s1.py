@@ -1,30 +1,8 @@
-import json, sys
+import sys
 
-TRANSLITERATION = {
-    'ا': 'a/aa', 'آ': 'aa', 'ب': 'b', 'ٻ': 'bb', 'ڀ': 'bh',
-    'پ': 'p', 'ت': 't', 'ٿ': 'th', 'ٽ': 'tt', 'ٺ': 'tth',
-    'ث': 's', 'ج': 'j', 'جهه': 'jh', 'ڄ': 'jj', 'چ': 'ch',
-    'ڇ': 'chh', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ڊ': 'dd',
-    'ڌ': 'dh', 'ڍ': 'ddh', 'ذ': 'z', 'ر': 'r', 'ڙ': 'rr',
-    'ز': 'z', 'ژ': 'zh', 'س': 's', 'ش': 'sh', 'ص': 's',
-    'ض': 'z', 'ط': 't', 'ظ': 'z', 'ع': 'a', 'غ': 'gh',
-    'ف': 'f', 'ق': 'q', 'ڪ': 'k', 'ک': 'k', 'گ': 'g',
-    'ڳ': 'gg', 'ل': 'l', 'م': 'm', 'ن': 'n', 'ڻ': 'nn',
-    'ں': 'n', 'و': 'w/o', 'ه': 'h', 'ھ': 'h', 'ء': "'",
-    'ي': 'y/ee', 'ی': 'y', 'ئ': 'y/ai', 'ة': 'ah',
-    'َ': 'a', 'ِ': 'i', 'ُ': 'u', 'ّ': '(double)',
-}
+from patch_engine import SetFields, run_module
 
-def transliterate(sindhi_text):
-    out = []
-    for ch in sindhi_text:
-        if ch in TRANSLITERATION:
-            out.append(TRANSLITERATION[ch])
-        elif ch == ' ':
-            out.append(' ')
-        elif ch.isascii():
-            out.append(ch)
-    return ''.join(out)
+DATA_FILE = "data_sindhi.json"
 
 lessons = {}
 
@@ -289,36 +267,24 @@ lessons[509] = {
     }
 }
 
-# Load existing scaffold
-data = json.load(open('data_sindhi.json', 'r', encoding='utf-8'))
-id_map = {ch['id']: ch for ch in data}
 
-for lid, content in lessons.items():
-    ch = id_map[lid]
-    ch['blocks'] = []
-    if 'grid' in content:
-        ch['blocks'].append({
-            "type": "table",
-            "heading": content['grid']['heading'],
-            "headers": content['grid']['headers'],
-            "speakCol": content['grid']['speakCol'],
-            "rows": content['grid']['rows']
-        })
-    if 'table' in content:
-        ch['blocks'].append({
-            "type": "table",
-            "heading": content['table']['heading'],
-            "headers": content['table']['headers'],
-            "speakCol": content['table']['speakCol'],
-            "rows": content['table']['rows']
-        })
+def _table(block):
+    return {
+        "type": "table",
+        "heading": block["heading"],
+        "headers": block["headers"],
+        "speakCol": block["speakCol"],
+        "rows": block["rows"],
+    }
+
+
+def patches():
+    # Grid (script chart) first, then the vocabulary table.
+    return [
+        SetFields(cid, {"blocks": [_table(content[key]) for key in ("grid", "table") if key in content]})
+        for cid, content in lessons.items()
+    ]
 
-with open('data_sindhi.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
 
-print("Section 1 (501-509) populated with grids and tables.")
-for lid in sorted(lessons.keys()):
-    ch = id_map[lid]
-    nb = len(ch['blocks'])
-    nr = sum(len(b['rows']) for b in ch['blocks'])
-    print(f"  {lid}: {nb} block(s), {nr} rows total")
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
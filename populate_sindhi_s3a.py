@@ -1,4 +1,8 @@
-import json
+import sys
+
+from patch_engine import SetFields, run_module
+
+DATA_FILE = "data_sindhi.json"
 
 lessons = {}
 
@@ -411,24 +415,19 @@ lessons[559] = {
 }
 
 # 560-569 will continue in the next batch
-# Load and update data
-data = json.load(open('data_sindhi.json', 'r', encoding='utf-8'))
-id_map = {ch['id']: ch for ch in data}
 
-for lid, content in lessons.items():
-    ch = id_map[lid]
-    ch['blocks'] = [{
-        "type": "table",
-        "heading": content['heading'],
-        "headers": ["English", "Sindhi", "Transliteration"],
-        "speakCol": 1,
-        "rows": content['rows']
-    }]
+def patches():
+    return [
+        SetFields(cid, {"blocks": [{
+            "type": "table",
+            "heading": content["heading"],
+            "headers": ["English", "Sindhi", "Transliteration"],
+            "speakCol": 1,
+            "rows": content["rows"],
+        }]})
+        for cid, content in lessons.items()
+    ]
 
-with open('data_sindhi.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
 
-print(f"Section 3a (543-559) populated: {len(lessons)} lessons")
-for lid in sorted(lessons.keys()):
-    nr = len(lessons[lid]['rows'])
-    print(f"  {lid}: {nr} rows")
+if __name__ == "__main__":
+    run_module(sys.modules[__name__])
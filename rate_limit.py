@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Rate limiting and retry helpers shared by the translation scripts.
+
+- TokenBucket: thread-safe bucket that refills continuously.
+- RateLimiter: requests/min + tokens/min quotas (Groq-style) built from two buckets.
+- RetryPolicy: exponential backoff with jitter that honours Retry-After on 429s.
+- AdaptiveBackoff: shared request pacing that widens with the observed error rate
+  (for backends without quotas or Retry-After, e.g. deep-translator).
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+
+
+class TokenBucket:
+    """Holds up to `capacity` tokens, refilled at `rate` tokens per second."""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def acquire(self, n: float = 1.0):
+        """Block until `n` tokens are available, then take them.
+
+        Requests larger than the bucket are clamped to its capacity so a single
+        oversized chapter can still go through (it just waits for a full bucket).
+        """
+        n = min(float(n), self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait = (n - self._tokens) / self.rate
+            time.sleep(min(wait, 1.0))
+
+    def adjust(self, delta: float):
+        """Give back (delta > 0) or charge extra (delta < 0) tokens after the fact."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + delta)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute quotas. 0/None disables a quota."""
+
+    def __init__(self, requests_per_minute: float | None = None, tokens_per_minute: float | None = None):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0) if tokens_per_minute else None
+
+    def acquire(self, tokens: int = 0):
+        if self.requests:
+            self.requests.acquire(1)
+        if self.tokens and tokens:
+            self.tokens.acquire(tokens)
+
+    def settle(self, estimated: int, actual: int | None):
+        """Correct the token bucket once the real usage of a request is known."""
+        if self.tokens and actual is not None:
+            self.tokens.adjust(estimated - actual)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for quota purposes (Indic scripts tokenize at ~3 chars/token)."""
+    return len(text) // 3 + 1
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter; a server Retry-After always wins."""
+
+    def __init__(self, max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(float(retry_after), self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class AdaptiveBackoff:
+    """Spaces request starts `interval` apart across all threads, adapting to errors.
+
+    Each failure doubles the interval (up to max_interval); successes shrink it back
+    towards min_interval once the error rate over the last `window` requests is below
+    `target`.
+    """
+
+    def __init__(self, min_interval: float = 0.08, max_interval: float = 30.0, window: int = 20,
+                 target: float = 0.1):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target = target
+        self.interval = min_interval
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this thread's request slot."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def record(self, ok: bool):
+        with self._lock:
+            self._outcomes.append(ok)
+            if not ok:
+                self.interval = min(self.max_interval, max(self.interval * 2, self.min_interval * 2))
+            elif self._error_rate() < self.target:
+                self.interval = max(self.min_interval, self.interval * 0.7)
+
+    def _error_rate(self) -> float:
+        return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._error_rate()
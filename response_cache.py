@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Request-level response cache for the LLM and MT backends.
+
+Many lesson files are structural clones (setup_new_langs.py derives structures from
+Maithili, populate_* scripts reuse the same banks), so the same chapter payload or
+string is often sent more than once across languages and reruns. Responses are cached
+by (backend, model, hash of the prompt/text, temperature); a text that is one JSON
+document is keyed by its compact form, so indentation alone doesn't split entries:
+
+  - a bounded in-memory LRU in front of a persistent SQLite table;
+  - the table is bounded too: least recently used rows are evicted past max_entries;
+  - entries older than the TTL are treated as misses and dropped;
+  - hit / miss / expired / stored counters for the run (report()).
+
+Usage:
+  from response_cache import get_default, translate_cached
+  cache = get_default()                  # process-wide cache (None when disabled)
+  text = translate_cached(translator, en)   # deep-translator call through the cache
+
+  python response_cache.py stats
+  python response_cache.py clear
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+DEFAULT_PATH = BASE / ".response_cache.sqlite"
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MEMORY_ENTRIES = 2_048
+DEFAULT_TTL = 30 * 24 * 3600  # seconds
+EVICT_EVERY = 500  # puts between eviction sweeps
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key      TEXT PRIMARY KEY,
+    backend  TEXT NOT NULL,
+    model    TEXT NOT NULL,
+    value    TEXT NOT NULL,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def normalize(text: str) -> str:
+    """\\n line endings; a JSON document re-serialized compactly. String contents are kept
+    as they are: payloads that differ only in spacing inside a string are different requests."""
+    text = text.replace("\r\n", "\n")
+    try:
+        obj = json.loads(text)
+    except ValueError:
+        return text
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def cache_key(backend: str, model: str, text: str, temperature: float = 0.0) -> str:
+    h = hashlib.sha256()
+    for part in (backend, model or "", f"{float(temperature):.3f}", normalize(text)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path=DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 memory_entries: int = DEFAULT_MEMORY_ENTRIES, ttl: float = DEFAULT_TTL):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self.hits = self.misses = self.expired = self.stored = 0
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _remember(self, key: str, value: str, created: float):
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, backend: str, model: str, text: str, temperature: float = 0.0, accept=None):
+        """The cached reply, or None. A reply `accept(reply)` rejects counts as a miss."""
+        key = cache_key(backend, model, text, temperature)
+        now = time.time()
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is None:
+                row = self._conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+                hit = tuple(row) if row else None
+            if hit is None:
+                self.misses += 1
+                return None
+            value, created = hit
+            if self.ttl and now - created > self.ttl:
+                self._memory.pop(key, None)
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.expired += 1
+                self.misses += 1
+                return None
+            if accept is not None and not accept(value):
+                self.misses += 1
+                return None
+            self._remember(key, value, created)
+            with self._conn:
+                self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return value
+
+    def put(self, backend: str, model: str, text: str, value: str, temperature: float = 0.0):
+        key = cache_key(backend, model, text, temperature)
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, backend, model, value, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, backend, model or "", value, now, now),
+                )
+            self.stored += 1
+            self._puts += 1
+            if self._puts % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired rows, then least recently used rows beyond max_entries (lock held)."""
+        with self._conn:
+            if self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if n > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                    (n - self.max_entries,),
+                )
+
+    def report(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100 * self.hits / lookups if lookups else 0.0
+        return (f"response cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate), "
+                f"{self.expired} expired, {self.stored} stored")
+
+    def close(self):
+        with self._lock:
+            self._evict()
+            self._conn.close()
+
+
+_default = None
+_default_lock = threading.Lock()
+_enabled = True
+
+
+def configure(enabled: bool = True, **kwargs):
+    """Enable/disable the process-wide cache or change its settings (call before first use)."""
+    global _default, _enabled
+    with _default_lock:
+        _enabled = enabled
+        _default = ResponseCache(**kwargs) if enabled and kwargs else None
+
+
+def get_default():
+    """The process-wide ResponseCache, opened on first use; None when disabled."""
+    global _default
+    if not _enabled:
+        return None
+    with _default_lock:
+        if _default is None:
+            _default = ResponseCache()
+        return _default
+
+
+def translate_cached(translator, text: str, accept=None) -> str:
+    """translator.translate(text) (deep-translator) through the process-wide cache.
+
+    `accept(reply) -> bool` keeps replies the caller will reject (e.g. a batch whose tags
+    do not decode) out of the cache; a cached reply it rejects is requested again.
+    """
+    cache = get_default()
+    backend = type(translator).__name__
+    model = f"{getattr(translator, 'source', '')}->{getattr(translator, 'target', '')}"
+    if cache is not None:
+        hit = cache.get(backend, model, text, accept=accept)
+        if hit is not None:
+            return hit
+    out = translator.translate(text)
+    if cache is not None and out and (accept is None or accept(out)):
+        cache.put(backend, model, text, out)
+    return out
+
+
+def main():
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    cache = ResponseCache()
+    if cmd == "stats":
+        rows = cache._conn.execute(
+            "SELECT backend, model, COUNT(*), SUM(LENGTH(value)) FROM responses GROUP BY 1, 2 ORDER BY 1, 2"
+        ).fetchall()
+        for backend, model, n, size in rows:
+            print(f"{backend} {model}: {n} entries, {size or 0} chars")
+        if not rows:
+            print(f"{cache.path}: empty")
+    elif cmd == "clear":
+        with cache._conn:
+            cache._conn.execute("DELETE FROM responses")
+        print("cleared", cache.path)
+    else:
+        print(__doc__)
+        sys.exit(1)
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
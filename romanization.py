@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Batch, memoized romanization for every language in app.js LANGUAGES, keyed by script.
+
+The phrasebook builders romanized one phrase per sanscript.transliterate() call (iast() /
+romanize_kn), re-did identical strings on every rebuild, and each carried its own
+capitalization tweak. RomanizationService instead takes lists:
+
+  - each language maps to a script (LANGUAGES); each script to a romanizer (SCRIPTS):
+    indic_transliteration → IAST for the Brahmic scripts, or the repo's own module where
+    sanscript can't read the script (meitei_translit, perso_arabic_translit for Sindhi,
+    urdu_romanizer) or this file's Ol Chiki table;
+  - a list is de-duplicated, looked up in a bounded LRU, then in a persistent SQLite store
+    (romanization.sqlite, keyed by script, romanizer version and text); only what is left is
+    romanized, sanscript scripts in one call over the joined batch;
+  - store entries carry the romanizer's version (the indic_transliteration release, or a
+    hash of the local module and its tables), so editing a table never serves stale romans;
+  - per-language HOOKS then run over the whole list (default: capitalize the first letter,
+    as iast() did). Blank strings romanize to "".
+
+`python romanization.py bench` compares this with one transliterate() call per string on
+every native string of the 22 lesson data files, and checks the output is identical.
+
+Usage:
+  from romanization import RomanizationService
+  with RomanizationService() as romans:
+      romanize_many = romans.romanizer("kannada")      # [native] -> [roman]
+      romanize_many(["ನೀವು ಕನ್ನಡ ಮಾತನಾಡುತ್ತೀರಾ?"])       # ["Nīvu kannaḍa mātanāḍuttīrā?"]
+
+  python romanization.py kannada "ನೀವು ಕನ್ನಡ ಮಾತನಾಡುತ್ತೀರಾ?"
+  python romanization.py --list
+  python romanization.py bench [--repeat 3]
+  python romanization.py stats | prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+from indic_transliteration import sanscript
+
+BASE = Path(__file__).parent.resolve()
+DEFAULT_DB = BASE / "romanization.sqlite"
+APP_JS = BASE / "app.js"
+
+CACHE_SIZE = 100_000
+QUERY_CHUNK = 500
+SEP = "\n"  # joins a sanscript batch; passes through every scheme unchanged
+
+# block: the script's code points (picks its strings out of mixed text); scheme: sanscript
+# scheme, or None when `convert` ([text] -> [roman]) does the work; sources: the files a
+# local romanizer's output depends on (hashed into its version).
+Script = namedtuple("Script", ["block", "scheme", "convert", "sources"])
+Language = namedtuple("Language", ["code", "script"])
+
+OL_CHIKI = {
+    "ᱚ": "o", "ᱟ": "a", "ᱤ": "i", "ᱩ": "u", "ᱮ": "e", "ᱳ": "o",
+    "ᱛ": "t", "ᱜ": "g", "ᱝ": "ng", "ᱞ": "l", "ᱠ": "k", "ᱡ": "j", "ᱢ": "m", "ᱣ": "w",
+    "ᱥ": "s", "ᱦ": "h", "ᱧ": "ny", "ᱨ": "r", "ᱪ": "ch", "ᱫ": "d", "ᱬ": "nn", "ᱭ": "y",
+    "ᱯ": "p", "ᱰ": "dd", "ᱱ": "n", "ᱲ": "r", "ᱴ": "tt", "ᱵ": "b", "ᱶ": "w",
+    "ᱷ": "h",      # aspiration: ᱠᱷ kh, ᱪᱷ chh
+    "ᱸ": "n",      # mu tudag (nasal)
+    "ᱹ": "",       # gaahlaa tudag (vowel quality), not written in the lesson romans
+    "ᱺ": "n", "ᱻ": "",
+    "ᱽ": "'",      # ahad: checked consonant, ᱠᱽ k'
+    "ᱼ": "",
+    "᱾": ".", "᱿": ".",
+    **{chr(0x1C50 + d): str(d) for d in range(10)},
+}
+_OL_CHIKI_TABLE = str.maketrans(OL_CHIKI)
+
+
+def _ol_chiki(texts: list[str]) -> list[str]:
+    return [t.translate(_OL_CHIKI_TABLE) for t in texts]
+
+
+def _meitei(texts: list[str]) -> list[str]:
+    from meitei_translit import transliterate_many
+
+    return transliterate_many(texts)
+
+
+def _sindhi(texts: list[str]) -> list[str]:
+    from perso_arabic_translit import transliterate_many
+
+    return transliterate_many(texts, "sindhi")
+
+
+def _urdu(texts: list[str]) -> list[str]:
+    from urdu_romanizer import romanize_many
+
+    return romanize_many(texts)
+
+
+SCRIPTS = {
+    "devanagari": Script("ऀ-ॿ", sanscript.DEVANAGARI, None, ()),
+    "bengali": Script("ঀ-৿", sanscript.BENGALI, None, ()),
+    "assamese": Script("ঀ-৿", "assamese", None, ()),
+    "gurmukhi": Script("਀-੿", sanscript.GURMUKHI, None, ()),
+    "gujarati": Script("઀-૿", sanscript.GUJARATI, None, ()),
+    "oriya": Script("଀-୿", sanscript.ORIYA, None, ()),
+    "tamil": Script("஀-௿", sanscript.TAMIL, None, ()),
+    "telugu": Script("ఀ-౿", sanscript.TELUGU, None, ()),
+    "kannada": Script("ಀ-೿", sanscript.KANNADA, None, ()),
+    "malayalam": Script("ഀ-ൿ", sanscript.MALAYALAM, None, ()),
+    "meetei_mayek": Script("ꯀ-꯿", None, _meitei, ("meitei_translit.py",)),
+    "ol_chiki": Script("᱐-᱿", None, _ol_chiki, ("romanization.py",)),
+    "sindhi": Script("؀-ۿ", None, _sindhi, ("perso_arabic_translit.py",)),
+    "urdu": Script("؀-ۿ", None, _urdu, ("urdu_romanizer.py", "urdu_roman_lexicon.json")),
+}
+
+# The 22 languages of app.js LANGUAGES (kashmiri lessons are in Devanagari).
+LANGUAGES = {
+    "marathi": Language("mr", "devanagari"),
+    "gujarati": Language("gu", "gujarati"),
+    "punjabi": Language("pa", "gurmukhi"),
+    "kannada": Language("kn", "kannada"),
+    "tamil": Language("ta", "tamil"),
+    "maithili": Language("mai", "devanagari"),
+    "hindi": Language("hi", "devanagari"),
+    "telugu": Language("te", "telugu"),
+    "bengali": Language("bn", "bengali"),
+    "assamese": Language("as", "assamese"),
+    "malayalam": Language("ml", "malayalam"),
+    "nepali": Language("ne", "devanagari"),
+    "meitei": Language("mni", "meetei_mayek"),
+    "sindhi": Language("sd", "sindhi"),
+    "santali": Language("sat", "ol_chiki"),
+    "kashmiri": Language("ks", "devanagari"),
+    "odia": Language("or", "oriya"),
+    "dogri": Language("doi", "devanagari"),
+    "sanskrit": Language("sa", "devanagari"),
+    "bodo": Language("brx", "devanagari"),
+    "urdu": Language("ur", "urdu"),
+    "konkani": Language("kok", "devanagari"),
+}
+
+
+def capitalize_first(romans: list[str]) -> list[str]:
+    """First letter upper-case, as the phrasebooks show it (iast() did this per string)."""
+    return [r[0].upper() + r[1:] if r and r[0].islower() else r for r in romans]
+
+
+DEFAULT_HOOKS = (capitalize_first,)
+# language: [roman] -> [roman] passes run over the whole list, in order (default DEFAULT_HOOKS)
+HOOKS: dict[str, tuple] = {}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS romans (
+    script  TEXT NOT NULL,
+    version TEXT NOT NULL,
+    source  TEXT NOT NULL,
+    roman   TEXT NOT NULL,
+    PRIMARY KEY (script, version, source)
+) WITHOUT ROWID;
+"""
+
+
+def language(name_or_code: str) -> str:
+    """LANGUAGES key for a language name or MT code ("kn" -> "kannada")."""
+    if name_or_code in LANGUAGES:
+        return name_or_code
+    for name, lang in LANGUAGES.items():
+        if lang.code == name_or_code:
+            return name
+    raise ValueError(f"no romanizer for {name_or_code!r} (have {', '.join(LANGUAGES)})")
+
+
+def _sanscript_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return f"indic_transliteration {version('indic_transliteration')}"
+    except Exception:
+        return "indic_transliteration"
+
+
+def script_version(script: str) -> str:
+    spec = SCRIPTS[script]
+    if spec.scheme is not None:
+        return _sanscript_version()
+    digest = hashlib.sha256()
+    for name in spec.sources:
+        path = BASE / name
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()[:16]
+
+
+def _sanscript_one(text: str, scheme: str) -> str:
+    try:
+        return sanscript.transliterate(text, scheme, sanscript.IAST)
+    except Exception as e:
+        print("translit error:", repr(text)[:60], e)
+        return ""
+
+
+def convert(texts: list[str], script: str) -> list[str]:
+    """Romanize distinct, non-blank `texts` with the script's romanizer (no caching, no hooks)."""
+    spec = SCRIPTS[script]
+    if spec.convert is not None:
+        return spec.convert(texts)
+    batch = [t for t in texts if SEP not in t]  # multi-line cells go one by one
+    done = {}
+    if len(batch) > 1:
+        try:
+            out = sanscript.transliterate(SEP.join(batch), spec.scheme, sanscript.IAST).split(SEP)
+        except Exception:
+            out = []
+        if len(out) == len(batch):
+            done = dict(zip(batch, out))
+    return [done[t] if t in done else _sanscript_one(t, spec.scheme) for t in texts]
+
+
+class RomanizationService:
+    """Thread-safe; romanize_many() de-duplicates, then LRU, then store, then romanizes."""
+
+    def __init__(self, path=DEFAULT_DB, cache_size: int = CACHE_SIZE, persist: bool = True):
+        self.path = Path(path)
+        self.cache_size = cache_size
+        self._lru: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._versions: dict[str, str] = {}
+        self.stats = {"lru": 0, "store": 0, "romanized": 0}
+        self._conn = None
+        if persist:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def version(self, script: str) -> str:
+        if script not in self._versions:
+            self._versions[script] = script_version(script)
+        return self._versions[script]
+
+    def _stored(self, script: str, texts: list[str]) -> dict[str, str]:
+        if self._conn is None or not texts:
+            return {}
+        version = self.version(script)
+        out = {}
+        with self._lock:
+            for i in range(0, len(texts), QUERY_CHUNK):
+                chunk = texts[i:i + QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT source, roman FROM romans WHERE script = ? AND version = ? "
+                    f"AND source IN ({','.join('?' * len(chunk))})",
+                    (script, version, *chunk),
+                )
+                out.update(rows)
+        return out
+
+    def _remember(self, script: str, romans: dict[str, str], store: bool):
+        with self._lock:
+            for text, roman in romans.items():
+                self._lru[(script, text)] = roman
+            while len(self._lru) > self.cache_size:
+                self._lru.popitem(last=False)
+            if store and self._conn is not None and romans:
+                version = self.version(script)
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO romans (script, version, source, roman) VALUES (?, ?, ?, ?)",
+                        [(script, version, t, r) for t, r in romans.items()],
+                    )
+
+    def romanize_script(self, texts, script: str) -> list[str]:
+        """Raw romans for `texts` in `script` (no hooks); blank strings give ""."""
+        texts = list(texts)
+        done: dict[str, str] = {}
+        todo = []
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                if not text or not text.strip():
+                    done[text] = ""
+                elif (script, text) in self._lru:
+                    self._lru.move_to_end((script, text))
+                    done[text] = self._lru[(script, text)]
+                else:
+                    todo.append(text)
+        self.stats["lru"] += len(done)
+        stored = self._stored(script, todo)
+        self.stats["store"] += len(stored)
+        fresh = [t for t in todo if t not in stored]
+        romanized = dict(zip(fresh, convert(fresh, script))) if fresh else {}
+        self.stats["romanized"] += len(romanized)
+        self._remember(script, stored, store=False)
+        self._remember(script, romanized, store=True)
+        done.update(stored)
+        done.update(romanized)
+        return [done[t] for t in texts]
+
+    def romanize_many(self, texts, lang: str, hooks=None) -> list[str]:
+        """Romans for `texts` in language `lang` (name or MT code), with its hooks applied."""
+        name = language(lang)
+        romans = self.romanize_script(texts, LANGUAGES[name].script)
+        for hook in HOOKS.get(name, DEFAULT_HOOKS) if hooks is None else hooks:
+            romans = hook(romans)
+        return romans
+
+    def romanizer(self, lang: str, hooks=None):
+        """romanize_many([native]) -> [roman] for one language (TranslateClient's hook)."""
+        return lambda texts: self.romanize_many(texts, lang, hooks)
+
+    def store_stats(self) -> list[tuple[str, str, int]]:
+        if self._conn is None:
+            return []
+        with self._lock:
+            return self._conn.execute(
+                "SELECT script, version, COUNT(*) FROM romans GROUP BY script, version ORDER BY script"
+            ).fetchall()
+
+    def prune(self) -> int:
+        """Drop stored romans made by a romanizer version other than the current one."""
+        if self._conn is None:
+            return 0
+        removed = 0
+        for script in SCRIPTS:
+            version = self.version(script)
+            with self._lock, self._conn:
+                removed += self._conn.execute(
+                    "DELETE FROM romans WHERE script = ? AND version != ?", (script, version)).rowcount
+        return removed
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def app_languages(app_js: Path = APP_JS) -> dict[str, str]:
+    """{language: dataFile} for LANGUAGES in app.js, in order."""
+    text = app_js.read_text(encoding="utf-8")
+    block = text[text.index("const LANGUAGES = {"):]
+    block = block[:block.index("\n};")]
+    out = {}
+    for m in re.finditer(r"\n  (\w+): \{(.*?)\n  \}", block, re.S):
+        data = re.search(r'dataFile:\s*"([^"]+)"', m.group(2))
+        out[m.group(1)] = data.group(1) if data else ""
+    return out
+
+
+def native_strings(name: str, data_file: str) -> list[str]:
+    """Every string of the language's lesson data file that holds its script."""
+    from meitei_translit import corpus_strings
+
+    path = BASE / data_file
+    if not data_file or not path.exists():
+        return []
+    block = re.compile(f"[{SCRIPTS[LANGUAGES[name].script].block}]")
+    return [s for s in corpus_strings(path) if block.search(s)]
+
+
+def bench(repeat: int = 3):
+    missing = [n for n in app_languages() if n not in LANGUAGES]
+    print(f"app.js LANGUAGES: {len(app_languages())}, romanizer for each: {not missing}"
+          + (f" (missing: {', '.join(missing)})" if missing else ""))
+
+    def best(fn, setup=None) -> float:
+        times = []
+        for _ in range(repeat):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    def per_call(strings, script):
+        """The old way: one romanizer call per string, duplicates included, then capitalize."""
+        return capitalize_first([convert([s], script)[0] if s.strip() else "" for s in strings])
+
+    totals = [0.0] * 4
+    header = f"  {'language':<10}{'strings':>8}{'distinct':>9}{'per call':>10}{'cold':>9}{'store':>9}{'LRU':>9}  same"
+    print(header + "\n  " + "-" * (len(header) - 2))
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "bench.sqlite"
+        for name, data_file in app_languages().items():
+            if name not in LANGUAGES:
+                continue
+            script = LANGUAGES[name].script
+            strings = native_strings(name, data_file)
+            if not strings:
+                print(f"  {name:<10}{'no strings':>8}")
+                continue
+            box = {}
+
+            def fresh():
+                if "service" in box:
+                    box["service"].close()
+                db.unlink(missing_ok=True)
+                box["service"] = RomanizationService(db)
+
+            def reopen():
+                box["service"].close()
+                box["service"] = RomanizationService(db)
+
+            old = best(lambda: per_call(strings, script))
+            cold = best(lambda: box["service"].romanize_many(strings, name), setup=fresh)
+            stored = best(lambda: box["service"].romanize_many(strings, name), setup=reopen)
+            warm = best(lambda: box["service"].romanize_many(strings, name))
+            same = box["service"].romanize_many(strings, name) == per_call(strings, script)
+            box["service"].close()
+            for k, v in enumerate((old, cold, stored, warm)):
+                totals[k] += v
+            print(f"  {name:<10}{len(strings):>8}{len(set(strings)):>9}{old * 1e3:>8.0f}ms{cold * 1e3:>7.0f}ms"
+                  f"{stored * 1e3:>7.0f}ms{warm * 1e3:>7.0f}ms  {same}")
+    old, cold, stored, warm = totals
+    print(f"  total: per call {old:.2f} s, cold {cold:.2f} s ({old / cold:.1f}x), from the store "
+          f"{stored:.2f} s ({old / stored:.1f}x), LRU {warm:.3f} s ({old / warm:.0f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch, memoized romanization for the app's languages")
+    parser.add_argument("args", nargs="*", help="<language> <text>..., or bench / stats / prune")
+    parser.add_argument("--list", action="store_true", help="Show each language's script and romanizer")
+    parser.add_argument("--repeat", "-n", type=int, default=3, help="bench: runs per case (best is shown)")
+    args = parser.parse_args()
+    if args.list:
+        for name, lang in LANGUAGES.items():
+            spec = SCRIPTS[lang.script]
+            how = f"sanscript {spec.scheme} → IAST" if spec.scheme else ", ".join(spec.sources)
+            print(f"  {name:<10}{lang.code:<5}{lang.script:<14}{how}")
+        return
+    if args.args == ["bench"]:
+        bench(args.repeat)
+        return
+    with RomanizationService() as romans:
+        if args.args == ["stats"]:
+            for script, version, count in romans.store_stats():
+                current = " (current)" if version == romans.version(script) else ""
+                print(f"  {script:<14}{version:<32}{count:>8}{current}")
+        elif args.args == ["prune"]:
+            print(f"removed {romans.prune()} stored roman(s) from old romanizer versions")
+        elif len(args.args) >= 2:
+            for roman in romans.romanize_many(args.args[1:], args.args[0]):
+                print(roman)
+        else:
+            parser.error("give a language and text, or bench / stats / prune")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,13 @@ Outputs data_gujarati.json with id, title, url, content for each lesson.
 Requires: pip install requests beautifulsoup4
 """
 
-import json
 import re
 import time
 from pathlib import Path
 from urllib.parse import urljoin
 
+from bb_io import save_lessons
+
 try:
     import requests
     from bs4 import BeautifulSoup
@@ -228,8 +229,7 @@ def main():
             chapters.append({"id": i + 1, "title": title, "url": url, "content": content})
         time.sleep(0.5)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(chapters, f, ensure_ascii=False, indent=2)
+    save_lessons(out_path, chapters)
     print(f"Saved {len(chapters)} chapters to {out_path}")
 
 
@@ -1,7 +1,9 @@
 import json, re, copy, sys
 
+from bb_io import load_structure, save_lessons, save_structure
+
 BASE = 'lessons_structure_maithili.json'
-base = json.load(open(BASE, 'r', encoding='utf-8'))
+base = load_structure(BASE)
 
 LANGS = {
     'odia': {
@@ -71,7 +73,7 @@ for lang_key, info in LANGS.items():
         text = text.replace(old, new)
     struct = json.loads(text)
     out_struct = f'lessons_structure_{lang_key}.json'
-    open(out_struct, 'w', encoding='utf-8').write(json.dumps(struct, ensure_ascii=False, indent=2) + '\n')
+    save_structure(out_struct, struct)
     print(f'Created {out_struct}')
 
     # 2. Create scaffold data JSON
@@ -89,7 +91,7 @@ for lang_key, info in LANGS.items():
             "blocks": []
         })
     out_data = f'data_{lang_key}.json'
-    open(out_data, 'w', encoding='utf-8').write(json.dumps(data_scaffold, ensure_ascii=False, indent=2) + '\n')
+    save_lessons(out_data, data_scaffold)
     print(f'Created {out_data} with {len(data_scaffold)} lessons')
 
 print('\nAll structure and scaffold files created!')
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Split each data_<lang>.json into per-chapter shards plus a small manifest.
+
+The Lessons tab only needs chapter ids and titles to render the list; the chapter bodies
+are needed one at a time when a lesson is opened. For every lesson data file used by
+app.js (LANGUAGES[*].dataFile) this writes:
+
+  lessons/<data file stem>/manifest.json     {source, revision, bytes, chapters: [{id, title, file, bytes}]}
+  lessons/<data file stem>/<id>.<hash>.json  one chapter, compact JSON
+
+Shard names carry a content hash, so the browser can cache them indefinitely and an
+edited chapter gets a new name. app.js fetches the manifest up front, each chapter in
+openChapter(), and prefetches the next sublesson; with offline mode on (or for a search
+over chapter text) it fills the rest from the whole data file in the background. When a
+language has no manifest it falls back to the whole data file. Shards from a previous run that the new manifest no
+longer lists are deleted.
+
+Usage:
+  python shard_lessons.py                      # every data file in app.js LANGUAGES
+  python shard_lessons.py data_hindi.json data.json
+  python shard_lessons.py --output-dir /tmp/lessons
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+from pathlib import Path
+
+from bb_io import dumps, loads, write_atomic
+
+BASE = Path(__file__).parent.resolve()
+APP_JS = BASE / "app.js"
+OUT_DIR = BASE / "lessons"
+
+DATA_FILE_PAT = re.compile(r'dataFile:\s*"([^"]+\.json)"')
+
+
+def app_data_files(app_js: Path = APP_JS) -> list[str]:
+    """Lesson data files referenced by LANGUAGES in app.js, in order."""
+    return list(dict.fromkeys(DATA_FILE_PAT.findall(app_js.read_text(encoding="utf-8"))))
+
+
+def shard(data_path: Path, out_root: Path = OUT_DIR) -> dict:
+    """Write the shards and manifest for one data file; returns the manifest."""
+    raw = data_path.read_bytes()
+    chapters = loads(raw)
+    out_dir = out_root / data_path.stem
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for ch in chapters:
+        body = dumps(ch, compact=True)
+        name = f"{ch['id']}.{hashlib.sha256(body).hexdigest()[:10]}.json"
+        path = out_dir / name
+        if not path.exists():
+            write_atomic(path, body)
+        entry = {"id": ch["id"], "title": ch.get("title") or "", "file": name, "bytes": len(body)}
+        if not entry["title"] and ch.get("url"):
+            entry["url"] = ch["url"]  # app.js derives the title from the URL
+        entries.append(entry)
+
+    manifest = {
+        "source": data_path.name,
+        "revision": hashlib.sha256(raw).hexdigest()[:12],
+        "bytes": sum(e["bytes"] for e in entries),
+        "chapters": entries,
+    }
+    # Manifest last: a reader never sees it point at a shard that isn't there yet.
+    write_atomic(out_dir / "manifest.json", dumps(manifest, compact=True))
+
+    keep = {e["file"] for e in entries} | {"manifest.json"}
+    for old in out_dir.glob("*.json"):
+        if old.name not in keep:
+            old.unlink()
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split lesson data files into per-chapter shards + manifest")
+    parser.add_argument("files", nargs="*", help="Data files (default: every dataFile in app.js LANGUAGES)")
+    parser.add_argument("--output-dir", "-o", type=Path, default=OUT_DIR)
+    args = parser.parse_args()
+
+    names = args.files or app_data_files()
+    for name in names:
+        path = Path(name) if Path(name).is_absolute() else BASE / name
+        if not path.exists():
+            print(f"skip missing {path.name}")
+            continue
+        manifest = shard(path, args.output_dir)
+        chapters = manifest["chapters"]
+        manifest_bytes = (args.output_dir / path.stem / "manifest.json").stat().st_size
+        largest = max((c["bytes"] for c in chapters), default=0)
+        print(f"{path.name}: {len(chapters)} chapters | {path.stat().st_size / 1024:.0f} KB source -> "
+              f"{manifest_bytes / 1024:.1f} KB manifest + shards of {largest / 1024:.1f} KB max "
+              f"({manifest['bytes'] / 1024:.0f} KB total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unique-string batch translation ("string mode") for lesson JSON.
+
+Lesson cells repeat heavily across chapters ("my", "want", greetings...), so instead of
+one request per cell (or per chapter) we:
+  1. walk_collect: gather every translatable string once, with occurrence counts;
+  2. pack_batches: pack many unique strings into each request (index-tagged);
+  3. translate_unique: send the batches, falling back to smaller batches when a
+     response loses or reorders tags;
+  4. walk_replace: scatter the results back into the original JSON structure.
+
+BatchStats reports requests and characters sent against the one-request-per-cell
+baseline. Used by maithili_to_hindi_string_mt.py (Google) and
+translate_pipeline.py --mode string (Groq).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Google Translate rejects requests over 5000 characters.
+MAX_BATCH_CHARS = 4500
+MAX_BATCH_ITEMS = 100
+
+TAG_RE = re.compile(r"\[\[(\d+)\]\]")
+LINE_TAG_RE = re.compile(r"^\[\[\d+\]\] ", re.M)
+
+
+def walk_collect(obj, acc: Counter, should_translate=None):
+    """Count every string in `obj` (only those passing `should_translate`, if given)."""
+    if isinstance(obj, str):
+        if should_translate is None or should_translate(obj):
+            acc[obj] += 1
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            walk_collect(v, acc, should_translate)
+    elif isinstance(obj, list):
+        for v in obj:
+            walk_collect(v, acc, should_translate)
+
+
+def walk_replace(obj, mapping: dict):
+    if isinstance(obj, str):
+        return mapping.get(obj, obj)
+    if isinstance(obj, dict):
+        return {k: walk_replace(v, mapping) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [walk_replace(v, mapping) for v in obj]
+    return obj
+
+
+def pack_batches(strings, max_chars: int = MAX_BATCH_CHARS, max_items: int = MAX_BATCH_ITEMS):
+    """Greedily split `strings` into batches under `max_chars` (incl. tags) and `max_items`."""
+    batches, cur, size = [], [], 0
+    for s in strings:
+        cost = len(s) + 8
+        if cur and (size + cost > max_chars or len(cur) >= max_items):
+            batches.append(cur)
+            cur, size = [], 0
+        cur.append(s)
+        size += cost
+    if cur:
+        batches.append(cur)
+    return batches
+
+
+def encode_tagged(batch) -> str:
+    """One string per line, each prefixed with its index tag: "[[0]] ...\\n[[1]] ...".
+
+    A single string is sent bare, so the last-resort retry looks like a plain request.
+    """
+    if len(batch) == 1:
+        return batch[0]
+    return "\n".join(f"[[{i}]] {s}" for i, s in enumerate(batch))
+
+
+def decode_tagged(text: str, n: int):
+    """Inverse of encode_tagged; None unless exactly tags 0..n-1 come back."""
+    if n == 1:
+        return [text.strip()] if text and text.strip() else None
+    parts = TAG_RE.split(text or "")
+    out: dict[int, str] = {}
+    for i in range(1, len(parts) - 1, 2):
+        idx = int(parts[i])
+        if idx in out:
+            return None
+        out[idx] = parts[i + 1].strip()
+    if sorted(out) != list(range(n)):
+        return None
+    return [out[i] for i in range(n)]
+
+
+def tagged_accept(payload: str):
+    """accept= callback for response_cache.translate_cached: the reply to an encode_tagged
+    `payload` decodes back to as many strings as were sent."""
+    n = len(LINE_TAG_RE.findall(payload)) or 1
+    return lambda reply: decode_tagged(reply, n) is not None
+
+
+class BatchStats:
+    def __init__(self, counts: Counter):
+        self.unique = len(counts)
+        self.occurrences = sum(counts.values())
+        self.naive_chars = sum(len(s) * c for s, c in counts.items())
+        self.requests = 0
+        self.chars_sent = 0
+        self.failed = 0
+
+    def report(self) -> str:
+        saved_req = self.occurrences - self.requests
+        saved_chars = self.naive_chars - self.chars_sent
+        ratio = self.occurrences / self.requests if self.requests else 0.0
+        return (
+            f"{self.unique} unique of {self.occurrences} strings; "
+            f"{self.requests} requests instead of {self.occurrences} ({saved_req} saved, {ratio:.1f}x fewer); "
+            f"{self.chars_sent} chars sent instead of {self.naive_chars} ({saved_chars} saved); "
+            f"{self.failed} failed"
+        )
+
+
+def translate_unique(strings, send, stats: BatchStats, encode=encode_tagged, decode=decode_tagged,
+                     max_chars: int = MAX_BATCH_CHARS, max_items: int = MAX_BATCH_ITEMS, progress=None,
+                     workers: int = 1):
+    """Translate unique `strings` in packed batches; returns {source: result}.
+
+    `send(text)` performs one request and returns the raw response text. A batch whose
+    response does not decode is split in half and retried; a single string that still
+    does not decode is left out of the result so callers keep the source text. If
+    `send` raises or returns None (no reply, e.g. retries ran out), the whole batch is left
+    out: splitting would only repeat the error.
+    With `workers` > 1, batches are sent from a thread pool (`send` must be thread-safe).
+    """
+    result: dict = {}
+    lock = threading.Lock()
+
+    def run(batch):
+        payload = encode(batch)
+        with lock:
+            stats.requests += 1
+            stats.chars_sent += len(payload)
+        try:
+            raw = send(payload)
+        except Exception as e:
+            print(f"  warn: batch of {len(batch)} failed: {e!r}")
+            with lock:
+                stats.failed += len(batch)
+            return
+        if raw is None:
+            print(f"  warn: batch of {len(batch)} failed: no reply")
+            with lock:
+                stats.failed += len(batch)
+            return
+        decoded = decode(raw, len(batch))
+        if decoded is not None:
+            with lock:
+                result.update(zip(batch, decoded))
+            return
+        if len(batch) == 1:
+            with lock:
+                stats.failed += 1
+            return
+        mid = len(batch) // 2
+        run(batch[:mid])
+        run(batch[mid:])
+
+    batches = pack_batches(list(strings), max_chars, max_items)
+
+    def run_numbered(i):
+        if progress:
+            progress(i, len(batches))
+        run(batches[i])
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run_numbered, range(len(batches))))
+    else:
+        for i in range(len(batches)):
+            run_numbered(i)
+    return result
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 """Remove instructional meta-wrappers from English/Nepali/transliteration lesson rows."""
-import json
 import re
-from copy import deepcopy
-from pathlib import Path
+import sys
 
-ROOT = Path(__file__).resolve().parent
-DATA = ROOT / "data_nepali.json"
+from patch_engine import Transform, run_module
+
+DATA_FILE = "data_nepali.json"
 
 PREFIX_EN_CONV = "In Nepali conversation, you might say: "
 PREFIX_EN_ASK = "When you talk to someone in Nepal, you might ask: "
@@ -91,16 +90,9 @@ def process_tables(obj):
             process_tables(item)
 
 
-def main():
-    data = json.loads(DATA.read_text(encoding="utf-8"))
-    data = deepcopy(data)
-    process_tables(data)
-    DATA.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-    print("Stripped meta prefixes from", DATA)
+def patches() -> list:
+    return [Transform(process_tables)]
 
 
 if __name__ == "__main__":
-    main()
+    run_module(sys.modules[__name__])
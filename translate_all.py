@@ -1,19 +1,35 @@
 #!/usr/bin/env python3
 """
-Batch translate to all 22 Indic languages.
-Uses translate_config.yaml for backend. Creates data_{lang}.json, phrases_{lang}.json, dictionary_{lang}.json for each.
+Batch translate to all 22 Indic languages in one process.
+
+The source (data.json) is loaded once. Languages run concurrently (--parallel), each
+with its own chapters in flight (--concurrency), all sharing one Groq client and one
+global requests/min + tokens/min limit. Progress lines are prefixed with the language,
+each language reports throughput when it finishes, and a JSON run report is written
+(per-language duration, chapters translated / reused / failed, bytes produced).
 
 Usage:
   python translate_all.py                    # All languages
   python translate_all.py --languages kannada,tamil,telugu
   python translate_all.py --limit 2         # Test with 2 chapters
+  python translate_all.py --parallel 4 --concurrency 2 --rpm 30 --tpm 6000
+  python translate_all.py --report translate_report.json --output-dir out/
 """
 
 import argparse
-import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
+import response_cache
+import translate_metrics
+from parallel_corpus import ParallelCorpus
+from rate_limit import RateLimiter, RetryPolicy
+from translate_pipeline import load_config, make_groq_client, translate_language
+from bb_io import load_json, save_json
+
 BASE = Path(__file__).parent
 
 INDIC_LANGUAGES = [
@@ -24,34 +40,128 @@ INDIC_LANGUAGES = [
 
 
 def main():
+    config = load_config()
     parser = argparse.ArgumentParser(description="Batch translate to multiple languages")
     parser.add_argument("--languages", "-l", help="Comma-separated list (default: all)")
     parser.add_argument("--limit", "-n", type=int, help="Limit chapters per language (for testing)")
-    parser.add_argument("--backend", "-b", default="groq", help="groq | indic_trans2")
-    parser.add_argument("--phrases", action="store_true", default=True, help="Include phrases (default: try to load)")
-    parser.add_argument("--no-phrases", action="store_true", help="Skip phrases")
-    parser.add_argument("--dictionary", action="store_true", default=True, help="Include dictionary")
-    parser.add_argument("--no-dictionary", action="store_true", help="Skip dictionary")
+    parser.add_argument("--input", "-i", default="data.json", help="Input data.json")
+    parser.add_argument("--parallel", "-P", type=int, default=config.get("parallel_languages", 3),
+                        help="Languages translated at once (default: 3)")
+    parser.add_argument("--concurrency", "-c", type=int, default=config.get("concurrency", 1),
+                        help="Chapters in flight per language (default: 1)")
+    parser.add_argument("--rpm", type=float, default=config.get("requests_per_minute"),
+                        help="Global requests/min quota shared by all languages")
+    parser.add_argument("--tpm", type=float, default=config.get("tokens_per_minute"),
+                        help="Global tokens/min quota shared by all languages")
+    parser.add_argument("--max-retries", type=int, default=config.get("max_retries", 5))
+    parser.add_argument("--base-url", default=config.get("groq_base_url"),
+                        help="Override the Groq API base URL (e.g. a local stand-in server)")
+    parser.add_argument("--mode", choices=["chapter", "units", "compact", "string"], default=config.get("mode", "chapter"))
+    parser.add_argument("--fresh", action="store_true", help="Ignore checkpoint journals")
+    parser.add_argument("--no-corpus", action="store_true",
+                        help="Compact mode: don't fill rows from existing lessons / phrasebooks (parallel_corpus.py)")
+    parser.add_argument("--no-cache", action="store_true", default=not config.get("response_cache", True),
+                        help="Bypass the response cache (.response_cache.sqlite)")
+    parser.add_argument("--metrics", default=config.get("metrics_file", "translate_metrics.jsonl"),
+                        help="Per-call metrics log, JSON Lines (default: translate_metrics.jsonl; '' disables)")
+    parser.add_argument("--output-dir", "-o", default=".", help="Where data_{lang}.json files go (default: repo root)")
+    parser.add_argument("--report", default="translate_report.json", help="Run report path (JSON)")
     args = parser.parse_args()
 
     langs = args.languages.split(",") if args.languages else INDIC_LANGUAGES
     langs = [l.strip().lower() for l in langs if l.strip()]
+    if "marathi" in langs:
+        print("Skipping marathi (source language)")
+        langs = [l for l in langs if l != "marathi"]
+
+    input_path = BASE / args.input
+    if not input_path.exists():
+        print(f"Input not found: {input_path}")
+        sys.exit(1)
+    data = load_json(input_path)
+    if args.limit:
+        data = data[: args.limit]
+
+    output_dir = BASE / args.output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    model = config.get("groq_model", "llama-3.3-70b-versatile")
+    client = make_groq_client(args.base_url)
+    limiter = RateLimiter(args.rpm, args.tpm)
+    retry = RetryPolicy(max_retries=args.max_retries)
+    response_cache.configure(enabled=not args.no_cache)
+    translate_metrics.configure(enabled=bool(args.metrics), path=BASE / args.metrics if args.metrics else None)
+    cache = response_cache.get_default()
+    corpus = ParallelCorpus.open() if args.mode == "compact" and not args.no_corpus else None
+
+    print(f"Translating {len(data)} chapters into {len(langs)} languages "
+          f"({args.parallel} at once, {args.concurrency} chapters each)...")
+    started = datetime.now(timezone.utc)
+    t0 = time.monotonic()
+
+    def run(lang):
+        return translate_language(
+            data, lang, model, client, output_dir / f"data_{lang}.json",
+            concurrency=args.concurrency, limiter=limiter, retry=retry,
+            fresh=args.fresh, mode=args.mode, prefix=f"[{lang}] ", corpus=corpus,
+        )
+
+    reports = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, args.parallel))
+    try:
+        futures = {pool.submit(run, lang): lang for lang in langs}
+        for fut in as_completed(futures):
+            lang = futures[fut]
+            try:
+                rep = fut.result()
+            except Exception as e:
+                print(f"[{lang}] ERROR: {e}")
+                rep = {"language": lang, "error": str(e)}
+            else:
+                rate = rep["translated"] / rep["duration_s"] if rep["duration_s"] else 0.0
+                print(f"[{lang}] done ({len(reports) + 1}/{len(langs)}): {rep['translated']} translated, "
+                      f"{rep['reused']} reused, {rep['failed']} failed in {rep['duration_s']:.1f}s "
+                      f"({rate:.2f} chapters/s, {rep['bytes'] / 1024:.0f} KB)")
+            reports[lang] = rep
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        print("\nInterrupted; finished chapters are in the per-language journals. Rerun to resume.")
+        sys.exit(130)
+    pool.shutdown()
+    if corpus is not None:
+        corpus.close()
 
-    phrases_opt = [] if args.no_phrases else ["-p", "phrases_marathi.json"]
-    dict_opt = [] if args.no_dictionary else ["-d", "dictionary_marathi.json"]
-
-    for lang in langs:
-        if lang == "marathi":
-            print(f"Skipping {lang} (source language)")
-            continue
-        print(f"\n=== Translating to {lang} ===")
-        cmd = [sys.executable, str(BASE / "translate_pipeline.py"), "-t", lang, "-b", args.backend]
-        if args.limit:
-            cmd.extend(["--limit", str(args.limit)])
-        cmd.extend(phrases_opt)
-        cmd.extend(dict_opt)
-        subprocess.run(cmd, cwd=BASE)
-    print("\nDone.")
+    ordered = [reports[lang] for lang in langs]
+    ok = [r for r in ordered if "error" not in r]
+    report = {
+        "started": started.isoformat(timespec="seconds"),
+        "duration_s": round(time.monotonic() - t0, 3),
+        "model": model,
+        "mode": args.mode,
+        "input": args.input,
+        "chapters_per_language": len(data),
+        "totals": {
+            "languages": len(ordered),
+            "languages_failed": len(ordered) - len(ok),
+            "translated": sum(r["translated"] for r in ok),
+            "reused": sum(r["reused"] for r in ok),
+            "failed": sum(r["failed"] for r in ok),
+            "bytes": sum(r["bytes"] for r in ok),
+        },
+        "languages": ordered,
+    }
+    if cache is not None:
+        report["response_cache"] = {"hits": cache.hits, "misses": cache.misses,
+                                    "expired": cache.expired, "stored": cache.stored}
+        cache.close()
+    report_path = BASE / args.report
+    save_json(report_path, report)
+    t = report["totals"]
+    print(f"\nDone in {report['duration_s']:.1f}s: {t['translated']} translated, {t['reused']} reused, "
+          f"{t['failed']} failed chapters; {t['languages_failed']} language(s) errored. Report: {report_path}")
+    if cache is not None:
+        print(cache.report())
+    if args.metrics:
+        print(f"Metrics: {BASE / args.metrics} (python translate_metrics.py summary --run {translate_metrics.get_default().run})")
 
 
 if __name__ == "__main__":
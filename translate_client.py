@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Batched, concurrent deep-translator client for the phrasebook builders.
+
+The build_*_from_hindi.py scripts used to translate one English string per request,
+serially, with a fixed sleep between calls. TranslateClient instead:
+
+  - looks every string up in the shared translation memory first (translation_memory.py),
+    then in the parallel corpus (parallel_corpus.py) when given `aligned`;
+  - packs the missing ones into index-tagged batches (string_batch.py) and sends them
+    from a bounded worker pool, each request through the response cache;
+  - paces requests with AdaptiveBackoff (rate_limit.py), which slows down as the
+    observed error rate rises and speeds back up when it falls;
+  - romanizes the results and returns the same (native, roman) pairs as before.
+
+Usage:
+  from translate_client import TranslateClient
+  client = TranslateClient("en", "kn", romanize_many=romans.romanizer("kannada"),
+                           seed_cache=CACHE_PATH)   # romans: romanization.RomanizationService
+  client.prefetch(all_english_strings)    # one batched pass
+  kn, rom = client.translate_pair(en)     # served from the prefetched pairs
+  client.close()
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import translate_metrics
+from rate_limit import AdaptiveBackoff
+from response_cache import translate_cached
+from string_batch import MAX_BATCH_CHARS, BatchStats, tagged_accept, translate_unique
+from translation_memory import TranslationMemory
+
+# Google Translate handles long inputs fine, but a bad batch is split and resent, so
+# smaller batches waste less on failure.
+BATCH_ITEMS = 50
+WORKERS = 4
+RETRIES = 6
+
+
+class TranslateClient:
+    def __init__(self, source: str, target: str, romanize=None, romanize_many=None, engine: str = "google",
+                 seed_cache=None, tm: TranslationMemory | None = None, translator=None, workers: int = WORKERS,
+                 batch_chars: int = MAX_BATCH_CHARS, batch_items: int = BATCH_ITEMS, retries: int = RETRIES,
+                 backoff: AdaptiveBackoff | None = None, aligned=None):
+        """`romanize(native) -> roman` per string, or `romanize_many([native]) -> [roman]` for
+        romanizers that need their own batched requests. `seed_cache` is a legacy JSON cache
+        imported into the translation memory once. `aligned(source) -> native or None` supplies
+        text the target language already has (parallel_corpus.aligned_lookup); those strings
+        are romanized locally and not sent."""
+        self.source = source
+        self.target = target
+        self.tm_key = (source, target, engine)
+        self.language = translate_metrics.language_label(target)  # metrics key, as translate_pipeline logs it
+        self.romanize = romanize
+        self.romanize_many = romanize_many
+        self.workers = workers
+        self.batch_chars = batch_chars
+        self.batch_items = batch_items
+        self.retries = retries
+        self.backoff = backoff or AdaptiveBackoff()
+        self.aligned = aligned
+        self.pairs: dict[str, tuple[str, str]] = {}
+        self._seed_cache = seed_cache
+        self._tm = tm
+        self._own_tm = tm is None
+        self._translator = translator
+        self._lock = threading.Lock()
+
+    @property
+    def translator(self):
+        if self._translator is None:
+            from deep_translator import GoogleTranslator
+
+            self._translator = GoogleTranslator(source=self.source, target=self.target)
+        return self._translator
+
+    @property
+    def tm(self) -> TranslationMemory:
+        if self._tm is None:
+            self._tm = TranslationMemory()
+        if self._seed_cache:
+            self._tm.import_json_cache(self._seed_cache, *self.tm_key)
+            self._seed_cache = None
+        return self._tm
+
+    def _send(self, payload: str) -> str:
+        model = f"{self.source}->{self.target}"
+        accept = tagged_accept(payload)
+        for attempt in range(self.retries + 1):
+            self.backoff.wait()
+            sent = time.monotonic()
+            try:
+                out = translate_cached(self.translator, payload, accept=accept)
+            except Exception as e:
+                self.backoff.record(False)
+                if attempt == self.retries:
+                    translate_metrics.record("call", backend="google", model=model, language=self.language,
+                                             latency_s=round(time.monotonic() - sent, 4), chars_in=len(payload),
+                                             chars_out=0, retries=attempt, ok=False, error=str(e)[:200])
+                    raise
+                print(f"  translate error ({self.source}→{self.target}), attempt {attempt + 1}: {e} "
+                      f"(next request in {self.backoff.interval:.2f}s)")
+                continue
+            self.backoff.record(True)
+            translate_metrics.record("call", backend="google", model=model, language=self.language,
+                                     latency_s=round(time.monotonic() - sent, 4), chars_in=len(payload),
+                                     chars_out=len(out or ""), retries=attempt, ok=True)
+            return out
+
+    def translate_many(self, strings) -> dict[str, str]:
+        """Raw MT for unique `strings` (no translation memory); failed strings are left out."""
+        strings = list(dict.fromkeys(s for s in strings if s and s.strip()))
+        if not strings:
+            return {}
+        stats = BatchStats({s: 1 for s in strings})
+        result = translate_unique(strings, self._send, stats, max_chars=self.batch_chars,
+                                  max_items=self.batch_items, workers=self.workers)
+        print(f"  {self.source}→{self.target}: {stats.report()}, "
+              f"error rate {100 * self.backoff.error_rate():.0f}%")
+        return {s: t for s, t in result.items() if t and t.strip()}
+
+    def _romanize_all(self, natives: list[str]) -> list[str]:
+        if self.romanize_many:
+            return self.romanize_many(natives)
+        out = []
+        for native in natives:
+            try:
+                out.append(self.romanize(native) if self.romanize else "")
+            except Exception as e:
+                print("translit error:", repr(native)[:60], e)
+                out.append("")
+        return out
+
+    def prefetch(self, strings) -> int:
+        """Fill self.pairs for `strings`: memory hits first, then one batched MT pass.
+
+        Returns the number of strings sent for translation. Strings that still fail are
+        kept as (source, "") and not written to the memory, so the next run retries them.
+        """
+        todo = [s for s in dict.fromkeys(strings) if s not in self.pairs]
+        for s, entry in self.tm.get_many(todo, *self.tm_key).items():
+            self.pairs[s] = (entry.target, entry.roman or "")
+        missing = [s for s in todo if s not in self.pairs]
+        if missing and self.aligned is not None:
+            found = [(s, native) for s in missing for native in [self.aligned(s)] if native]
+            natives = [native for _, native in found]
+            for (s, native), roman in zip(found, self._romanize_all(natives) if natives else ()):
+                self.pairs[s] = (native, roman)
+            if found:
+                print(f"  {self.source}→{self.target}: {len(found)} string(s) from the parallel corpus")
+                missing = [s for s in missing if s not in self.pairs]
+        if not missing:
+            return 0
+        translated = self.translate_many(missing)
+        done = [s for s in missing if s in translated]
+        natives = [translated[s] for s in done]
+        for s, native, roman in zip(done, natives, self._romanize_all(natives)):
+            self.pairs[s] = (native, roman)
+            self.tm.put(s, native, roman, *self.tm_key)
+        for s in missing:
+            if s not in translated:
+                print("translate failed, keeping source:", repr(s)[:72])
+                self.pairs[s] = (s, "")
+        self.tm.flush()
+        return len(missing)
+
+    def translate_pair(self, text: str) -> tuple[str, str]:
+        with self._lock:
+            if text not in self.pairs:
+                self.prefetch([text])
+            return self.pairs[text]
+
+    def prune_identity(self) -> int:
+        """Drop memory entries whose target is just the source (translation never happened)."""
+        return self.tm.delete_identity(*self.tm_key)
+
+    def close(self):
+        if self._tm is not None and self._own_tm:
+            self._tm.close()
+        elif self._tm is not None:
+            self._tm.flush()
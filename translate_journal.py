@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint journal for chapter translation runs.
+
+Each finished chapter is appended as one JSON line as soon as it completes, keyed by
+a hash of (source chapter JSON, target language, model). A rerun reuses every
+successful entry whose key still matches, so only edited chapters and chapters that
+previously failed are sent again. A crash or Ctrl-C loses at most the chapters that
+were in flight.
+
+Usage (from translate_pipeline.py; journal defaults to .translate_journal_<target>.jsonl):
+  python translate_pipeline.py -t kannada              # resumes automatically
+  python translate_pipeline.py -t kannada --fresh      # ignore previous entries
+  python translate_journal.py .translate_journal_kannada.jsonl   # summary
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+
+def chapter_key(chapter, target: str, model: str) -> str:
+    """Stable hash of the source chapter plus everything that changes its translation."""
+    src = json.dumps(chapter, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    h = hashlib.sha256()
+    for part in (src, target, model or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ChapterJournal:
+    """JSON Lines file of {"key", "id", "ok", "chapter"} records; the last record per key wins."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn last line from a killed run; everything before it is intact.
+                        continue
+                    self.entries[rec["key"]] = rec
+
+    def get(self, key: str):
+        """Translated chapter for `key`, or None if missing or the last attempt failed."""
+        rec = self.entries.get(key)
+        return rec["chapter"] if rec and rec.get("ok") else None
+
+    def record(self, key: str, chapter_id, translated):
+        """Append one result and fsync it, so it survives a crash right after."""
+        rec = {"key": key, "id": chapter_id, "ok": translated is not None, "chapter": translated}
+        line = json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.entries[key] = rec
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def compact(self):
+        """Rewrite the file with one line per key (drops superseded and torn lines)."""
+        with self._lock:
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for rec in self.entries.values():
+                    f.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp, self.path)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python translate_journal.py <journal.jsonl>")
+        sys.exit(1)
+    journal = ChapterJournal(sys.argv[1])
+    ok = sum(1 for r in journal.entries.values() if r.get("ok"))
+    failed = sorted((r["id"] for r in journal.entries.values() if not r.get("ok")), key=str)
+    print(f"{journal.path}: {len(journal.entries)} entries, {ok} ok, {len(failed)} failed")
+    if failed:
+        print("Failed chapter ids:", ", ".join(str(i) for i in failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,10 @@ import sys
 import time
 from pathlib import Path
 
+import response_cache
+import translate_metrics
+from bb_io import load_json, save_lessons
+
 BASE = Path(__file__).parent.resolve()
 INPUT_FILE = BASE / "data_maithili.json"
 OUTPUT_FILE = BASE / "data_hindi.json"
@@ -59,6 +63,12 @@ OUTPUT (JSON only):"""
 
 
 def translate_chapter_with_groq(chapter: dict, model: str):
+    chapter_str = json.dumps(chapter, ensure_ascii=False, indent=2)
+    prompt = _prompt(chapter_str)
+    cache = response_cache.get_default()
+    cached = cache.get("groq", model, prompt, 0.2) if cache is not None else None
+    if cached is not None:
+        return json.loads(cached)
     try:
         from groq import Groq
     except ImportError:
@@ -71,18 +81,35 @@ def translate_chapter_with_groq(chapter: dict, model: str):
         print("Set GROQ_API_KEY environment variable", file=sys.stderr)
         sys.exit(1)
     client = Groq(api_key=api_key)
-    chapter_str = json.dumps(chapter, ensure_ascii=False, indent=2)
-    prompt = _prompt(chapter_str)
-    resp = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.2,
-    )
+    tags = {"backend": "groq", "model": model, "language": "Hindi", "chapter": chapter.get("id")}
+    sent = time.monotonic()
+    try:
+        resp = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.2,
+        )
+    except Exception as e:
+        translate_metrics.record("call", **tags, latency_s=round(time.monotonic() - sent, 4), chars_in=len(prompt),
+                                 chars_out=0, retries=0, ok=False, error=str(e)[:200])
+        raise
     out = resp.choices[0].message.content.strip()
+    usage = getattr(resp, "usage", None)
+    translate_metrics.record("call", **tags, latency_s=round(time.monotonic() - sent, 4),
+                             prompt_tokens=getattr(usage, "prompt_tokens", None),
+                             completion_tokens=getattr(usage, "completion_tokens", None),
+                             chars_in=len(prompt), chars_out=len(out), retries=0, ok=True)
     if out.startswith("```"):
         out = re.sub(r"^```(?:json)?\s*", "", out)
         out = re.sub(r"\s*```\s*$", "", out)
-    return json.loads(out)
+    try:
+        translated = json.loads(out)
+    except json.JSONDecodeError as e:
+        translate_metrics.record("validation", language="Hindi", chapter=chapter.get("id"), reason="json", detail=str(e))
+        raise
+    if cache is not None:
+        cache.put("groq", model, prompt, out, 0.2)
+    return translated
 
 
 def offline_maithili_to_hindi_stub(chapter: dict) -> dict:
@@ -116,8 +143,7 @@ def main():
         print(f"Input not found: {args.input}", file=sys.stderr)
         sys.exit(1)
 
-    with open(args.input, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(args.input)
 
     if args.limit:
         data = data[: args.limit]
@@ -148,9 +174,7 @@ def main():
                 if args.sleep > 0:
                     time.sleep(args.sleep)
 
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    save_lessons(args.output, out)
     print(f"Saved {len(out)} chapters to {args.output}")
 
 
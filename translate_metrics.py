@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Latency, token and failure metrics for the translation backends (JSON Lines).
+
+translate_pipeline.py / translate_all.py (Groq) and translate_client.py (deep-translator)
+append one event per line to translate_metrics.jsonl:
+
+  call        one backend request: backend, model, language, chapter, label, latency_s,
+              prompt_tokens, completion_tokens, chars_in, chars_out, retries, ok, cached, error
+  validation  a reply was rejected: language, chapter, label, reason (json / shape / items)
+  chapter     one chapter result: language, chapter, mode, latency_s, ok
+
+Every event also carries ts (unix time) and run (one id per process).
+
+Usage:
+  python translate_metrics.py summary                    # p50/p95/p99, throughput, cost per language
+  python translate_metrics.py summary --run 1760790000-4242 --input-price 0.59 --output-price 0.79
+  python translate_metrics.py failures --top 20          # chapters that fail validation most often
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+DEFAULT_PATH = BASE / "translate_metrics.jsonl"
+
+# USD per million tokens (Groq llama-3.3-70b-versatile list price); override with
+# --input-price / --output-price or groq_price_per_mtok in translate_config.yaml.
+INPUT_PRICE = 0.59
+OUTPUT_PRICE = 0.79
+
+
+class MetricsLog:
+    """Thread-safe JSONL appender; each event is one line, flushed immediately."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.run = f"{int(time.time())}-{os.getpid()}"
+        self._lock = threading.Lock()
+        self._fh = open(self.path, "a", encoding="utf-8")
+
+    def record(self, event: str, **fields):
+        line = json.dumps({"ts": round(time.time(), 3), "run": self.run, "event": event, **fields},
+                          ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    def close(self):
+        with self._lock:
+            self._fh.close()
+
+
+_default = None
+_default_lock = threading.Lock()
+_enabled = True
+
+
+def configure(enabled: bool = True, path=None):
+    """Enable/disable the process-wide log or point it elsewhere (call before first use)."""
+    global _default, _enabled
+    with _default_lock:
+        _enabled = enabled
+        _default = MetricsLog(path) if enabled and path else None
+
+
+def get_default():
+    """The process-wide MetricsLog, opened on first use; None when disabled."""
+    global _default
+    if not _enabled:
+        return None
+    with _default_lock:
+        if _default is None:
+            _default = MetricsLog()
+        return _default
+
+
+@functools.lru_cache(maxsize=None)
+def language_label(name_or_code: str) -> str:
+    """The one language key every backend logs: "kn", "kannada" and "Kannada" -> "Kannada"."""
+    if not name_or_code:
+        return name_or_code
+    try:
+        from romanization import language
+
+        return language(name_or_code.lower()).title()
+    except (ImportError, ValueError):
+        return name_or_code
+
+
+def record(event: str, **fields):
+    """Append an event to the process-wide log (no-op when disabled)."""
+    log = get_default()
+    if log is not None:
+        log.record(event, **fields)
+
+
+def load_events(path=DEFAULT_PATH, run=None, since=None):
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                ev = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by a kill
+            if run and ev.get("run") != run:
+                continue
+            if since and ev.get("ts", 0) < since:
+                continue
+            events.append(ev)
+    return events
+
+
+def percentile(values, p: float) -> float:
+    """Linear-interpolated percentile (p in 0..100) of a non-empty list."""
+    xs = sorted(values)
+    k = (len(xs) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(xs) - 1)
+    return xs[lo] + (xs[hi] - xs[lo]) * (k - lo)
+
+
+def summarize(events, input_price: float = INPUT_PRICE, output_price: float = OUTPUT_PRICE):
+    """One row per (language, backend) with latency percentiles, throughput and cost."""
+    groups = defaultdict(lambda: {"calls": [], "validation": 0, "chapters_ok": 0, "chapters_failed": 0})
+    spans = defaultdict(lambda: [float("inf"), 0.0])  # (language, backend, run) -> [start, end]
+    backend_of = {}
+    for ev in events:
+        lang = language_label(ev.get("language")) or "?"
+        if ev["event"] == "call":
+            key = (lang, ev.get("backend", "?"))
+            groups[key]["calls"].append(ev)
+            backend_of.setdefault(lang, key[1])
+            span = spans[key + (ev.get("run"),)]
+            span[0] = min(span[0], ev["ts"] - ev.get("latency_s", 0))
+            span[1] = max(span[1], ev["ts"])
+    for ev in events:
+        if ev["event"] not in ("validation", "chapter"):
+            continue
+        lang = language_label(ev.get("language")) or "?"
+        key = (lang, backend_of.get(lang, "groq"))
+        if ev["event"] == "validation":
+            groups[key]["validation"] += 1
+        elif ev.get("ok"):
+            groups[key]["chapters_ok"] += 1
+        else:
+            groups[key]["chapters_failed"] += 1
+
+    rows = []
+    for key in sorted(groups):
+        g = groups[key]
+        calls = g["calls"]
+        live = [c for c in calls if not c.get("cached")]
+        lat = [c["latency_s"] for c in live if c.get("ok")]
+        prompt = sum(c.get("prompt_tokens") or 0 for c in live)
+        completion = sum(c.get("completion_tokens") or 0 for c in live)
+        wall = sum(end - start for (lang, backend, _), (start, end) in spans.items() if (lang, backend) == key)
+        rows.append({
+            "language": key[0],
+            "backend": key[1],
+            "calls": len(calls),
+            "cached": len(calls) - len(live),
+            "failed": sum(1 for c in live if not c.get("ok")),
+            "retries": sum(c.get("retries", 0) for c in live),
+            "validation_failures": g["validation"],
+            "chapters_ok": g["chapters_ok"],
+            "chapters_failed": g["chapters_failed"],
+            "p50_s": percentile(lat, 50) if lat else None,
+            "p95_s": percentile(lat, 95) if lat else None,
+            "p99_s": percentile(lat, 99) if lat else None,
+            "wall_s": wall,
+            "calls_per_min": 60 * len(live) / wall if wall else None,
+            "tokens_per_s": (prompt + completion) / wall if wall else None,
+            "chars_in": sum(c.get("chars_in", 0) for c in live),
+            "chars_out": sum(c.get("chars_out", 0) for c in live),
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "cost_usd": (prompt * input_price + completion * output_price) / 1e6 if key[1] == "groq" else 0.0,
+        })
+    return rows
+
+
+def _fmt(x, spec=".2f"):
+    return "-" if x is None else format(x, spec)
+
+
+def print_summary(rows):
+    header = (f"{'language':<12} {'backend':<8} {'calls':>6} {'cache':>5} {'fail':>4} {'retry':>5} {'inval':>5} "
+              f"{'p50 s':>7} {'p95 s':>7} {'p99 s':>7} {'call/min':>8} {'tok/s':>7} {'tokens in/out':>15} {'cost $':>8}")
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(f"{r['language']:<12} {r['backend']:<8} {r['calls']:>6} {r['cached']:>5} {r['failed']:>4} "
+              f"{r['retries']:>5} {r['validation_failures']:>5} {_fmt(r['p50_s']):>7} {_fmt(r['p95_s']):>7} "
+              f"{_fmt(r['p99_s']):>7} {_fmt(r['calls_per_min'], '.1f'):>8} {_fmt(r['tokens_per_s'], '.0f'):>7} "
+              f"{r['prompt_tokens']:>7}/{r['completion_tokens']:<7} {r['cost_usd']:>8.4f}")
+    if rows:
+        total = sum(r["cost_usd"] for r in rows)
+        print(f"\n{sum(r['calls'] for r in rows)} calls, {sum(r['chapters_ok'] for r in rows)} chapters ok, "
+              f"{sum(r['chapters_failed'] for r in rows)} failed, ${total:.4f} estimated")
+
+
+def print_failures(events, top: int = 20):
+    """Chapters whose replies were rejected most often (across every run in the log)."""
+    rejected = Counter()
+    reasons = defaultdict(Counter)
+    for ev in events:
+        if ev["event"] == "validation":
+            key = (language_label(ev.get("language")) or "?", ev.get("chapter"))
+            rejected[key] += 1
+            reasons[key][ev.get("reason", "?")] += 1
+    if not rejected:
+        print("no validation failures recorded")
+        return
+    for (lang, chapter), n in rejected.most_common(top):
+        detail = ", ".join(f"{r} ×{c}" for r, c in reasons[(lang, chapter)].most_common())
+        print(f"{lang:<12} chapter id={chapter}: {n} rejected ({detail})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize translate_metrics.jsonl")
+    parser.add_argument("command", choices=["summary", "failures"], nargs="?", default="summary")
+    parser.add_argument("--file", "-f", type=Path, default=DEFAULT_PATH)
+    parser.add_argument("--run", help="Only this run id")
+    parser.add_argument("--since", help="Only events after this date (YYYY-MM-DD)")
+    parser.add_argument("--input-price", type=float, help=f"USD per 1M prompt tokens (default: {INPUT_PRICE})")
+    parser.add_argument("--output-price", type=float, help=f"USD per 1M completion tokens (default: {OUTPUT_PRICE})")
+    parser.add_argument("--top", type=int, default=20, help="failures: chapters to list")
+    parser.add_argument("--json", action="store_true", help="summary: print rows as JSON")
+    args = parser.parse_args()
+
+    if not args.file.exists():
+        print(f"No metrics yet: {args.file}")
+        sys.exit(1)
+    since = time.mktime(time.strptime(args.since, "%Y-%m-%d")) if args.since else None
+    events = load_events(args.file, run=args.run, since=since)
+
+    if args.command == "failures":
+        print_failures(events, args.top)
+        return
+    from translate_pipeline import load_config
+
+    prices = load_config().get("groq_price_per_mtok") or {}
+    rows = summarize(
+        events,
+        input_price=args.input_price if args.input_price is not None else prices.get("input", INPUT_PRICE),
+        output_price=args.output_price if args.output_price is not None else prices.get("output", OUTPUT_PRICE),
+    )
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print_summary(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,17 +8,53 @@ Input: data.json (Marathi lessons). Output: data_{target}.json (same structure,
 Usage:
   python translate_pipeline.py --target kannada
   python translate_pipeline.py --target kannada --limit 5
+  python translate_pipeline.py --target kannada --concurrency 8 --rpm 30 --tpm 6000
+  python translate_pipeline.py --target kannada --mode string   # unique-string batches
+  python translate_pipeline.py --target kannada --mode units    # per block / table-row slice
+  python translate_pipeline.py --target kannada --mode compact  # only native/translit cells
+                                                                # (rows known to parallel_corpus.py are filled locally)
   Set GROQ_API_KEY in environment.
+
+Offline test against the local stand-in server (see fake_groq_server.py):
+  python fake_groq_server.py --port 8765 --latency 0.5 --rate-limit-rate 0.1 &
+  GROQ_API_KEY=test python translate_pipeline.py -t kannada -n 10 -c 4 --base-url http://127.0.0.1:8765
 """
 
 import argparse
 import json
+import os
 import re
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import response_cache
+import translate_metrics
+from bb_io import dumps, load_json, write_atomic
+from chapter_units import check_shape, check_unit, reassemble, split_chapter
+from compact_wire import compact_chapter, decode_answers, encode_items, expand_chapter, split_known
+from parallel_corpus import ParallelCorpus, aligned_pair_lookup
+from rate_limit import RateLimiter, RetryPolicy, estimate_tokens
+from string_batch import BatchStats, translate_unique, walk_collect
+from translate_journal import ChapterJournal, chapter_key
+
 BASE = Path(__file__).parent.resolve()
 
+DEVA = re.compile(r"[\u0900-\u097F]")
+TRANSLIT_HEADER = re.compile(r"translit", re.I)
+
+# String mode: an LLM answers with a [text, romanization] pair per string, so batches are
+# smaller than for plain MT.
+STRING_BATCH_CHARS = 3000
+STRING_BATCH_ITEMS = 60
+
+# Units mode: tables longer than this are split into row slices.
+UNIT_MAX_ROWS = 20
+UNIT_ATTEMPTS = 3
+GROQ_TEMPERATURE = 0.2
+
 LANG_DISPLAY_NAMES = {
     "kannada": "Kannada", "tamil": "Tamil", "telugu": "Telugu",
     "gujarati": "Gujarati", "hindi": "Hindi", "bengali": "Bengali",
@@ -38,9 +74,14 @@ def load_config():
         return {}
 
 
-def _groq_full_chapter_prompt(chapter_json_str, tgt_name, target_script_name):
-    """Same content as Marathi: same English, same structure. Only Marathi→target script and Marathi translit→target romanization. Do not add any new text."""
-    return f"""You are a translator. You receive ONE lesson chapter as JSON from a Marathi lesson. Your output must be the SAME lesson in structure and content, with only two kinds of replacement:
+def _groq_full_chapter_prompt(chapter_json_str, tgt_name, target_script_name, fragment=False):
+    """Same content as Marathi: same English, same structure. Only Marathi→target script and Marathi translit→target romanization. Do not add any new text.
+
+    With `fragment`, the input is one unit of a chapter (see chapter_units.py) instead of a whole chapter.
+    """
+    what = "ONE part of a lesson chapter (its title fields, one paragraph, one table, or some rows of a table)" if fragment else "ONE lesson chapter"
+    whole = "the complete part" if fragment else "the complete chapter"
+    return f"""You are a translator. You receive {what} as JSON from a Marathi lesson. Your output must be the SAME lesson in structure and content, with only two kinds of replacement:
 
 WHAT TO DO:
 - Keep every English sentence, phrase, and word exactly as in the input. Do not translate English. Do not add any new English or any new text.
@@ -56,7 +97,7 @@ TABLES (same format as Marathi):
 - Headers: use "English", then "{tgt_name}" or "[Label] ({tgt_name})", and "Transliteration" or "[Label] (Translit)" — same column count and order as input.
 - Each row: first cell = English (copy exactly from input). Then for each language column: {tgt_name} script, then in the next cell its romanization. So: English | {tgt_name} script | Transliteration (repeated for each form if grammar table).
 
-OUTPUT: Return ONLY the complete chapter as a single valid JSON object. No markdown, no explanation, no other text.
+OUTPUT: Return ONLY {whole} as a single valid JSON object. No markdown, no explanation, no other text.
 
 INPUT CHAPTER (JSON):
 {chapter_json_str}
@@ -64,39 +105,479 @@ INPUT CHAPTER (JSON):
 OUTPUT (JSON only):"""
 
 
-def translate_chapter_with_groq(chapter, tgt_name, model=None):
-    """Send one full chapter to Groq; return the translated chapter as a dict."""
+def _groq_strings_prompt(strings_json, tgt_name):
+    """String mode: an index → Marathi string object; the answer maps each index to [text, romanization]."""
+    return f"""You are a translator. You receive a JSON object mapping indexes to strings from Marathi lessons. Most are Marathi (Devanagari) words or sentences; some mix English with Marathi words.
+
+WHAT TO DO:
+- For every index return a pair [text, romanization]:
+  - text: the string with every Marathi (Devanagari) part replaced by the equivalent in {tgt_name} script, with correct {tgt_name} grammar. Keep English words exactly as they are.
+  - romanization: the romanization of the {tgt_name} text you wrote (e.g. mAjhA → nanna for "my" in Kannada).
+
+WHAT NOT TO DO:
+- Do not skip, merge, reorder or add indexes. No explanations or commentary.
+
+OUTPUT: Return ONLY a JSON object with the same keys, each mapped to [text, romanization].
+
+INPUT STRINGS (JSON):
+{strings_json}
+
+OUTPUT (JSON only):"""
+
+
+def _groq_compact_prompt(items_json, tgt_name):
+    """Compact mode (compact_wire.py): only the strings to translate, as an indexed object."""
+    return f"""You are a translator. You receive a JSON object mapping indexes to items from ONE Marathi lesson chapter, in lesson order. Each item is either [marathi, transliteration] (a table cell and its romanization) or [text] (a title, heading or note, possibly mixing English with Marathi words).
+
+WHAT TO DO:
+- [marathi, transliteration]: return [{tgt_name} script, romanization of the {tgt_name} text you wrote] (e.g. ["माझा", "mAjhA"] → ["ನನ್ನ", "nanna"] in Kannada). Use correct {tgt_name} grammar.
+- [text]: return [text] with every Marathi (Devanagari) part replaced by the equivalent in {tgt_name} script. Keep English words exactly as they are.
+
+WHAT NOT TO DO:
+- Do not skip, merge, reorder or add indexes. Keep the same number of elements in every item. No explanations or commentary.
+
+OUTPUT: Return ONLY a JSON object with the same keys.
+
+INPUT ITEMS (JSON):
+{items_json}
+
+OUTPUT (JSON only):"""
+
+
+def make_groq_client(base_url=None):
+    """Groq client with SDK retries disabled (RetryPolicy handles 429/5xx instead)."""
     try:
         from groq import Groq
     except ImportError:
         print("Install groq: pip install groq")
         sys.exit(1)
-    import os
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
         print("Set GROQ_API_KEY environment variable")
         sys.exit(1)
-    client = Groq(api_key=api_key)
+    return Groq(api_key=api_key, base_url=base_url or None, max_retries=0)
+
+
+def _status_code(exc):
+    return getattr(exc, "status_code", None)
+
+
+def _retry_after(exc):
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _is_retryable(exc):
+    """429s, 5xx and connection/timeout errors are worth retrying; 4xx and bad JSON are not."""
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(exc).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+def _strip_fences(out):
+    out = out.strip()
+    if out.startswith("```"):
+        out = re.sub(r"^```(?:json)?\s*", "", out)
+        out = re.sub(r"\s*```\s*$", "", out)
+    return out
+
+
+def groq_complete(client, prompt, model, label, limiter=None, retry=None, expected_output="", accept=None,
+                  tags=None):
+    """One chat completion with rate limiting and retries; returns the reply text or None.
+
+    `expected_output` is text of roughly the size of the reply, used for the token budget.
+    Replies are served from / stored in the response cache; `accept(reply) -> bool` keeps
+    replies the caller will reject (bad JSON, wrong shape) out of the cache. Every call is
+    recorded in the metrics log with `tags` (language, chapter, mode).
+    """
+    tags = tags or {}
+    started = time.monotonic()
+    cache = response_cache.get_default()
+    if cache is not None:
+        hit = cache.get("groq", model, prompt, GROQ_TEMPERATURE, accept=accept)
+        if hit is not None:
+            translate_metrics.record("call", backend="groq", model=model, label=label, **tags,
+                                     latency_s=round(time.monotonic() - started, 4), chars_in=len(prompt),
+                                     chars_out=len(hit), retries=0, ok=True, cached=True)
+            return hit
+    estimated = estimate_tokens(prompt) + estimate_tokens(expected_output)
+    attempt = 0
+    while True:
+        if limiter:
+            limiter.acquire(estimated)
+        sent = time.monotonic()
+        try:
+            resp = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=GROQ_TEMPERATURE,
+            )
+            break
+        except Exception as e:
+            if retry and attempt < retry.max_retries and _is_retryable(e):
+                wait = retry.delay(attempt, _retry_after(e))
+                attempt += 1
+                print(f"  Retry {attempt}/{retry.max_retries} for {label} in {wait:.1f}s ({e})")
+                time.sleep(wait)
+                continue
+            print(f"Groq error for {label}: {e}")
+            translate_metrics.record("call", backend="groq", model=model, label=label, **tags,
+                                     latency_s=round(time.monotonic() - sent, 4),
+                                     total_s=round(time.monotonic() - started, 4), chars_in=len(prompt),
+                                     chars_out=0, retries=attempt, ok=False, cached=False,
+                                     error=f"{_status_code(e) or type(e).__name__}: {e}"[:200])
+            return None
+    latency = time.monotonic() - sent
+    usage = getattr(resp, "usage", None)
+    if limiter:
+        limiter.settle(estimated, getattr(usage, "total_tokens", None))
+    out = _strip_fences(resp.choices[0].message.content or "")
+    translate_metrics.record("call", backend="groq", model=model, label=label, **tags,
+                             latency_s=round(latency, 4), total_s=round(time.monotonic() - started, 4),
+                             prompt_tokens=getattr(usage, "prompt_tokens", None),
+                             completion_tokens=getattr(usage, "completion_tokens", None),
+                             chars_in=len(prompt), chars_out=len(out), retries=attempt, ok=True, cached=False)
+    if cache is not None and out and (accept is None or accept(out)):
+        cache.put("groq", model, prompt, out, GROQ_TEMPERATURE)
+    return out
+
+
+def _json_accept(check):
+    """accept= callback for groq_complete: the reply parses and `check(obj)` finds no problems."""
+    def accept(out):
+        try:
+            return not check(json.loads(out))
+        except json.JSONDecodeError:
+            return False
+    return accept
+
+
+def translate_chapter_with_groq(chapter, tgt_name, model=None, client=None, limiter=None, retry=None):
+    """Send one full chapter to Groq; return the translated chapter as a dict (None on failure)."""
+    client = client or make_groq_client()
     model = model or "llama-3.3-70b-versatile"
     chapter_str = json.dumps(chapter, ensure_ascii=False, indent=2)
     prompt = _groq_full_chapter_prompt(chapter_str, tgt_name, tgt_name)
+    label = f"chapter id={chapter.get('id')}"
+    tags = {"language": tgt_name, "chapter": chapter.get("id"), "mode": "chapter"}
+    out = groq_complete(client, prompt, model, label, limiter=limiter, retry=retry, expected_output=chapter_str,
+                        accept=_json_accept(lambda tr: check_shape(chapter, tr)), tags=tags)
+    if out is None:
+        return None
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-        )
-        out = resp.choices[0].message.content.strip()
-        if out.startswith("```"):
-            out = re.sub(r"^```(?:json)?\s*", "", out)
-            out = re.sub(r"\s*```\s*$", "", out)
-        return json.loads(out)
+        translated = json.loads(out)
     except json.JSONDecodeError as e:
-        print(f"Groq returned invalid JSON for chapter id={chapter.get('id')}: {e}")
+        print(f"Groq returned invalid JSON for {label}: {e}")
+        translate_metrics.record("validation", label=label, reason="json", detail=str(e), **tags)
+        return None
+    problems = check_shape(chapter, translated)
+    if problems:
+        print(f"Groq changed the structure of {label}: {'; '.join(problems[:3])}")
+        translate_metrics.record("validation", label=label, reason="shape", detail="; ".join(problems[:3]), **tags)
+        return None
+    return translated
+
+
+def translate_chapter_compact(chapter, tgt_name, model=None, client=None, limiter=None, retry=None, savings=None,
+                              aligned=None):
+    """Send only the native/transliteration strings of a chapter (compact_wire.py) and merge locally.
+
+    Appends (tokens before, tokens after) estimates to `savings` when given. Rows whose English
+    cell `aligned(english) -> (native, roman)` already knows are filled without asking.
+    """
+    client = client or make_groq_client()
+    model = model or "llama-3.3-70b-versatile"
+    label = f"chapter id={chapter.get('id')}"
+    items, slots = compact_chapter(chapter)
+    known_slots, known = [], []
+    if aligned is not None:
+        items, slots, known_slots, known = split_known(chapter, items, slots, aligned)
+        if known:
+            print(f"  {label}: {len(known)} row(s) from the parallel corpus")
+    full = json.dumps(chapter, ensure_ascii=False, indent=2)
+    wire = encode_items(items)
+    before = estimate_tokens(_groq_full_chapter_prompt(full, tgt_name, tgt_name)) + estimate_tokens(full)
+    prompt = _groq_compact_prompt(wire, tgt_name)
+    after = estimate_tokens(prompt) + estimate_tokens(wire)
+    if savings is not None:
+        savings.append((before, after))
+    print(f"  {label}: {len(items)} items, ~{before} → ~{after} tokens ({100 * (before - after) / before:.0f}% saved)")
+    if not items:
+        return expand_chapter(chapter, known_slots, known, tgt_name)
+    tags = {"language": tgt_name, "chapter": chapter.get("id"), "mode": "compact"}
+    out = groq_complete(client, prompt, model, label, limiter=limiter, retry=retry, expected_output=wire,
+                        accept=lambda reply: decode_answers(reply, items) is not None, tags=tags)
+    if out is None:
+        return None
+    answers = decode_answers(out, items)
+    if answers is None:
+        print(f"Groq reply for {label} does not match the {len(items)} items sent")
+        translate_metrics.record("validation", label=label, reason="items", **tags)
+        return None
+    return expand_chapter(chapter, slots + known_slots, answers + known, tgt_name)
+
+
+def translate_chapter_by_units(chapter, tgt_name, model=None, client=None, limiter=None, retry=None,
+                               max_rows=UNIT_MAX_ROWS, workers=4, attempts=UNIT_ATTEMPTS):
+    """Translate a chapter block by block (long tables in row slices), units in parallel.
+
+    Each unit is checked against its source (keys, headers, row and column counts); a unit
+    that fails is retried on its own up to `attempts` times. Returns None if any unit
+    still fails, so the chapter falls back like a failed full-chapter request.
+    """
+    client = client or make_groq_client()
+    model = model or "llama-3.3-70b-versatile"
+    units = split_chapter(chapter, max_rows=max_rows)
+    tags = {"language": tgt_name, "chapter": chapter.get("id"), "mode": "units"}
+
+    def work(unit):
+        label = unit.label(chapter.get("id"))
+        payload = json.dumps(unit.payload, ensure_ascii=False, indent=1)
+        prompt = _groq_full_chapter_prompt(payload, tgt_name, tgt_name, fragment=True)
+        for attempt in range(1, attempts + 1):
+            out = groq_complete(client, prompt, model, label, limiter=limiter, retry=retry, expected_output=payload,
+                                accept=_json_accept(lambda tr: check_unit(unit.payload, tr, label)), tags=tags)
+            if out is None:
+                return None
+            try:
+                translated = json.loads(out)
+            except json.JSONDecodeError as e:
+                problems, reason = [f"invalid JSON ({e})"], "json"
+            else:
+                problems, reason = check_unit(unit.payload, translated, label), "shape"
+                if not problems:
+                    return translated
+            print(f"  {label}: attempt {attempt}/{attempts} rejected: {'; '.join(problems[:3])}")
+            translate_metrics.record("validation", label=label, reason=reason, attempt=attempt,
+                                     detail="; ".join(problems[:3]), **tags)
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(units)))) as pool:
+        results = list(pool.map(work, units))
+    if any(r is None for r in results):
+        return None
+    return reassemble(chapter, units, results)
+
+
+def translate_chapters(data, tgt_name, model=None, client=None, concurrency=1, limiter=None, retry=None,
+                       on_result=None, prefix="", chapter_fn=None):
+    """Translate chapters with up to `concurrency` requests in flight.
+
+    Returns one result per input chapter, in input order (None where translation failed).
+    `on_result(i, out)` is called as each chapter finishes (e.g. to checkpoint it).
+    `prefix` is prepended to progress lines (translate_all.py runs several languages at once).
+    `chapter_fn` replaces translate_chapter_with_groq (e.g. translate_chapter_by_units).
+    """
+    client = client or make_groq_client()
+    chapter_fn = chapter_fn or translate_chapter_with_groq
+    results = [None] * len(data)
+    done = 0
+
+    def work(i):
+        start = time.monotonic()
+        out = chapter_fn(data[i], tgt_name, model=model, client=client, limiter=limiter, retry=retry)
+        elapsed = time.monotonic() - start
+        translate_metrics.record("chapter", language=tgt_name, chapter=data[i].get("id"),
+                                 latency_s=round(elapsed, 4), ok=out is not None)
+        return i, out, elapsed
+
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = [pool.submit(work, i) for i in range(len(data))]
+        for fut in as_completed(futures):
+            i, out, elapsed = fut.result()
+            results[i] = out
+            done += 1
+            if on_result:
+                on_result(i, out)
+            status = "ok" if out is not None else "FAILED"
+            print(f"  {prefix}Chapter {done}/{len(data)} (id={data[i].get('id')}) {status} in {elapsed:.1f}s")
+    except KeyboardInterrupt:
+        # Drop queued chapters; only the ones already in flight finish.
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return results
+
+
+def _is_native(s):
+    return bool(DEVA.search(s)) and not s.startswith(("http://", "https://"))
+
+
+def _encode_indexed(batch):
+    return json.dumps({str(i): x for i, x in enumerate(batch)}, ensure_ascii=False)
+
+
+def _decode_indexed(text, n):
+    """Parse {"0": [text, roman], ...}; None unless every index comes back well-formed."""
+    try:
+        obj = json.loads(text)
+    except json.JSONDecodeError:
         return None
-    except Exception as e:
-        print(f"Groq error for chapter id={chapter.get('id')}: {e}")
+    if not isinstance(obj, dict) or set(obj) != {str(i) for i in range(n)}:
         return None
+    out = []
+    for i in range(n):
+        v = obj[str(i)]
+        if isinstance(v, str):
+            # No romanization given: keep the source transliteration cell.
+            v = [v, None]
+        if not (isinstance(v, list) and len(v) == 2 and isinstance(v[0], str)):
+            return None
+        out.append((v[0], v[1] if isinstance(v[1], str) and v[1] else None))
+    return out
+
+
+def apply_string_translations(obj, mapping, tgt_name):
+    """Scatter {source: (text, roman)} back into a chapter.
+
+    In tables, a translated native cell also replaces the transliteration cell right
+    after it (header containing "Translit"), and "Marathi" column labels are renamed.
+    """
+    if isinstance(obj, str):
+        return mapping[obj][0] if obj in mapping else obj
+    if isinstance(obj, list):
+        return [apply_string_translations(v, mapping, tgt_name) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    out = {k: v if k in ("id", "url") else apply_string_translations(v, mapping, tgt_name) for k, v in obj.items()}
+    headers = obj.get("headers")
+    if isinstance(headers, list) and isinstance(obj.get("rows"), list):
+        out["headers"] = [h.replace("Marathi", tgt_name) if isinstance(h, str) else h for h in out["headers"]]
+        rows = []
+        for row in obj["rows"]:
+            new = list(out["rows"][len(rows)])
+            for c, cell in enumerate(row):
+                if not (isinstance(cell, str) and cell in mapping):
+                    continue
+                roman = mapping[cell][1]
+                nxt = c + 1
+                if (roman and nxt < len(row) and nxt < len(headers) and isinstance(headers[nxt], str)
+                        and TRANSLIT_HEADER.search(headers[nxt]) and isinstance(row[nxt], str)
+                        and not _is_native(row[nxt])):
+                    new[nxt] = roman
+            rows.append(new)
+        out["rows"] = rows
+    return out
+
+
+def translate_strings_mode(data, tgt_name, model, client, concurrency=1, limiter=None, retry=None,
+                           batch_chars=STRING_BATCH_CHARS, batch_size=STRING_BATCH_ITEMS):
+    """String mode: translate each unique Marathi string once, in packed batches, then scatter back."""
+    counts = Counter()
+    for ch in data:
+        walk_collect({k: v for k, v in ch.items() if k not in ("id", "url")}, counts, _is_native)
+    stats = BatchStats(counts)
+    print(f"  String mode: {stats.unique} unique Marathi strings ({stats.occurrences} cells)")
+
+    def send(payload):
+        prompt = _groq_strings_prompt(payload, tgt_name)
+        n = len(json.loads(payload))
+        return groq_complete(client, prompt, model, f"string batch ({len(payload)} chars)",
+                             limiter=limiter, retry=retry, expected_output=payload + payload,
+                             accept=lambda reply: _decode_indexed(reply, n) is not None,
+                             tags={"language": tgt_name, "mode": "string"})
+
+    mapping = translate_unique(
+        sorted(counts), send, stats, encode=_encode_indexed, decode=_decode_indexed,
+        max_chars=batch_chars, max_items=batch_size, workers=concurrency,
+        progress=lambda i, n: print(f"  Batch {i + 1}/{n}") if i % 10 == 0 else None,
+    )
+    print(f"  {stats.report()}")
+    return [apply_string_translations(ch, mapping, tgt_name) for ch in data]
+
+
+def translate_language(data, target, model, client, output_path, concurrency=1, limiter=None, retry=None,
+                       journal_path=None, fresh=False, mode="chapter", batch_chars=STRING_BATCH_CHARS,
+                       batch_size=STRING_BATCH_ITEMS, unit_rows=UNIT_MAX_ROWS, unit_workers=4, prefix="",
+                       corpus=None):
+    """Translate `data` into one target language and write `output_path`.
+
+    Returns a run summary: chapters translated / reused from the journal / failed,
+    duration and bytes written. Raises KeyboardInterrupt after checkpointing. With a
+    ParallelCorpus, compact mode takes rows the target already has from it (never from
+    `output_path` itself, which may hold Marathi fallbacks of failed chapters).
+    """
+    tgt_name = LANG_DISPLAY_NAMES.get(target, target.title())
+    start = time.monotonic()
+    reused = 0
+
+    if mode == "string":
+        print(f"{prefix}Translating to {tgt_name} with Groq (string mode, concurrency={concurrency})...")
+        translated_data = translate_strings_mode(
+            data, tgt_name, model, client, concurrency=concurrency, limiter=limiter, retry=retry,
+            batch_chars=batch_chars, batch_size=batch_size,
+        )
+        failed_ids = []
+    else:
+        chapter_fn = None
+        savings = []
+        if mode == "units":
+            def chapter_fn(ch, tgt_name, **kw):
+                return translate_chapter_by_units(ch, tgt_name, max_rows=unit_rows, workers=unit_workers, **kw)
+        elif mode == "compact":
+            aligned = None
+            if corpus is not None:
+                aligned = aligned_pair_lookup(corpus, target, exclude={Path(output_path).name})
+
+            def chapter_fn(ch, tgt_name, **kw):
+                return translate_chapter_compact(ch, tgt_name, savings=savings, aligned=aligned, **kw)
+        label = {"units": "units", "compact": "compact"}.get(mode, "full chapter")
+        print(f"{prefix}Translating to {tgt_name} with Groq ({label} mode, concurrency={concurrency})...")
+        journal = ChapterJournal(journal_path or BASE / f".translate_journal_{target}.jsonl")
+        keys = [chapter_key(ch, target, model) for ch in data]
+        results = [None if fresh else journal.get(k) for k in keys]
+        pending = [i for i, out in enumerate(results) if out is None]
+        reused = len(data) - len(pending)
+        print(f"  {prefix}{reused} chapter(s) unchanged since last run (journal), {len(pending)} to translate")
+
+        def checkpoint(j, out):
+            i = pending[j]
+            results[i] = out
+            journal.record(keys[i], data[i].get("id"), out)
+
+        if pending:
+            try:
+                translate_chapters(
+                    [data[i] for i in pending], tgt_name, model=model, client=client,
+                    concurrency=concurrency, limiter=limiter, retry=retry, on_result=checkpoint, prefix=prefix,
+                    chapter_fn=chapter_fn,
+                )
+            except KeyboardInterrupt:
+                print(f"\n{prefix}Interrupted; finished chapters are saved in {journal.path}. Rerun to resume.")
+                raise
+            journal.compact()
+        if savings:
+            before, after = sum(b for b, _ in savings), sum(a for _, a in savings)
+            print(f"{prefix}Compact format: ~{before} → ~{after} tokens for {len(savings)} chapters "
+                  f"({100 * (before - after) / before:.0f}% saved)")
+        translated_data = [out if out is not None else ch for ch, out in zip(data, results)]
+        failed_ids = [ch.get("id") for ch, out in zip(data, results) if out is None]
+        if failed_ids:
+            print(f"{prefix}{len(failed_ids)} chapter(s) failed; kept Marathi original for those.")
+
+    raw = dumps(translated_data)
+    write_atomic(output_path, raw)
+    duration = time.monotonic() - start
+    print(f"{prefix}Saved to {output_path}")
+    return {
+        "language": target,
+        "mode": mode,
+        "chapters": len(data),
+        "translated": len(data) - reused - len(failed_ids),
+        "reused": reused,
+        "failed": len(failed_ids),
+        "failed_ids": failed_ids,
+        "duration_s": round(duration, 3),
+        "bytes": len(raw),
+        "output": str(output_path),
+    }
 
 
 def main():
@@ -106,35 +587,72 @@ def main():
     parser.add_argument("--input", "-i", default="data.json", help="Input data.json")
     parser.add_argument("--output", "-o", help="Output file (default: data_{target}.json)")
     parser.add_argument("--limit", "-n", type=int, help="Limit chapters (for testing)")
+    parser.add_argument("--concurrency", "-c", type=int, default=config.get("concurrency", 1),
+                        help="Chapters in flight at once (default: 1)")
+    parser.add_argument("--rpm", type=float, default=config.get("requests_per_minute"),
+                        help="Requests/min quota (default: unlimited)")
+    parser.add_argument("--tpm", type=float, default=config.get("tokens_per_minute"),
+                        help="Tokens/min quota (default: unlimited)")
+    parser.add_argument("--max-retries", type=int, default=config.get("max_retries", 5),
+                        help="Retries per chapter on 429/5xx (default: 5)")
+    parser.add_argument("--base-url", default=config.get("groq_base_url"),
+                        help="Override the Groq API base URL (e.g. a local stand-in server)")
+    parser.add_argument("--no-cache", action="store_true", default=not config.get("response_cache", True),
+                        help="Bypass the response cache (.response_cache.sqlite)")
+    parser.add_argument("--metrics", default=config.get("metrics_file", "translate_metrics.jsonl"),
+                        help="Per-call metrics log, JSON Lines (default: translate_metrics.jsonl; '' disables)")
+    parser.add_argument("--journal", help="Checkpoint journal (default: .translate_journal_{target}.jsonl)")
+    parser.add_argument("--fresh", action="store_true", help="Ignore journal entries and retranslate everything")
+    parser.add_argument("--mode", choices=["chapter", "units", "compact", "string"], default=config.get("mode", "chapter"),
+                        help="chapter: one request per chapter (default); units: per block / table-row slice, "
+                             "validated and retried per unit; compact: only native/translit cells per chapter; "
+                             "string: unique strings in batches")
+    parser.add_argument("--no-corpus", action="store_true",
+                        help="Compact mode: don't fill rows from existing lessons / phrasebooks (parallel_corpus.py)")
+    parser.add_argument("--unit-rows", type=int, default=UNIT_MAX_ROWS,
+                        help="Units mode: max table rows per unit (default: %(default)s)")
+    parser.add_argument("--unit-workers", type=int, default=4, help="Units mode: units in flight per chapter")
+    parser.add_argument("--batch-size", type=int, default=STRING_BATCH_ITEMS, help="String mode: max strings per request")
+    parser.add_argument("--batch-chars", type=int, default=STRING_BATCH_CHARS, help="String mode: max characters per request")
     args = parser.parse_args()
 
     target = args.target.lower()
-    tgt_name = LANG_DISPLAY_NAMES.get(target, target.title())
 
     input_path = BASE / args.input
     if not input_path.exists():
         print(f"Input not found: {input_path}")
         sys.exit(1)
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(input_path)
 
     if args.limit:
         data = data[: args.limit]
 
     groq_model = config.get("groq_model", "llama-3.3-70b-versatile")
-    print(f"Translating to {tgt_name} with Groq (full chapter mode)...")
-
-    translated_data = []
-    for i, ch in enumerate(data):
-        print(f"  Chapter {i + 1}/{len(data)} (id={ch.get('id')})...")
-        out = translate_chapter_with_groq(ch, tgt_name, model=groq_model)
-        translated_data.append(out if out is not None else ch)
-
     output_path = BASE / (args.output or f"data_{target}.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(translated_data, f, ensure_ascii=False, indent=2)
-    print(f"Saved to {output_path}")
+    response_cache.configure(enabled=not args.no_cache)
+    translate_metrics.configure(enabled=bool(args.metrics), path=BASE / args.metrics if args.metrics else None)
+    corpus = ParallelCorpus.open() if args.mode == "compact" and not args.no_corpus else None
+    try:
+        translate_language(
+            data, target, groq_model, make_groq_client(args.base_url), output_path,
+            concurrency=args.concurrency, limiter=RateLimiter(args.rpm, args.tpm),
+            retry=RetryPolicy(max_retries=args.max_retries),
+            journal_path=BASE / args.journal if args.journal else None, fresh=args.fresh,
+            mode=args.mode, batch_chars=args.batch_chars, batch_size=args.batch_size,
+            unit_rows=args.unit_rows, unit_workers=args.unit_workers, corpus=corpus,
+        )
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        if corpus is not None:
+            corpus.close()
+    cache = response_cache.get_default()
+    if cache is not None:
+        print(cache.report())
+        cache.close()
+    if args.metrics:
+        print(f"Metrics: {BASE / args.metrics} (python translate_metrics.py summary --run {translate_metrics.get_default().run})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Shared translation memory (SQLite, WAL) for all phrasebook builders.
+
+Replaces the per-language _<lang>_translate_cache.json files, which were rewritten in
+full every SAVE_EVERY entries. Entries are keyed by (source text, source lang, target
+lang, engine) and written with batched upserts, so nothing is rewritten and a kill
+loses at most the last unflushed batch.
+
+The JSON caches stay in the repo as the seed for fresh checkouts: builders call
+import_json_cache(), which imports a file once (tracked by size + mtime) without
+overwriting newer entries.
+
+Usage:
+  python translation_memory.py import          # import every known JSON cache
+  python translation_memory.py stats
+  python translation_memory.py export en kn google _kannada_translate_cache.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+BASE = Path(__file__).parent.resolve()
+DEFAULT_DB = BASE / "translation_memory.sqlite"
+
+# (cache file, source lang, target lang, engine) for the caches already in the repo.
+KNOWN_JSON_CACHES = [
+    ("_bengali_translate_cache.json", "en", "bn", "google"),
+    ("_gujarati_translate_cache.json", "en", "gu", "google"),
+    ("_kannada_translate_cache.json", "en", "kn", "google"),
+    ("_malayalam_translate_cache.json", "en", "ml", "google"),
+    ("_marathi_translate_cache.json", "en", "mr", "google"),
+    ("_tamil_translate_cache.json", "en", "ta", "google"),
+    ("_telugu_translate_cache.json", "en", "te", "google"),
+    ("_urdu_translate_cache.json", "en", "ur", "google"),
+    ("meitei_translate_cache.json", "en", "mni-Mtei", "google"),
+]
+
+MEITEI_TM_KEY = ("en", "mni-Mtei", "google")
+
+# SQLite's default limit on host parameters per statement is 999.
+QUERY_CHUNK = 500
+
+TMEntry = namedtuple("TMEntry", ["target", "roman", "back"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tm (
+    source   TEXT NOT NULL,
+    src_lang TEXT NOT NULL,
+    tgt_lang TEXT NOT NULL,
+    engine   TEXT NOT NULL,
+    target   TEXT NOT NULL,
+    roman    TEXT,
+    back     TEXT,
+    updated  REAL NOT NULL,
+    PRIMARY KEY (source, src_lang, tgt_lang, engine)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imports (
+    path  TEXT PRIMARY KEY,
+    stamp TEXT NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO tm (source, src_lang, tgt_lang, engine, target, roman, back, updated)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source, src_lang, tgt_lang, engine)
+DO UPDATE SET target = excluded.target, roman = excluded.roman, back = excluded.back, updated = excluded.updated
+"""
+
+INSERT_IGNORE = """
+INSERT OR IGNORE INTO tm (source, src_lang, tgt_lang, engine, target, roman, back, updated)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class TranslationMemory:
+    """Thread-safe handle on the shared store. put() buffers; flush()/close() commit."""
+
+    def __init__(self, path=DEFAULT_DB, batch_size: int = 200):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: list[tuple] = []
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, source: str, src_lang: str, tgt_lang: str, engine: str):
+        return self.get_many([source], src_lang, tgt_lang, engine).get(source)
+
+    def get_many(self, sources, src_lang: str, tgt_lang: str, engine: str) -> dict[str, TMEntry]:
+        """{source: TMEntry} for every source that has an entry (unflushed puts included)."""
+        self.flush()
+        sources = list(dict.fromkeys(sources))
+        out: dict[str, TMEntry] = {}
+        with self._lock:
+            for i in range(0, len(sources), QUERY_CHUNK):
+                chunk = sources[i:i + QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT source, target, roman, back FROM tm WHERE src_lang = ? AND tgt_lang = ? AND engine = ? "
+                    f"AND source IN ({','.join('?' * len(chunk))})",
+                    (src_lang, tgt_lang, engine, *chunk),
+                )
+                for source, target, roman, back in rows:
+                    out[source] = TMEntry(target, roman, back)
+        return out
+
+    def get_all(self, src_lang: str, tgt_lang: str, engine: str) -> dict[str, TMEntry]:
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, target, roman, back FROM tm WHERE src_lang = ? AND tgt_lang = ? AND engine = ?",
+                (src_lang, tgt_lang, engine),
+            ).fetchall()
+        return {source: TMEntry(target, roman, back) for source, target, roman, back in rows}
+
+    def put(self, source: str, target: str, roman: str | None, src_lang: str, tgt_lang: str, engine: str,
+            back: str | None = None):
+        """Buffer one entry; written with the next batch."""
+        with self._lock:
+            self._pending.append((source, src_lang, tgt_lang, engine, target, roman, back, time.time()))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def put_many(self, entries, src_lang: str, tgt_lang: str, engine: str):
+        """Upsert (source, target, roman[, back]) tuples in one transaction."""
+        now = time.time()
+        rows = [
+            (e[0], src_lang, tgt_lang, engine, e[1], e[2], e[3] if len(e) > 3 else None, now)
+            for e in entries
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+
+    def flush(self):
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if rows:
+                with self._conn:
+                    self._conn.executemany(UPSERT, rows)
+
+    def delete_identity(self, src_lang: str, tgt_lang: str, engine: str) -> int:
+        """Drop entries whose target is just the source (translation never happened)."""
+        self.flush()
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM tm WHERE src_lang = ? AND tgt_lang = ? AND engine = ? AND target = source",
+                (src_lang, tgt_lang, engine),
+            )
+        return cur.rowcount
+
+    def import_json_cache(self, path, src_lang: str, tgt_lang: str, engine: str, force: bool = False) -> int:
+        """Import a legacy JSON cache once; existing entries win. Returns rows inserted.
+
+        Accepts {en: [native, roman]} (build_*_from_hindi.py) and
+        {en: {"mayek": ..., "gloss": ...}} (meitei_translate_cache.json).
+        """
+        path = Path(path)
+        if not path.is_file():
+            return 0
+        st = path.stat()
+        stamp = f"{st.st_size}:{st.st_mtime_ns}"
+        key = str(path.resolve())
+        with self._lock:
+            row = self._conn.execute("SELECT stamp FROM imports WHERE path = ?", (key,)).fetchone()
+        if row and row[0] == stamp and not force:
+            return 0
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        now = time.time()
+        rows = []
+        for source, value in data.items():
+            if isinstance(value, dict):
+                target, roman, back = value.get("mayek") or "", None, value.get("gloss")
+            elif isinstance(value, list) and value:
+                target, roman, back = value[0], value[1] if len(value) > 1 else None, None
+            else:
+                continue
+            if target:
+                rows.append((source, src_lang, tgt_lang, engine, target, roman, back, now))
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(INSERT_IGNORE, rows)
+            inserted = self._conn.total_changes - before
+            self._conn.execute("INSERT OR REPLACE INTO imports (path, stamp) VALUES (?, ?)", (key, stamp))
+        return inserted
+
+    def export_json_cache(self, path, src_lang: str, tgt_lang: str, engine: str) -> int:
+        """Write {source: [target, roman]} (the legacy cache format), sorted, via temp file + rename."""
+        entries = self.get_all(src_lang, tgt_lang, engine)
+        data = {k: [v.target, v.roman or ""] for k, v in sorted(entries.items())}
+        tmp = Path(str(path) + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=0)
+        os.replace(tmp, path)
+        return len(data)
+
+    def stats(self):
+        self.flush()
+        with self._lock:
+            return self._conn.execute(
+                "SELECT src_lang, tgt_lang, engine, COUNT(*) FROM tm GROUP BY 1, 2, 3 ORDER BY 1, 2, 3"
+            ).fetchall()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+def load_meitei_cache(tm: TranslationMemory | None = None) -> dict[str, dict]:
+    """English → {"mayek", "gloss"}: the shape meitei_translate_cache.json always had."""
+    own = tm is None
+    tm = tm or TranslationMemory()
+    try:
+        tm.import_json_cache(BASE / "meitei_translate_cache.json", *MEITEI_TM_KEY)
+        return {en: {"mayek": e.target, "gloss": e.back} for en, e in tm.get_all(*MEITEI_TM_KEY).items()}
+    finally:
+        if own:
+            tm.close()
+
+
+def import_known_caches(tm: TranslationMemory, force: bool = False) -> int:
+    total = 0
+    for name, src, tgt, engine in KNOWN_JSON_CACHES:
+        n = tm.import_json_cache(BASE / name, src, tgt, engine, force=force)
+        if n:
+            print(f"  {name}: {n} entries imported ({src}→{tgt}, {engine})")
+        total += n
+    return total
+
+
+def main():
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    with TranslationMemory() as tm:
+        if cmd == "import":
+            print("imported", import_known_caches(tm, force="--force" in sys.argv), "entries into", tm.path)
+        elif cmd == "stats":
+            for src, tgt, engine, n in tm.stats():
+                print(f"{src}→{tgt} [{engine}]: {n}")
+        elif cmd == "export" and len(sys.argv) == 6:
+            _, _, src, tgt, engine, out = sys.argv
+            print("exported", tm.export_json_cache(out, src, tgt, engine), "entries to", out)
+        else:
+            print(__doc__)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,87 +1,13 @@
 #!/usr/bin/env python3
-import json
 from pathlib import Path
 
+from translation_memory import load_meitei_cache
+from bb_io import load_lessons, save_lessons
+from meitei_translit import transliterate
 
 BASE = Path(__file__).parent.resolve()
 
 
-INDEPENDENT = {
-    "ꯑ": "a",
-    "ꯏ": "i",
-    "ꯎ": "u",
-}
-
-CONSONANTS = {
-    "ꯀ": "k",
-    "ꯁ": "s",
-    "ꯂ": "l",
-    "ꯃ": "m",
-    "ꯄ": "p",
-    "ꯅ": "n",
-    "ꯆ": "ch",
-    "ꯇ": "t",
-    "ꯈ": "kh",
-    "ꯉ": "ng",
-    "ꯊ": "th",
-    "ꯋ": "w",
-    "ꯌ": "y",
-    "ꯍ": "h",
-    "ꯐ": "ph",
-    "ꯒ": "g",
-    "ꯓ": "jh",
-    "ꯔ": "r",
-    "ꯕ": "b",
-    "ꯖ": "j",
-    "ꯗ": "d",
-    "ꯘ": "gh",
-    "ꯙ": "dh",
-    "ꯚ": "bh",
-}
-
-LONSUM = {
-    "ꯛ": "k",
-    "ꯜ": "l",
-    "ꯝ": "m",
-    "ꯞ": "p",
-    "ꯟ": "n",
-    "ꯠ": "t",
-    "ꯡ": "ng",
-    "ꯢ": "i",
-}
-
-VOWEL_SIGNS = {
-    "ꯥ": "aa",
-    "ꯤ": "i",
-    "ꯨ": "u",
-    "ꯦ": "e",
-    "ꯣ": "o",
-    "ꯧ": "ou",
-    "ꯩ": "ei",
-    "ꯪ": "ng",
-}
-
-DIGITS = {
-    "꯰": "0",
-    "꯱": "1",
-    "꯲": "2",
-    "꯳": "3",
-    "꯴": "4",
-    "꯵": "5",
-    "꯶": "6",
-    "꯷": "7",
-    "꯸": "8",
-    "꯹": "9",
-}
-
-PUNCT = {
-    "꯫": ".",
-    "꯬": "!",
-}
-
-APUN = "꯭"
-
-
 GENERAL_PACK = [
     "Welcome",
     "Thank you",
@@ -188,57 +114,6 @@ TIME_PACK = [
 ]
 
 
-def transliterate_meitei(text):
-    out = []
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch in DIGITS:
-            out.append(DIGITS[ch])
-        elif ch in PUNCT:
-            out.append(PUNCT[ch])
-        elif ch.isspace():
-            out.append(ch)
-        elif ch in INDEPENDENT:
-            if i + 1 < len(text) and text[i + 1] in VOWEL_SIGNS:
-                sign = text[i + 1]
-                if ch == "ꯑ":
-                    base = "ang" if sign == "ꯪ" else VOWEL_SIGNS[sign]
-                else:
-                    base = INDEPENDENT[ch] + ("ng" if sign == "ꯪ" else VOWEL_SIGNS[sign])
-                out.append(base)
-                i += 1
-            else:
-                out.append(INDEPENDENT[ch])
-        elif ch in CONSONANTS:
-            base = CONSONANTS[ch]
-            if i + 1 < len(text) and text[i + 1] == APUN:
-                out.append(base)
-                i += 1
-            elif i + 1 < len(text) and text[i + 1] in VOWEL_SIGNS:
-                sign = text[i + 1]
-                out.append(base + ("ang" if sign == "ꯪ" else VOWEL_SIGNS[sign]))
-                i += 1
-            else:
-                out.append(base + "a")
-        elif ch in VOWEL_SIGNS:
-            out.append("ang" if ch == "ꯪ" else VOWEL_SIGNS[ch])
-        elif ch in LONSUM:
-            out.append(LONSUM[ch])
-        elif ch == APUN:
-            pass
-        else:
-            out.append(ch)
-        i += 1
-
-    roman = "".join(out)
-    roman = roman.replace("  ", " ")
-    roman = roman.replace(" .", ".")
-    roman = roman.replace(" !", "!")
-    roman = roman.replace(" ?", "?")
-    return roman.strip()
-
-
 def get_pack(title):
     t = title.lower()
     if any(k in t for k in ["doctor", "police", "emergency", "fire", "lost", "lawyer"]):
@@ -259,15 +134,14 @@ def build_rows(cache, pack):
         if not item:
             continue
         meitei = item["mayek"]
-        rows.append([english, meitei, transliterate_meitei(meitei)])
+        rows.append([english, meitei, transliterate(meitei)])
     return rows
 
 
 def main():
     path = BASE / "data_meitei.json"
-    cache_path = BASE / "meitei_translate_cache.json"
-    data = json.loads(path.read_text(encoding="utf-8"))
-    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    data = load_lessons(path)
+    cache = load_meitei_cache()
 
     for chapter in data:
         pack = get_pack(chapter["title"])
@@ -299,7 +173,7 @@ def main():
         else:
             chapter["blocks"] = [practice_table]
 
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    save_lessons(path, data)
     print("Added practice tables to", len(data), "Meitei chapters")
 
 
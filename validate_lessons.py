@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Schema check and lint for the lesson data files (every LANGUAGES dataFile in app.js).
+
+Errors (exit status 1):
+  duplicate-id        two chapters share an id
+  missing-chapter     lessons_structure_*.json lists a chapter id the data file doesn't have
+  bad-chapter         chapter isn't an object with an integer id
+  bad-block           blocks / tables isn't a list of objects
+  bad-row             a row isn't a list of strings
+  row-width           a row has a different number of cells than the headers / columns
+  speak-col           speakCol is outside the header range
+
+Warnings (exit status 1 only with --strict):
+  orphan-chapter      chapter id isn't in the structure file (unreachable from the Lessons tab)
+  speak-translit      speakCol points at a transliteration column
+  mixed-script        the native column has letters from another Indic / non-Latin script
+  no-native-text      the native column has no letters of the language's script
+  empty-translit      the transliteration cell is empty for a non-empty native cell
+
+The native column is speakCol, or else the column headed with the language name. Latin
+letters are allowed there (glosses, loanwords). Files are checked in parallel and each
+file's diagnostics are printed as soon as it is done; --json prints one object per line
+({file, chapter, level, code, message, block?, row?}) with the summary on stderr.
+
+Usage:
+  python validate_lessons.py                  # every data file in app.js
+  python validate_lessons.py odia data_urdu.json
+  python validate_lessons.py --json > diagnostics.jsonl
+  python validate_lessons.py --strict         # warnings fail too
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from bb_io import load_lessons, load_structure
+
+BASE = Path(__file__).parent.resolve()
+APP_JS = BASE / "app.js"
+
+LANG_FILES_PAT = re.compile(r'dataFile:\s*"([^"]+\.json)",\s*structureFile:\s*"([^"]+\.json)"')
+
+DEVANAGARI = "ऀ-ॿ꣠-ꣿ᳐-᳿"
+ARABIC = "؀-ۿݐ-ݿࢠ-ࣿﭐ-﷿ﹰ-﻿"
+BENGALI = "ঀ-৿"
+SCRIPTS = {
+    "marathi": DEVANAGARI, "hindi": DEVANAGARI, "maithili": DEVANAGARI, "nepali": DEVANAGARI,
+    "sanskrit": DEVANAGARI, "bodo": DEVANAGARI, "dogri": DEVANAGARI, "konkani": DEVANAGARI,
+    "gujarati": "઀-૿", "punjabi": "਀-੿", "kannada": "ಀ-೿",
+    "tamil": "஀-௿", "telugu": "ఀ-౿", "malayalam": "ഀ-ൿ",
+    "odia": "଀-୿", "bengali": BENGALI, "assamese": BENGALI,
+    "meitei": "ꯀ-꯿ꫠ-꫿", "santali": "᱐-᱿",
+    "sindhi": ARABIC, "urdu": ARABIC, "kashmiri": ARABIC + DEVANAGARI,
+}
+# Header names of the native column when they differ from the language key.
+COLUMN_NAMES = {"meitei": ("manipuri", "meitei")}
+LATIN = "A-Za-zÀ-ɏɐ-ʯḀ-ỿ"
+
+Diagnostic = namedtuple("Diagnostic", ["file", "chapter", "level", "code", "message", "block", "row"],
+                        defaults=(None, None))
+
+
+def language_of(data_file: str) -> str:
+    stem = Path(data_file).stem
+    return "marathi" if stem == "data" else stem[len("data_"):]
+
+
+def app_lesson_files(app_js: Path = APP_JS) -> list[tuple[str, str]]:
+    """(dataFile, structureFile) pairs of LANGUAGES in app.js, in order."""
+    return list(dict.fromkeys(LANG_FILES_PAT.findall(app_js.read_text(encoding="utf-8"))))
+
+
+def structure_ids(path: Path) -> list[int]:
+    structure = load_structure(path)
+    return [sub["chapterId"] for major in structure["majorLessons"] for sub in major["sublessons"]]
+
+
+def _is_translit(header: str) -> bool:
+    h = header.lower()
+    return "translit" in h or h == "pronunciation"
+
+
+class ScriptCheck:
+    """Regexes for one language's native column."""
+
+    def __init__(self, language: str):
+        native = SCRIPTS[language]
+        self.names = COLUMN_NAMES.get(language, (language,))
+        self.native = re.compile(f"[{native}]")
+        self.foreign = re.compile(rf"[^\W\d_{LATIN}{native}]")
+
+    def native_column(self, headers: list, speak_col) -> int | None:
+        if isinstance(speak_col, int) and 0 <= speak_col < len(headers) and not _is_translit(headers[speak_col]):
+            return speak_col
+        for i, header in enumerate(headers):
+            if isinstance(header, str) and header.lower().startswith(self.names):
+                return i
+        return None
+
+
+def check_chapters(chapters, file: str = "", language: str | None = None,
+                   expected_ids: list[int] | None = None):
+    """Yield Diagnostics for parsed lesson data. Structure and script checks need
+    `expected_ids` / `language`; without them only the shape is checked."""
+    if not isinstance(chapters, list):
+        yield Diagnostic(file, None, "error", "bad-chapter", "top level is not a list of chapters")
+        return
+    script = ScriptCheck(language) if language in SCRIPTS else None
+    expected = set(expected_ids) if expected_ids is not None else None
+    seen = set()
+    for i, ch in enumerate(chapters):
+        cid = ch.get("id") if isinstance(ch, dict) else None
+        if not isinstance(cid, int):
+            yield Diagnostic(file, None, "error", "bad-chapter", f"chapter #{i} has no integer id")
+            continue
+        if cid in seen:
+            yield Diagnostic(file, cid, "error", "duplicate-id", f"id {cid} appears more than once")
+        seen.add(cid)
+        if expected is not None and cid not in expected:
+            yield Diagnostic(file, cid, "warning", "orphan-chapter", "not in the structure file")
+        for key in ("blocks", "tables"):
+            blocks = ch.get(key)
+            if blocks is None:
+                continue
+            if not isinstance(blocks, list) or not all(isinstance(b, dict) for b in blocks):
+                yield Diagnostic(file, cid, "error", "bad-block", f"{key} must be a list of objects")
+                continue
+            for b, block in enumerate(blocks):
+                if "rows" in block:
+                    yield from _check_table(file, cid, f"{key}[{b}]", block, script)
+    if expected is not None:
+        for cid in expected_ids:
+            if cid not in seen:
+                yield Diagnostic(file, cid, "error", "missing-chapter", "listed in the structure file but has no data")
+
+
+def _check_table(file: str, cid: int, where: str, block: dict, script: ScriptCheck | None):
+    headers = block.get("headers") or block.get("columns") or []
+    width = len(headers)
+    speak_col = block.get("speakCol")
+    if speak_col is not None:
+        if not isinstance(speak_col, int) or not 0 <= speak_col < max(width, 1):
+            yield Diagnostic(file, cid, "error", "speak-col", f"speakCol {speak_col!r} with {width} column(s)", where)
+        elif width and _is_translit(headers[speak_col]):
+            yield Diagnostic(file, cid, "warning", "speak-translit",
+                             f"speakCol {speak_col} is the {headers[speak_col]!r} column", where)
+    native = script.native_column(headers, speak_col) if script else None
+    translit = [i for i, h in enumerate(headers) if isinstance(h, str) and _is_translit(h)]
+
+    rows = block["rows"]
+    if not isinstance(rows, list):
+        yield Diagnostic(file, cid, "error", "bad-row", "rows is not a list", where)
+        return
+    for r, row in enumerate(rows):
+        if not isinstance(row, list) or not all(isinstance(x, str) for x in row):
+            yield Diagnostic(file, cid, "error", "bad-row", "row is not a list of strings", where, r)
+            continue
+        if width and len(row) != width:
+            yield Diagnostic(file, cid, "error", "row-width", f"{len(row)} cell(s), {width} header(s)", where, r)
+            continue
+        if native is None or native >= len(row):
+            continue
+        cell = row[native]
+        if not cell.strip():
+            continue
+        m = next((m for m in script.foreign.finditer(cell) if m.group().isalpha()), None)  # not ½ etc.
+        if m:
+            yield Diagnostic(file, cid, "warning", "mixed-script",
+                             f"U+{ord(m.group()):04X} {m.group()!r} in {cell!r}", where, r)
+        elif not script.native.search(cell):
+            yield Diagnostic(file, cid, "warning", "no-native-text", f"{cell!r}", where, r)
+        for i in translit:
+            if i < len(row) and not row[i].strip():
+                yield Diagnostic(file, cid, "warning", "empty-translit", f"no transliteration for {cell!r}", where, r)
+
+
+def check_file(data_file: str, structure_file: str | None = None, base: Path = BASE) -> list[Diagnostic]:
+    """All diagnostics for one data file (runs in a worker process)."""
+    path = base / data_file
+    try:
+        chapters = load_lessons(path)
+    except (OSError, ValueError) as e:
+        return [Diagnostic(data_file, None, "error", "unreadable", str(e))]
+    expected = None
+    if structure_file:
+        try:
+            expected = structure_ids(base / structure_file)
+        except (OSError, ValueError, KeyError) as e:
+            return [Diagnostic(data_file, None, "error", "unreadable", f"{structure_file}: {e}")]
+    return list(check_chapters(chapters, data_file, language_of(data_file), expected))
+
+
+def format_diagnostic(d: Diagnostic) -> str:
+    where = "".join(f" {x}" for x in (d.block, None if d.row is None else f"row {d.row}") if x is not None)
+    chapter = f":{d.chapter}" if d.chapter is not None else ""
+    return f"{d.file}{chapter}{where}: {d.level} {d.code}: {d.message}"
+
+
+def validate(pairs: list[tuple[str, str | None]], jobs: int | None = None, on_file=None) -> Counter:
+    """Check files in parallel; calls on_file(data_file, diagnostics) as each finishes.
+    Returns counts per level."""
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=jobs or min(len(pairs), 8) or 1) as pool:
+        futures = {pool.submit(check_file, d, s): d for d, s in pairs}
+        for future in as_completed(futures):
+            diagnostics = future.result()
+            counts.update(d.level for d in diagnostics)
+            if on_file:
+                on_file(futures[future], diagnostics)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and lint lesson data files")
+    parser.add_argument("targets", nargs="*", help="Languages or data files (default: every dataFile in app.js)")
+    parser.add_argument("--json", action="store_true", help="One JSON object per diagnostic on stdout")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 on warnings too")
+    parser.add_argument("--errors-only", action="store_true", help="Don't print warnings (still counted)")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pairs = app_lesson_files()
+    if args.targets:
+        by_name = {d: (d, s) for d, s in pairs} | {language_of(d): (d, s) for d, s in pairs}
+        unknown = [t for t in args.targets if t not in by_name and not (BASE / t).exists()]
+        if unknown:
+            parser.error(f"unknown language or file: {', '.join(unknown)}")
+        pairs = [by_name.get(t, (t, None)) for t in args.targets]
+
+    def on_file(data_file, diagnostics):
+        for d in diagnostics:
+            if args.errors_only and d.level != "error":
+                continue
+            if args.json:
+                print(json.dumps({k: v for k, v in d._asdict().items() if v is not None}, ensure_ascii=False))
+            else:
+                print(format_diagnostic(d))
+        sys.stdout.flush()
+
+    counts = validate(pairs, args.jobs, on_file)
+    summary = (f"{len(pairs)} file(s): {counts['error']} error(s), {counts['warning']} warning(s) "
+               f"in {time.perf_counter() - start:.2f}s")
+    print(summary, file=sys.stderr if args.json else sys.stdout)
+    if counts["error"] or (args.strict and counts["warning"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()